@@ -7,7 +7,7 @@ from bokeh.io import output_notebook
 from ..utils import is_notebook
 from .correlation import compute_correlation, plot_correlation, render_correlation
 from .create_report import create_report
-from .distribution import compute, plot, render
+from .distribution import Profile, compute, compute_profile, plot, render
 from .dtypes import (
     Categorical,
     Continuous,
@@ -34,6 +34,8 @@ __all__ = [
     "plot",
     "compute",
     "render",
+    "compute_profile",
+    "Profile",
     "DType",
     "Categorical",
     "Nominal",
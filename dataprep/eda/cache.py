@@ -0,0 +1,182 @@
+"""
+This module implements the disk cache of the computed intermediates, see the cache
+section of Config. It is off by default.
+
+A computation is keyed by the fingerprint of its DataFrame, its other arguments and
+the parameters of the config that affect the computation. The fingerprint is the dask
+token of the DataFrame: a hash of the values for a pandas DataFrame, the graph name
+for a dask DataFrame. The render-only parameters, like the size of the plots, are not
+part of the key, nor are the enable flags of the sections given to cached_compute:
+the renderers check these flags, so an intermediate is reused by the calls that enable
+a subset of those sections.
+"""
+import os
+import pickle
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, TypeVar, cast
+
+import dask.dataframe as dd
+import pandas as pd
+from dask.base import normalize_token, tokenize
+
+from .. import __version__
+from .configs import DISPLAY_MAP, DISPLAY_REPORT_MAP, Config
+from .dtypes import DType
+
+__all__ = ["cached_compute", "clear_cache"]
+
+# The parameters of the config sections that only affect the rendering
+RENDER_PARAMS = {
+    "width",
+    "height",
+    "yscale",
+    "color",
+    "colors",
+    "hist_color",
+    "line_color",
+    "point_color",
+    "workers",
+    "lazy",
+}
+
+# The sections of the plots of plot, plot_missing and plot_correlation, whose enable
+# flags are checked by their renderers, and the sections of create_report, which the
+# plot functions do not use but display disables
+PLOT_SECTIONS = tuple(sorted(set(DISPLAY_MAP.values()) | set(DISPLAY_REPORT_MAP.values())))
+
+# The directory of the cache when cfg.cache.path is None
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "dataprep" / "eda"
+
+T = TypeVar("T")  # pylint: disable=invalid-name
+
+
+@normalize_token.register(DType)
+def _normalize_dtype(dtype: DType) -> Tuple[str, Dict[str, Any]]:
+    """
+    Tokenize a user specified dtype by its type and attributes
+    """
+    return type(dtype).__name__, vars(dtype)
+
+
+def cached_compute(
+    func: Callable[..., T],
+    df: Any,
+    *args: Any,
+    cfg: Config,
+    sections: Sequence[str] = (),
+    **kwargs: Any,
+) -> T:
+    """
+    Call func(df, *args, cfg=cfg, **kwargs). When cfg.cache.enable is set and df is a
+    pandas or dask DataFrame, the result is looked up in the cache first, and stored
+    in the cache after being computed.
+
+    Parameters
+    ----------
+    func
+        The compute function, e.g. compute_missing
+    df
+        The DataFrame passed to func
+    args
+        The other positional arguments of func
+    cfg
+        The config instance
+    sections
+        The config sections whose enable flags are checked by the renderer before
+        using their data, a result computed with more of them enabled is reused
+    kwargs
+        The other keyword arguments of func
+    """
+    if not cfg.cache.enable or not isinstance(df, (pd.DataFrame, dd.DataFrame)):
+        return func(df, *args, cfg=cfg, **kwargs)
+
+    params = _compute_params(cfg, sections)
+    key = tokenize(__version__, func.__module__, func.__qualname__, df, args, kwargs, params)
+    path = Path(cfg.cache.path).expanduser() if cfg.cache.path else DEFAULT_CACHE_PATH
+    path = path / f"{key}.pkl"
+    enabled = {name: getattr(cfg, name).enable for name in sections}
+
+    try:
+        with open(path, "rb") as file:
+            cached_enabled, cached = pickle.load(file)
+        if all(cached_enabled.get(name, False) for name, enable in enabled.items() if enable):
+            os.utime(path)  # the modification time orders the entries for the eviction
+            return cast(T, cached)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        pass  # a missing or unreadable entry, e.g. written by another version
+
+    result = func(df, *args, cfg=cfg, **kwargs)
+    _store(path, (enabled, result), cfg.cache.size)
+    return result
+
+
+def clear_cache(path: Optional[str] = None) -> None:
+    """
+    Remove all the intermediates in the cache
+
+    Parameters
+    ----------
+    path
+        The directory of the cache, None for the default one
+    """
+    _evict(Path(path).expanduser() if path else DEFAULT_CACHE_PATH, 0)
+
+
+def _compute_params(cfg: Config, sections: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    The parameters of the config that affect the computations, but the enable
+    flags of the sections
+    """
+    return {
+        name: {
+            param: val
+            for param, val in vars(section).items()
+            if param not in RENDER_PARAMS and not (param == "enable" and name in sections)
+        }
+        for name, section in vars(cfg).items()
+        if name != "cache"
+    }
+
+
+def _store(path: Path, entry: Any, size: int) -> None:
+    """
+    Write an entry of the cache and evict the least recently used entries beyond size.
+    Entries that cannot be pickled or that are larger than the cache are not stored.
+    """
+    try:
+        data = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return
+    if len(data) > size:
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # written aside and renamed, a concurrent reader never sees a partial entry
+    with NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as file:
+        file.write(data)
+    os.replace(file.name, path)
+    _evict(path.parent, size)
+
+
+def _evict(directory: Path, size: int) -> None:
+    """
+    Remove the least recently used entries of the cache until it fits in size bytes
+    """
+    entries = []
+    for entry in directory.glob("*.pkl"):
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:  # removed by another process
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry))
+
+    total = sum(nbytes for _, nbytes, _ in entries)
+    for _, nbytes, entry in sorted(entries):
+        if total <= size:
+            break
+        try:
+            entry.unlink()
+        except FileNotFoundError:
+            pass
+        total -= nbytes
@@ -61,6 +61,9 @@ DISPLAY_REPORT_MAP = {
     "Missing Values": "missingvalues",
 }
 
+# The sections of Config that are not plots and are kept when filtering by display
+GLOBAL_SECTIONS = {"plot", "diff", "quantile", "cache"}
+
 
 class Plot(BaseModel):
     """
@@ -87,9 +90,23 @@ class Stats(BaseModel):
     """
     enable: bool, default True
         Whether to display the stats section
+    duplicates: str, default "exact"
+        How the number of duplicate rows is counted. With "exact", the distinct
+        64-bit hashes of the rows are counted. With "approx", the distinct rows
+        are estimated by a HyperLogLog sketch in constant memory
+    mem_use: str, default "sample"
+        How the memory usage is measured. With "sample", the sizes of the Python
+        objects, e.g., strings, are measured on a sample of the rows of each partition
+        and the usage is shown with a 95% confidence bound. With "exact", every
+        object is measured
+    mem_use__sample: int, default 1000
+        The number of rows sampled from each partition to estimate the memory usage
     """
 
     enable: bool = True
+    duplicates: str = "exact"
+    mem_use: str = "sample"
+    mem_use__sample: int = 1000
 
 
 class Insight(BaseModel):
@@ -860,11 +877,18 @@ class Spearman(BaseModel):
         Height of the plot
     width: int, default "auto"
         Width of the plot
+    method: str, default "exact"
+        How the columns are ranked. With "exact", from the distinct values and their
+        counts, and each pair of columns is ranked over the rows where both are
+        present, as pandas does. With "approx", from a t-digest of each column in
+        constant memory, over all the values of the column, the digests use the
+        compression of the quantile config
     """
 
     enable: bool = True
     height: Union[int, None] = None
     width: Union[int, None] = None
+    method: str = "exact"
 
     def how_to_guide(self, height: int, width: int) -> List[Tuple[str, str]]:
         """
@@ -884,11 +908,15 @@ class KendallTau(BaseModel):
         Height of the plot
     width: int, default "auto"
         Width of the plot
+    sample: int, default None
+        If given, the correlations are computed on a stratified sample of this many
+        rows, and their 95% confidence intervals are reported
     """
 
     enable: bool = True
     height: Union[int, None] = None
     width: Union[int, None] = None
+    sample: Union[int, None] = None
 
     def how_to_guide(self, height: int, width: int) -> List[Tuple[str, str]]:
         """
@@ -1036,6 +1064,40 @@ class ValueTable(BaseModel):
         return [(f"'{name}': {_form(val)}", desc) for name, val, desc in zip(names, vals, descs)]
 
 
+class Quantile(BaseModel):
+    """
+    method: str, default "default"
+        How the quantiles of the box plots, the normal Q-Q plots and the stats are
+        computed. With "default", the quantiles of a column are merged from the
+        percentiles of its partitions and the quantiles of a group are exact. With
+        "tdigest", the quantiles are estimated from one t-digest per column or
+        per group in a single pass
+    compression: int, default 200
+        The compression of the t-digests, a higher compression gives more
+        accurate quantiles and uses more memory
+    """
+
+    method: str = "default"
+    compression: int = 200
+
+
+class Cache(BaseModel):
+    """
+    enable: bool, default False
+        Whether to keep the computed intermediates on disk and reuse them when the
+        same data is plotted again with the same computation parameters
+    path: str, optional, default None
+        The directory of the cache, None for ~/.cache/dataprep/eda
+    size: int, default 1073741824
+        The maximal size of the cache in bytes, the least recently used
+        intermediates are removed beyond it
+    """
+
+    enable: bool = False
+    path: Union[str, None] = None
+    size: int = 1 << 30
+
+
 def _form(val: Any) -> Any:
     """
     Format a value for the how-to guide
@@ -1057,9 +1119,18 @@ class Variables(BaseModel):
     """
     enable: bool, default True
         Whether to create this element
+    workers: int, optional, default 1
+        The number of processes rendering the figures of the variables, None for
+        the number of CPUs. With 1, the figures are rendered in this process. The
+        processes are forked, which is unsafe when this process runs other threads
+    lazy: bool, default False
+        Whether to store the figures of each variable as a separate JSON document in the
+        report, which the browser renders only when the variable is scrolled into view
     """
 
     enable: bool = True
+    workers: Union[int, None] = 1
+    lazy: bool = False
 
 
 class Interactions(BaseModel):
@@ -1120,6 +1191,8 @@ class Config(BaseModel):
     pdf: PDF = Field(default_factory=PDF)
     cdf: CDF = Field(default_factory=CDF)
     value_table: ValueTable = Field(default_factory=ValueTable)
+    quantile: Quantile = Field(default_factory=Quantile)
+    cache: Cache = Field(default_factory=Cache)
     plot: Plot = Field(default_factory=Plot)
     overview: Overview = Field(default_factory=Overview)
     variables: Variables = Field(default_factory=Variables)
@@ -1139,8 +1212,9 @@ class Config(BaseModel):
         if display:
             try:
                 display = [DISPLAY_MAP[disp] for disp in display]
-                # set all plots not in display list to enable=False except for Plot and Diff class
-                for plot in set(vars(cfg).keys()) - set(display) - {"plot"} - {"diff"}:
+                # set all plots not in display list to enable=False except for Plot, Diff,
+                # Quantile and Cache class
+                for plot in set(vars(cfg).keys()) - set(display) - GLOBAL_SECTIONS:
                     setattr(getattr(cfg, plot), "enable", False)
             except KeyError:
                 display = [DISPLAY_REPORT_MAP[disp] for disp in display]
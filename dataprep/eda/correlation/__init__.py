@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 import dask.dataframe as dd
 import pandas as pd
 
+from ..cache import PLOT_SECTIONS, cached_compute
 from ..configs import Config
 from ..container import Container
 from ...progress_bar import ProgressBar
@@ -76,7 +77,16 @@ def plot_correlation(
     cfg = Config.from_dict(display, config)
 
     with ProgressBar(minimum=1, disable=not progress):
-        itmdt = compute_correlation(df, x, y, cfg=cfg, value_range=value_range, k=k)
+        itmdt = cached_compute(
+            compute_correlation,
+            df,
+            x,
+            y,
+            cfg=cfg,
+            sections=PLOT_SECTIONS,
+            value_range=value_range,
+            k=k,
+        )
     to_render = render_correlation(itmdt, cfg)
 
     return Container(to_render, itmdt.visual_type, cfg)
@@ -1,13 +1,31 @@
 """Common components for compute correlation."""
 
+import heapq
 from enum import Enum, auto
+from functools import partial, reduce
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import dask
+import dask.array as da
+import dask.dataframe as dd
 import numpy as np
-from bottleneck import nanrankdata as nanrankdata_
-from bottleneck import rankdata as rankdata_
+import pandas as pd
+from dask.delayed import Delayed
 from scipy.stats import kendalltau as kendalltau_
 
+from ...distribution.compute.common import tree_reduce
+from ...distribution.compute.sketch import TDIGEST_COMPRESSION, TDigest
+
+# The number of pairs of columns correlated by one task of kendall_pairs
+KENDALL_PAIRS = 16
+
+# The z-score of the confidence intervals of the sampled Kendall tau, a 95% interval
+KENDALL_Z = 1.96
+
+# The number of columns of a block of the correlation matrix streamed by corr_topk
+TOPK_BLOCK = 256
+
 
 class CorrelationMethod(Enum):
     """Supported correlation methods"""
@@ -18,27 +36,796 @@ class CorrelationMethod(Enum):
     KendallTau = auto()
 
 
-@dask.delayed(name="rankdata-bottleneck", pure=True)  # pylint: disable=no-value-for-parameter
-def rankdata(data: np.ndarray, axis: int = 0) -> np.ndarray:
-    """delayed version of rankdata"""
-    return rankdata_(data, axis=axis)
+def pearson_nxn(data: Union[dd.DataFrame, da.Array]) -> Delayed:
+    """
+    The delayed pairwise-complete Pearson correlation matrix of the columns, the same as
+    pd.DataFrame.corr(method="pearson"). Each partition (or row block) is summarized
+    by the Gram-style statistics of its pairs of columns, the statistics are merged
+    by a tree reduction, so the data never leaves its partition.
+
+    Parameters
+    ----------
+    data
+        A DataFrame of numerical columns, or a 2d array whose columns are the variables
+    """
+    if isinstance(data, da.Array):
+        parts = data.rechunk({1: -1}).to_delayed().ravel().tolist()
+    else:
+        parts = data.to_delayed(optimize_graph=False)
+    return _pearson_blocks(parts)
+
+
+def spearman_nxn(
+    df: dd.DataFrame, method: str = "exact", compression: float = TDIGEST_COMPRESSION
+) -> Delayed:
+    """
+    The delayed Spearman correlation matrix of the columns, computed as the Pearson correlation
+    matrix of the ranks by the reduction of pearson_nxn. The columns are ranked without
+    moving the rows: the ranks are looked up in a table of each column which is merged
+    from its partitions by a tree reduction. With the "exact" method, the result is the
+    same as pd.DataFrame.corr(method="spearman"): the pairs of columns with null values
+    are ranked again over the rows where both are present, see _complete_pairs.
+
+    Parameters
+    ----------
+    df
+        A DataFrame of numerical columns
+    method
+        With "exact", the table of a column holds its distinct values and their
+        counts, and the ranks are the average ranks of the ties. With "approx", the
+        table is a t-digest of the column, and the ranks are estimated from its CDF
+        in constant memory
+    compression
+        The compression of the t-digests of the "approx" method. The approximate
+        ranks are estimated over all the non-null values of a column, so with null
+        values the pairs are not ranked over the rows where both are present
+    """
+    parts = df.to_delayed(optimize_graph=False)
+    ranks = _rank_parts(parts, df.shape[1], method, compression)
+    corr = _pearson_blocks(ranks)
+    if method == "exact":
+        corr = _complete_pairs(parts, ranks, _null_values(parts), corr)
+    return corr
+
+
+def pearson_1xn(parts: List[Delayed]) -> Delayed:
+    """
+    The delayed pairwise-complete Pearson correlations of the last column of the
+    blocks with each of the other columns, the same as pearson_nxn but in O(n)
+    space: a block is summarized by the sums and cross-products of the pairs in
+    one vectorized pass, and the sums are merged by a tree reduction.
+
+    Parameters
+    ----------
+    parts
+        The delayed row blocks, DataFrames or 2d arrays, x is their last column
+    """
+    chunk = dask.delayed(_pearson_1xn_chunk, pure=True)
+    state = tree_reduce([chunk(part) for part in parts], _pearson_1xn_merge)
+    return dask.delayed(_pearson_1xn_finalize, pure=True)(state)
+
+
+def spearman_1xn(
+    parts: List[Delayed],
+    ncols: int,
+    method: str = "exact",
+    compression: float = TDIGEST_COMPRESSION,
+) -> Delayed:
+    """
+    The delayed Spearman correlations of the last column of the blocks with each of
+    the other columns, the correlations of pearson_1xn over the ranks of
+    spearman_nxn, so the columns are never sorted as a whole.
+
+    Parameters
+    ----------
+    parts
+        The delayed row blocks, DataFrames or 2d arrays, x is their last column
+    ncols
+        The number of columns of the blocks, x included
+    method
+        The ranking method, see spearman_nxn
+    compression
+        The compression of the t-digests of the "approx" method
+    """
+    ranks = _rank_parts(parts, ncols, method, compression)
+    corr = pearson_1xn(ranks)
+    if method == "exact":
+        corr = _complete_pairs(parts, ranks, _null_values(parts, ncols - 1), corr)
+    return corr
+
+
+def _rank_parts(
+    parts: List[Delayed],
+    ncols: int,
+    method: str = "exact",
+    compression: float = TDIGEST_COMPRESSION,
+) -> List[Delayed]:
+    """
+    The delayed ranks of the row blocks, see spearman_nxn. A column of a block is
+    ranked by its own task, which only holds the table of that column, and the
+    ranked columns are stacked per block.
+    """
+    chunk: Callable[..., Any]
+    merge: Callable[..., Any]
+    table: Optional[Callable[..., Any]]
+    ranker: Callable[..., Any]
+    if method == "exact":
+        chunk, merge, table, ranker = (
+            _distinct_counts,
+            _merge_distinct_counts,
+            _rank_table,
+            _exact_ranks,
+        )
+    elif method == "approx":
+        chunk, merge, table, ranker = _column_digest, _merge_digests, None, _approx_ranks
+    else:
+        raise ValueError(f"Unknown method {method!r}, expected 'exact' or 'approx'")
+    if ncols == 0:
+        return parts  # no columns to rank, and nothing to stack
+
+    summarize = dask.delayed(chunk, pure=True)
+    rank = dask.delayed(ranker, pure=True)
+    ranks: List[List[Delayed]] = [[] for _ in parts]
+    for i in range(ncols):
+        state = tree_reduce([summarize(part, i, compression) for part in parts], merge)
+        if table is not None:
+            state = dask.delayed(table, pure=True)(state)
+        for part, part_ranks in zip(parts, ranks):
+            part_ranks.append(rank(part, i, state))
+    return [dask.delayed(np.column_stack, pure=True)(part_ranks) for part_ranks in ranks]
+
+
+def _null_values(parts: List[Delayed], only: Optional[int] = None) -> Delayed:
+    """
+    The delayed dict mapping each ordered pair (i, j) of columns to the sorted distinct
+    values of column i and their counts in the rows where column j is null, see
+    _distinct_counts. Only the pairs which include the column only are kept if it is
+    given, and the pairs without such values are left out.
+    """
+    chunk = dask.delayed(_null_counts, pure=True)
+    return tree_reduce([chunk(part, only) for part in parts], _merge_null_counts)
+
+
+def _null_counts(
+    data: Union[pd.DataFrame, np.ndarray], only: Optional[int]
+) -> Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]]:
+    """
+    The distinct values of the columns of a block in the rows where another column
+    is null, see _null_values
+    """
+    arr = _as_float(data)
+    mask = ~np.isnan(arr)
+    state = {}
+    for j in np.flatnonzero(~mask.all(axis=0)):
+        for i in range(arr.shape[1]):
+            if i == j or only is not None and only not in (i, j):
+                continue
+            vals = arr[mask[:, i] & ~mask[:, j], i]
+            if vals.shape[0] > 0:
+                state[(i, int(j))] = np.unique(vals, return_counts=True)
+    return state
+
 
+def _merge_null_counts(
+    states: List[Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]]]
+) -> Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]]:
+    """
+    Merge the distinct values of _null_counts of several partitions
+    """
+    pairs = {pair for state in states for pair in state}
+    return {
+        pair: _merge_distinct_counts([state[pair] for state in states if pair in state])
+        for pair in pairs
+    }
 
-@dask.delayed(name="rankdata-bottleneck", pure=True)  # pylint: disable=no-value-for-parameter
-def nanrankdata(data: np.ndarray, axis: int = 0) -> np.ndarray:
-    """delayed version of rankdata."""
-    return nanrankdata_(data, axis=axis)
 
+def _complete_pairs(
+    parts: List[Delayed],
+    ranks: List[Delayed],
+    nulls: Delayed,
+    corr: Delayed,
+    cols: Optional[List[int]] = None,
+) -> Delayed:
+    """
+    Correct the correlations of the ranks of the pairs of columns with null values,
+    so that both columns are ranked over the rows where both are present, like
+    pd.DataFrame.corr(method="spearman"). The average rank of a value among these
+    rows is its rank in the column, less the values of the column which are in the
+    rows where the other column is null (see _null_values). The Pearson statistics
+    of the corrected ranks of each pair are merged by a tree reduction.
 
-@dask.delayed(name="kendalltau-scipy", pure=True)  # pylint: disable=no-value-for-parameter
-def kendalltau(a: np.ndarray, b: np.ndarray) -> np.ndarray:  # pylint: disable=invalid-name
-    """delayed version of kendalltau."""
-    corr = kendalltau_(a, b).correlation
-    return np.float64(corr)  # Sometimes corr is a float, causes dask error
+    Parameters
+    ----------
+    parts
+        The delayed row blocks
+    ranks
+        The delayed ranks of the row blocks, see _rank_parts
+    nulls
+        The delayed values of _null_values
+    corr
+        The delayed correlation matrix of the ranks of the columns cols, or the
+        correlations of the ranks of the last column with each of the other columns
+    cols
+        The columns of the correlation matrix, None for all the columns
+    """
+    chunk = dask.delayed(_complete_chunk, pure=True)
+    state = tree_reduce(
+        [chunk(part, rank, nulls, cols) for part, rank in zip(parts, ranks)], _merge_complete
+    )
+    return dask.delayed(_complete_finalize, pure=True)(corr, state, cols)
 
 
-@dask.delayed(name="kendalltau-scipy", pure=True)  # pylint: disable=no-value-for-parameter
-def corrcoef(arr: np.ndarray) -> np.ndarray:
-    """delayed version of np.corrcoef."""
-    _, (corr, _) = np.corrcoef(arr, rowvar=False)
+def _complete_chunk(
+    data: Union[pd.DataFrame, np.ndarray],
+    ranks: np.ndarray,
+    nulls: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]],
+    cols: Optional[List[int]],
+) -> Dict[Tuple[int, int], Dict[str, np.ndarray]]:
+    """
+    The Pearson statistics (see _pearson_chunk) of the corrected ranks of the pairs
+    (i, j), i < j, of a block which have null values
+    """
+    arr = _as_float(data)
+    pairs = {(min(pair), max(pair)) for pair in nulls}
+    if cols is not None:
+        pairs = {(i, j) for i, j in pairs if i in cols and j in cols}
+    state = {}
+    for i, j in pairs:
+        rows = ~np.isnan(arr[:, i]) & ~np.isnan(arr[:, j])
+        lhs = _complete_ranks(arr[rows, i], ranks[rows, i], nulls.get((i, j)))
+        rhs = _complete_ranks(arr[rows, j], ranks[rows, j], nulls.get((j, i)))
+        state[(i, j)] = _pearson_chunk(np.column_stack([lhs, rhs]))
+    return state
+
+
+def _complete_ranks(
+    vals: np.ndarray, ranks: np.ndarray, nulls: Optional[Tuple[np.ndarray, np.ndarray]]
+) -> np.ndarray:
+    """
+    The average ranks of the values vals of a column after removing the values nulls,
+    from their average ranks in the column
+    """
+    if nulls is None:
+        return ranks
+    cumcnts = np.concatenate([[0], np.cumsum(nulls[1])])
+    below = cumcnts[np.searchsorted(nulls[0], vals, side="left")]
+    ties = cumcnts[np.searchsorted(nulls[0], vals, side="right")] - below
+    return ranks - below - ties / 2
+
+
+def _merge_complete(
+    states: List[Dict[Tuple[int, int], Dict[str, np.ndarray]]]
+) -> Dict[Tuple[int, int], Dict[str, np.ndarray]]:
+    """
+    Merge the Pearson statistics of the pairs of several blocks
+    """
+    return {pair: _pearson_merge([state[pair] for state in states]) for pair in states[0]}
+
+
+def _complete_finalize(
+    corr: np.ndarray,
+    state: Dict[Tuple[int, int], Dict[str, np.ndarray]],
+    cols: Optional[List[int]],
+) -> np.ndarray:
+    """
+    Replace the correlations of the pairs with null values by their correlations
+    over the rows where both columns are present
+    """
+    corr = corr.copy()
+    pos = {col: i for i, col in enumerate(cols)} if cols is not None else None
+    for (i, j), stats in state.items():
+        val = _pearson_finalize(stats)[0, 1]
+        if corr.ndim == 1:
+            # the correlations of the last column j with each of the other columns
+            corr[i] = val
+        else:
+            lhs, rhs = (pos[i], pos[j]) if pos is not None else (i, j)
+            corr[lhs, rhs] = corr[rhs, lhs] = val
     return corr
+
+
+def _pearson_blocks(parts: List[Delayed], cols: Optional[List[int]] = None) -> Delayed:
+    """
+    The Pearson correlation matrix of the columns, or of the columns cols, of a list
+    of delayed row blocks
+    """
+    # a delayed rather than an array, the blockwise fusion of an array graph would
+    # fuse away the partitions of the frame which the blocks refer to
+    chunk = dask.delayed(_pearson_chunk, pure=True)
+    state = tree_reduce([chunk(part, cols) for part in parts], _pearson_merge)
+    return dask.delayed(_pearson_finalize, pure=True)(state)
+
+
+def _distinct_counts(
+    data: Union[pd.DataFrame, np.ndarray], idx: int, _: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The sorted distinct non-null values of a column of a block and their counts
+    """
+    arr = _as_float(_select(data, [idx]))[:, 0]
+    vals, cnts = np.unique(arr[~np.isnan(arr)], return_counts=True)
+    return vals, cnts
+
+
+def _merge_distinct_counts(
+    states: List[Tuple[np.ndarray, np.ndarray]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge the distinct values and the counts of several partitions
+    """
+    vals = np.concatenate([val for val, _ in states])
+    cnts = np.concatenate([cnt for _, cnt in states])
+    # the values of each state are sorted, which a stable sort merges in linear time
+    order = np.argsort(vals, kind="stable")
+    vals, cnts = vals[order], cnts[order]
+    first = np.flatnonzero(np.diff(vals, prepend=np.nan) != 0)
+    return vals[first], np.add.reduceat(cnts, first) if first.shape[0] else cnts[:0]
+
+
+def _rank_table(state: Tuple[np.ndarray, np.ndarray]) -> Tuple[pd.Index, np.ndarray]:
+    """
+    The distinct values of a column, indexed by a hash table, and their average ranks
+    """
+    vals, cnts = state
+    return pd.Index(vals), np.cumsum(cnts) - (cnts - 1) / 2
+
+
+def _exact_ranks(
+    data: Union[pd.DataFrame, np.ndarray], idx: int, table: Tuple[pd.Index, np.ndarray]
+) -> np.ndarray:
+    """
+    The ranks of the values of a column of a block, NaN for the null values
+    """
+    arr = _as_float(_select(data, [idx]))[:, 0]
+    vals, avgs = table
+    ranks = np.full(arr.shape, np.nan)
+    mask = ~np.isnan(arr)
+    # a hash lookup, several times faster than a binary search of the values
+    ranks[mask] = avgs[vals.get_indexer(arr[mask])]
+    return ranks
+
+
+def _column_digest(data: Union[pd.DataFrame, np.ndarray], idx: int, compression: float) -> TDigest:
+    """
+    The t-digest of a column of a block
+    """
+    return TDigest(compression).update(_as_float(_select(data, [idx]))[:, 0])
+
+
+def _merge_digests(digests: List[TDigest]) -> TDigest:
+    """
+    Merge the t-digests of several partitions
+    """
+    return reduce(TDigest.merge, digests)
+
+
+def _approx_ranks(data: Union[pd.DataFrame, np.ndarray], idx: int, digest: TDigest) -> np.ndarray:
+    """
+    The ranks of the values of a column of a block estimated from the t-digest of
+    the column, NaN for the null values
+    """
+    arr = _as_float(_select(data, [idx]))[:, 0]
+    ranks = np.full(arr.shape, np.nan)
+    mask = ~np.isnan(arr)
+    ranks[mask] = digest.cdf(arr[mask]) * digest.count
+    return ranks
+
+
+def _as_float(data: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+    """
+    The values of a block as a 2d float array with NaN for the null values
+    """
+    if isinstance(data, pd.DataFrame):
+        return data.to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.asarray(data, dtype=np.float64)
+
+
+def _select(
+    data: Union[pd.DataFrame, np.ndarray], cols: List[int]
+) -> Union[pd.DataFrame, np.ndarray]:
+    """
+    The columns cols of a block
+    """
+    return data.iloc[:, cols] if isinstance(data, pd.DataFrame) else data[:, cols]
+
+
+def _pearson_chunk(
+    data: Union[pd.DataFrame, np.ndarray], cols: Optional[List[int]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    The statistics of all the pairs of columns of a block, or of the columns cols,
+    centered at the means of the columns in the block. For the columns i and j, over
+    the rows where both are present, "n" is the number of rows, "sum" is the sum of
+    column i, "sumsq" is the sum of the squares of column i, and "cross" is the sum
+    of the products
+    """
+    arr = _as_float(data if cols is None else _select(data, cols))
+    mask = ~np.isnan(arr)
+    cnts = mask.sum(axis=0)
+    with np.errstate(invalid="ignore"):
+        center = np.where(cnts > 0, np.where(mask, arr, 0).sum(axis=0) / np.maximum(cnts, 1), 0)
+    dev = np.where(mask, arr - center, 0)
+    mask = mask.astype(np.float64)
+    return {
+        "center": center,
+        "n": mask.T @ mask,
+        "sum": dev.T @ mask,
+        "sumsq": (dev * dev).T @ mask,
+        "cross": dev.T @ dev,
+    }
+
+
+def _pearson_shift(state: Dict[str, np.ndarray], center: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    The statistics centered at another center
+    """
+    delta = (center - state["center"])[:, None]
+    cnt, tot = state["n"], state["sum"]
+    return {
+        "center": center,
+        "n": cnt,
+        "sum": tot - cnt * delta,
+        "sumsq": state["sumsq"] - 2 * delta * tot + cnt * delta ** 2,
+        "cross": state["cross"] - tot * delta.T - tot.T * delta + cnt * (delta @ delta.T),
+    }
+
+
+def _pearson_merge(states: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """
+    Merge the statistics of several blocks at the mean of their centers
+    """
+    cnts = np.array([np.diag(state["n"]) for state in states])
+    centers = np.array([state["center"] for state in states])
+    center = (cnts * centers).sum(axis=0) / np.maximum(cnts.sum(axis=0), 1)
+    states = [_pearson_shift(state, center) for state in states]
+    merged = {
+        key: np.sum([state[key] for state in states], axis=0)
+        for key in ("n", "sum", "sumsq", "cross")
+    }
+    merged["center"] = center
+    return merged
+
+
+def _pearson_finalize(state: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    The correlation matrix from the merged statistics
+    """
+    cnt, tot = state["n"], state["sum"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = state["cross"] - tot * tot.T / cnt
+        var = np.maximum(state["sumsq"] - tot ** 2 / cnt, 0)
+        denom = np.sqrt(var * var.T)
+        corr = np.where(denom > 0, cov / denom, np.nan)
+    return np.clip(corr, -1, 1)
+
+
+def _pearson_1xn_chunk(data: Union[pd.DataFrame, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    The statistics of the pairs of the last column x of a block with each column y,
+    centered at the means of the columns in the block. Over the rows where both are
+    present, "n" is the number of rows, "sx" and "sy" are the sums of x and y,
+    "sxx" and "syy" the sums of their squares, and "sxy" the sum of the products
+    """
+    arr = _as_float(data)
+    mask = ~np.isnan(arr)
+    cnts = mask.sum(axis=0)
+    with np.errstate(invalid="ignore"):
+        center = np.where(cnts > 0, np.where(mask, arr, 0).sum(axis=0) / np.maximum(cnts, 1), 0)
+    dev = np.where(mask, arr - center, 0)
+    mask = mask.astype(np.float64)
+    devx, maskx = dev[:, -1], mask[:, -1]
+    return {
+        "center": center,
+        "cnt": cnts,
+        "n": maskx @ mask,
+        "sx": devx @ mask,
+        "sy": maskx @ dev,
+        "sxx": (devx * devx) @ mask,
+        "syy": maskx @ (dev * dev),
+        "sxy": devx @ dev,
+    }
+
+
+def _pearson_1xn_merge(states: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """
+    Merge the statistics of several blocks at the mean of their centers
+    """
+    cnts = np.array([state["cnt"] for state in states])
+    center = (cnts * np.array([state["center"] for state in states])).sum(axis=0)
+    center = center / np.maximum(cnts.sum(axis=0), 1)
+    merged = {
+        key: np.zeros_like(states[0][key], dtype=np.float64)
+        for key in ("n", "sx", "sy", "sxx", "syy", "sxy")
+    }
+    for state in states:
+        dely = center - state["center"]
+        delx = dely[-1]
+        cnt, totx, toty = state["n"], state["sx"], state["sy"]
+        merged["n"] += cnt
+        merged["sx"] += totx - cnt * delx
+        merged["sy"] += toty - cnt * dely
+        merged["sxx"] += state["sxx"] - 2 * delx * totx + cnt * delx ** 2
+        merged["syy"] += state["syy"] - 2 * dely * toty + cnt * dely ** 2
+        merged["sxy"] += state["sxy"] - delx * toty - dely * totx + cnt * delx * dely
+    merged["center"], merged["cnt"] = center, cnts.sum(axis=0)
+    return merged
+
+
+def _pearson_1xn_finalize(state: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    The correlations of x with the other columns from the merged statistics
+    """
+    cnt, totx, toty = state["n"], state["sx"], state["sy"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = state["sxy"] - totx * toty / cnt
+        varx = np.maximum(state["sxx"] - totx ** 2 / cnt, 0)
+        vary = np.maximum(state["syy"] - toty ** 2 / cnt, 0)
+        denom = np.sqrt(varx * vary)
+        corr = np.where(denom > 0, cov / denom, np.nan)
+    return np.clip(corr[:-1], -1, 1)
+
+
+def kendall_nxn(df: dd.DataFrame, sample: Optional[int] = None) -> Delayed:
+    """
+    The delayed Kendall tau-b correlation matrix of the columns, the same as
+    pd.DataFrame.corr(method="kendall"), see kendall_pairs. It is a dict with the
+    key "corr", and if sample is given, the bounds of the confidence intervals of
+    the correlations "lower" and "upper".
+
+    Parameters
+    ----------
+    df
+        A DataFrame of numerical columns
+    sample
+        The size of the stratified sample of the rows, None for all the rows
+    """
+    ncols = df.shape[1]
+    lhs, rhs = np.triu_indices(ncols)
+    res = kendall_pairs(df.to_delayed(optimize_graph=False), list(zip(lhs, rhs)), sample)
+    return dask.delayed(_kendall_matrix, pure=True)(res, ncols, lhs, rhs)
+
+
+def kendall_pairs(
+    parts: List[Delayed], pairs: Sequence[Tuple[int, int]], sample: Optional[int] = None
+) -> Delayed:
+    """
+    The Kendall tau-b correlations of pairs of columns over the rows where both
+    columns are present. The pairs are spread over tasks of KENDALL_PAIRS pairs, and
+    a task gathers only the columns of its pairs, selected from each partition by a
+    task of its own. A pair is correlated by Knight's O(n log n) algorithm, as
+    implemented by scipy. The result is a delayed dict with the key "corr", the
+    array of the correlations of the pairs, and if sample is given, "lower" and
+    "upper", the bounds of their confidence intervals, which use the variance
+    0.437 / (n - 4) of the Fisher transform of tau (Fieller, Hartley and Pearson,
+    1957).
+
+    Parameters
+    ----------
+    parts
+        The delayed row blocks, DataFrames or 2d arrays
+    pairs
+        The pairs of column indices
+    sample
+        The size of the stratified sample of the rows, the rows sampled from each
+        block are proportional to its length. The sample of a block is seeded by
+        its index, so the same rows are sampled by every computation. None for all
+        the rows
+    """
+    if sample is not None:
+        chunk = dask.delayed(_sample_rows, pure=True)
+        smps = [chunk(part, sample, seed) for seed, part in enumerate(parts)]
+        parts = [dask.delayed(_stratify, pure=True)(smps, sample)]
+
+    select = dask.delayed(_select, pure=True)
+    task = dask.delayed(_kendall_task, pure=True)
+    res = []
+    for start in range(0, len(pairs), KENDALL_PAIRS):
+        group = pairs[start : start + KENDALL_PAIRS]
+        cols = sorted({idx for pair in group for idx in pair})
+        pos = {col: i for i, col in enumerate(cols)}
+        # the pairs index the selected columns
+        group = [(pos[i], pos[j]) for i, j in group]
+        res.append(task([select(part, cols) for part in parts], group))
+    return dask.delayed(_kendall_finalize, pure=True)(res, sample is not None)
+
+
+def _sample_rows(
+    data: Union[pd.DataFrame, np.ndarray], size: int, seed: int
+) -> Tuple[np.ndarray, int]:
+    """
+    A random sample of at most size rows of a block in a random order, and the
+    number of rows of the block
+    """
+    arr = _as_float(data)
+    idx = np.random.default_rng(seed).permutation(arr.shape[0])[:size]
+    return arr[idx], arr.shape[0]
+
+
+def _stratify(samples: List[Tuple[np.ndarray, int]], size: int) -> np.ndarray:
+    """
+    A sample of at most size rows with the rows of each block proportional to its length
+    """
+    lens = np.array([nrows for _, nrows in samples])
+    alloc = np.floor(size * lens / max(lens.sum(), 1)).astype(int)
+    # the largest remainders get the rows left
+    rems = size * lens / max(lens.sum(), 1) - alloc
+    alloc[np.argsort(-rems)[: min(size, lens.sum()) - alloc.sum()]] += 1
+    return np.concatenate([smp[:cnt] for (smp, _), cnt in zip(samples, alloc)])
+
+
+def _kendall_task(
+    parts: List[Union[pd.DataFrame, np.ndarray]], pairs: Sequence[Tuple[int, int]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The Kendall correlations of some pairs of columns and the numbers of rows
+    where both columns are present
+    """
+    arr = np.concatenate([_as_float(part) for part in parts])
+    corrs, cnts = np.full(len(pairs), np.nan), np.zeros(len(pairs), dtype=np.int64)
+    for k, (i, j) in enumerate(pairs):
+        x, y = arr[:, i], arr[:, j]
+        mask = ~(np.isnan(x) | np.isnan(y))
+        cnts[k] = mask.sum()
+        if i == j and cnts[k] >= 1:
+            corrs[k] = 1.0
+        elif cnts[k] >= 2:
+            corrs[k] = kendalltau_(x[mask], y[mask]).correlation
+    return corrs, cnts
+
+
+def _kendall_finalize(res: List[Tuple[np.ndarray, np.ndarray]], sampled: bool) -> Dict[str, Any]:
+    """
+    Concatenate the correlations of the tasks, and derive the confidence intervals
+    of the sampled correlations
+    """
+    corrs = np.concatenate([corr for corr, _ in res]) if res else np.empty(0)
+    out = {"corr": corrs}
+    if sampled:
+        cnts = np.concatenate([cnt for _, cnt in res]) if res else np.empty(0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            zval = np.arctanh(np.clip(corrs, -1 + 1e-12, 1 - 1e-12))
+            half = KENDALL_Z * np.sqrt(0.437 / (cnts - 4))
+        out["lower"] = np.where(cnts > 4, np.tanh(zval - half), np.nan)
+        out["upper"] = np.where(cnts > 4, np.tanh(zval + half), np.nan)
+    return out
+
+
+def _kendall_matrix(
+    res: Dict[str, np.ndarray], ncols: int, lhs: np.ndarray, rhs: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Arrange the correlations of the pairs of the upper triangle into symmetric matrices
+    """
+    out = {}
+    for key, vals in res.items():
+        mat = np.empty((ncols, ncols))
+        mat[lhs, rhs] = mat[rhs, lhs] = vals
+        out[key] = mat
+    return out
+
+
+def corr_topk(  # pylint: disable=too-many-arguments,too-many-locals
+    df: dd.DataFrame,
+    method: CorrelationMethod,
+    k: int,
+    *,
+    block: int = TOPK_BLOCK,
+    rank: str = "exact",
+    compression: float = TDIGEST_COMPRESSION,
+    sample: Optional[int] = None,
+) -> Delayed:
+    """
+    The top-k pairs of columns of the correlation matrix, which is never materialised:
+    the matrix is computed by blocks of block x block columns, and each block keeps
+    only its k most positive, k most negative and k least correlated pairs, which are
+    merged by heaps in a tree reduction. The result is a delayed dict where "pos",
+    "neg" and "least" are lists of (correlation, i, j) with i < j, sorted from the
+    most positive, from the most negative and from the smallest absolute value,
+    "sum" and "count" are the sum and the number of the non-null correlations of
+    the pairs. Pairs with a null correlation are left out.
+
+    Parameters
+    ----------
+    df
+        A DataFrame of numerical columns
+    method
+        The correlation method
+    k
+        The number of pairs kept in each list
+    block
+        The number of columns of a block
+    rank
+        The method of spearman_nxn
+    compression
+        The compression of the t-digests of spearman_nxn
+    sample
+        The sample size of kendall_nxn
+    """
+    ncols = df.shape[1]
+    parts = df.to_delayed(optimize_graph=False)
+    ranks, nulls = parts, None
+    if method == CorrelationMethod.Spearman:
+        ranks = _rank_parts(parts, ncols, rank, compression)
+        if rank == "exact":
+            nulls = _null_values(parts)
+    task = dask.delayed(_block_topk, pure=True)
+
+    states = []
+    bounds = [(start, min(start + block, ncols)) for start in range(0, ncols, block)]
+    for i, lhs in enumerate(bounds):
+        for rhs in bounds[i:]:
+            if method == CorrelationMethod.KendallTau:
+                pairs = list(zip(*_block_pairs(lhs, rhs)))
+                corr = kendall_pairs(parts, pairs, sample)["corr"]
+            else:
+                cols = list(range(*lhs)) + (list(range(*rhs)) if rhs != lhs else [])
+                corr = _pearson_blocks(ranks, cols)
+                if nulls is not None:
+                    corr = _complete_pairs(parts, ranks, nulls, corr, cols)
+            states.append(task(corr, lhs, rhs, k))
+    if not states:
+        return dask.delayed(_pairs_topk, pure=True)(np.empty(0), np.empty(0), np.empty(0), k)
+    return tree_reduce(states, partial(_merge_topk, k=k))
+
+
+def _block_pairs(lhs: Tuple[int, int], rhs: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The pairs (i, j), i < j, of the columns i in the range lhs and j in the range rhs
+    """
+    if lhs == rhs:
+        rows, cols = np.triu_indices(lhs[1] - lhs[0], 1)
+        return rows + lhs[0], cols + lhs[0]
+    rows, cols = np.divmod(np.arange((lhs[1] - lhs[0]) * (rhs[1] - rhs[0])), rhs[1] - rhs[0])
+    return rows + lhs[0], cols + rhs[0]
+
+
+def _block_topk(
+    corr: np.ndarray, lhs: Tuple[int, int], rhs: Tuple[int, int], k: int
+) -> Dict[str, Any]:
+    """
+    The top-k pairs of a block, from the correlation matrix of the columns of the
+    blocks lhs and rhs, or from the correlations of the pairs of _block_pairs
+    """
+    if corr.ndim == 2:
+        nlhs = lhs[1] - lhs[0]
+        if lhs == rhs:
+            corr = corr[np.triu_indices(nlhs, 1)]
+        else:
+            corr = corr[:nlhs, nlhs:].ravel()
+    return _pairs_topk(corr, *_block_pairs(lhs, rhs), k)
+
+
+def _pairs_topk(corrs: np.ndarray, lhs: np.ndarray, rhs: np.ndarray, k: int) -> Dict[str, Any]:
+    """
+    The top-k lists of some pairs of columns, see corr_topk
+    """
+    mask = ~np.isnan(corrs)
+    corrs, lhs, rhs = corrs[mask], lhs[mask], rhs[mask]
+
+    def top(keys: np.ndarray) -> List[Tuple[float, int, int]]:
+        idx = np.argpartition(keys, k)[:k] if keys.shape[0] > k else np.arange(keys.shape[0])
+        idx = idx[np.argsort(keys[idx], kind="stable")]
+        return [(float(corrs[i]), int(lhs[i]), int(rhs[i])) for i in idx]
+
+    return {
+        "pos": top(-corrs),
+        "neg": top(corrs),
+        "least": top(np.abs(corrs)),
+        "sum": float(corrs.sum()),
+        "count": int(corrs.shape[0]),
+    }
+
+
+def _merge_topk(states: List[Dict[str, Any]], k: int) -> Dict[str, Any]:
+    """
+    Merge the top-k lists of several blocks
+    """
+    return {
+        "pos": heapq.nlargest(k, chain.from_iterable(state["pos"] for state in states)),
+        "neg": heapq.nsmallest(k, chain.from_iterable(state["neg"] for state in states)),
+        "least": heapq.nsmallest(
+            k, chain.from_iterable(state["least"] for state in states), key=lambda e: abs(e[0])
+        ),
+        "sum": sum(state["sum"] for state in states),
+        "count": sum(state["count"] for state in states),
+    }
@@ -1,20 +1,29 @@
 """Implementations of correlations.
 
-Currently this boils down to pandas' implementation."""
+The correlation matrices are reduced from the partitions, see .common."""
 
-from functools import partial
-from typing import Any, Dict, List, Optional, Tuple
+import heapq
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import dask
-import dask.array as da
 import numpy as np
 import pandas as pd
+from dask.delayed import Delayed
 
 from ...configs import Config
 from ...data_array import DataArray, DataFrame
 from ...intermediate import Intermediate
 from ...utils import cut_long_name
-from .common import CorrelationMethod
+from ...distribution.compute.sketch import TDIGEST_COMPRESSION
+from .common import CorrelationMethod, corr_topk, kendall_nxn, pearson_nxn, spearman_nxn
+
+# The number of numerical columns above which the overview keeps only the top-k
+# pairs of the correlation matrices, see _calc_overview_wide
+WIDE_NCOLS = 1000
+
+# The number of the most positive, the most negative and the least correlated pairs
+# of each correlation matrix kept by the overview of a wide table
+WIDE_TOPK = 100
 
 
 def _calc_overview(
@@ -32,84 +41,35 @@ def _calc_overview(
         raise ValueError("value_range and k cannot be present in both")
 
     num_df = DataArray(df).select_num_columns()
+    if len(num_df.columns) > WIDE_NCOLS:
+        return _calc_overview_wide(num_df, cfg, value_range=value_range, k=k)
 
-    cordx, cordy, corrs = correlation_nxn(num_df, cfg)
+    kendall, kendall_ci = None, None
+    if cfg.kendall.enable and cfg.kendall.sample is not None:
+        # the correlations and their confidence intervals from the same sample
+        kendall = kendall_nxn(num_df.frame, cfg.kendall.sample)
+        kendall_ci = (kendall["lower"], kendall["upper"])
+    cordx, cordy, corrs = correlation_nxn(num_df, cfg, kendall)
 
     # The computations below is not expensive (scales with # of columns)
     # So we do them in pandas
 
-    (corrs,) = dask.compute(corrs)
+    corrs, kendall_ci = dask.compute(corrs, kendall_ci)
 
+    summaries = {}
     if cfg.stats.enable or cfg.insight.enable:
-        if cfg.stats.enable or cfg.pearson.enable:
-            (
-                pearson_pos_max,
-                pearson_neg_max,
-                pearson_mean,
-                pearson_pos_cols,
-                pearson_neg_cols,
-            ) = most_corr(corrs[CorrelationMethod.Pearson])
-            pearson_min, pearson_cols = least_corr(corrs[CorrelationMethod.Pearson])
-        if cfg.stats.enable or cfg.spearman.enable:
-            (
-                spearman_pos_max,
-                spearman_neg_max,
-                spearman_mean,
-                spearman_pos_cols,
-                spearman_neg_cols,
-            ) = most_corr(corrs[CorrelationMethod.Spearman])
-            spearman_min, spearman_cols = least_corr(corrs[CorrelationMethod.Spearman])
-        if cfg.stats.enable or cfg.kendall.enable:
-            (
-                kendalltau_pos_max,
-                kendalltau_neg_max,
-                kendalltau_mean,
-                kendalltau_pos_cols,
-                kendalltau_neg_cols,
-            ) = most_corr(corrs[CorrelationMethod.KendallTau])
-            kendalltau_min, kendalltau_cols = least_corr(corrs[CorrelationMethod.KendallTau])
-
-    if cfg.stats.enable:
-        tabledata = {
-            "Highest Positive Correlation": {
-                "Pearson": pearson_pos_max,
-                "Spearman": spearman_pos_max,
-                "KendallTau": kendalltau_pos_max,
-            },
-            "Highest Negative Correlation": {
-                "Pearson": pearson_neg_max,
-                "Spearman": spearman_neg_max,
-                "KendallTau": kendalltau_neg_max,
-            },
-            "Lowest Correlation": {
-                "Pearson": pearson_min,
-                "Spearman": spearman_min,
-                "KendallTau": kendalltau_min,
-            },
-            "Mean Correlation": {
-                "Pearson": pearson_mean,
-                "Spearman": spearman_mean,
-                "KendallTau": kendalltau_mean,
-            },
-        }
-
-    if cfg.insight.enable:
-        insights: Dict[str, List[Any]] = {}
-        if cfg.pearson.enable:
-            p_p_corr = create_string("positive", pearson_pos_cols, most_show, num_df)
-            p_n_corr = create_string("negative", pearson_neg_cols, most_show, num_df)
-            p_corr = create_string("least", pearson_cols, most_show, num_df)
-            insights["Pearson"] = [p_p_corr, p_n_corr, p_corr]
-        if cfg.spearman.enable:
-            s_p_corr = create_string("positive", spearman_pos_cols, most_show, num_df)
-            s_n_corr = create_string("negative", spearman_neg_cols, most_show, num_df)
-            s_corr = create_string("least", spearman_cols, most_show, num_df)
-            insights["Spearman"] = [s_p_corr, s_n_corr, s_corr]
-        if cfg.kendall.enable:
-            k_p_corr = create_string("positive", kendalltau_pos_cols, most_show, num_df)
-            k_n_corr = create_string("negative", kendalltau_neg_cols, most_show, num_df)
-            k_corr = create_string("least", kendalltau_cols, most_show, num_df)
-            insights["KendallTau"] = [k_p_corr, k_n_corr, k_corr]
+        for method, corr in corrs.items():
+            pos_max, neg_max, mean, pos_cols, neg_cols = most_corr(corr)
+            minimum, least_cols = least_corr(corr)
+            summaries[method] = {
+                "pos_max": pos_max,
+                "neg_max": neg_max,
+                "mean": mean,
+                "min": minimum,
+                "pos_cols": pos_cols,
+                "neg_cols": neg_cols,
+                "least_cols": least_cols,
+            }
 
     dfs = {}
     for method, corr in corrs.items():
@@ -130,6 +90,9 @@ def _calc_overview(
                 "correlation": corr.ravel(),
             }
         )
+        if method == CorrelationMethod.KendallTau and kendall_ci is not None:
+            # the 95% confidence intervals of the sampled correlations
+            ndf["lower"], ndf["upper"] = kendall_ci[0].ravel(), kendall_ci[1].ravel()
         ndf = ndf[cordy > cordx]  # Retain only lower triangle (w/o diag)
 
         if k is not None:
@@ -145,16 +108,150 @@ def _calc_overview(
         data=dfs,
         axis_range=list(num_df.columns.unique()),
         visual_type="correlation_impact",
-        tabledata=tabledata if cfg.stats.enable else {},
-        insights=insights if cfg.insight.enable else {},
+        tabledata=_tabledata(summaries) if cfg.stats.enable else {},
+        insights=_insights(summaries, cfg, most_show, num_df) if cfg.insight.enable else {},
+    )
+
+
+def _calc_overview_wide(
+    num_df: DataArray,
+    cfg: Config,
+    *,
+    value_range: Optional[Tuple[float, float]] = None,
+    k: Optional[int] = None,
+) -> Intermediate:
+    """
+    The overview of a wide table, from the top-k pairs of each correlation matrix
+    (see corr_topk) rather than from the matrices. The result holds the most
+    positive, the most negative and the least correlated pairs of each method, or
+    the k pairs of the largest absolute correlations; value_range filters these
+    pairs. The axes hold only the columns of the pairs.
+    """
+    most_show = 6  # the most number of column/row to show in "insight"
+
+    enabled = {
+        CorrelationMethod.Pearson: cfg.pearson.enable,
+        CorrelationMethod.Spearman: cfg.spearman.enable,
+        CorrelationMethod.KendallTau: cfg.kendall.enable,
+    }
+    states = {
+        method: corr_topk(
+            num_df.frame,
+            method,
+            k if k is not None else WIDE_TOPK,
+            rank=cfg.spearman.method,
+            compression=cfg.quantile.compression,
+            sample=cfg.kendall.sample,
+        )
+        for method in CorrelationMethod
+        if enabled[method] or cfg.stats.enable
+    }
+    (states,) = dask.compute(states)
+
+    ncols = len(num_df.columns)
+    summaries = {method: _topk_summary(state, ncols) for method, state in states.items()}
+
+    dfs = {}
+    used: Set[int] = set()
+    for method, state in states.items():
+        if not enabled[method]:
+            continue
+        ndf = _topk_pairs(state, value_range, k)
+        used.update(ndf["x"], ndf["y"])
+        ndf["x"] = num_df.columns[ndf["x"].to_numpy()]
+        ndf["y"] = num_df.columns[ndf["y"].to_numpy()]
+        dfs[method.name] = ndf[["x", "y", "correlation"]]
+
+    return Intermediate(
+        data=dfs,
+        axis_range=list(num_df.columns[sorted(used)].unique()),
+        visual_type="correlation_impact",
+        tabledata=_tabledata(summaries) if cfg.stats.enable else {},
+        insights=_insights(summaries, cfg, most_show, num_df) if cfg.insight.enable else {},
     )
 
 
+def _topk_pairs(
+    state: Dict[str, Any],
+    value_range: Optional[Tuple[float, float]] = None,
+    k: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    The pairs of the top-k lists of a correlation matrix shown by the overview,
+    the k pairs of the largest absolute correlations if k is given, all of them
+    otherwise, within value_range
+    """
+    if k is not None:
+        pairs = heapq.nlargest(k, {*state["pos"], *state["neg"]}, key=lambda e: abs(e[0]))
+    else:
+        pairs = sorted({*state["pos"], *state["neg"], *state["least"]}, key=lambda e: e[1:])
+    ndf = pd.DataFrame(pairs, columns=["correlation", "x", "y"])
+    if value_range is not None:
+        mask = (value_range[0] <= ndf["correlation"]) & (ndf["correlation"] <= value_range[1])
+        ndf = ndf[mask]
+    return ndf
+
+
+def _topk_summary(state: Dict[str, Any], ncols: int) -> Dict[str, Any]:
+    """
+    The summary of a correlation matrix from its top-k pairs, the same as the
+    summary from most_corr and least_corr, where the mean is over the non-null
+    correlations, counting the diagonal as 0
+    """
+    pos_max = max(state["pos"][0][0], 0) if state["pos"] else 0
+    neg_max = min(state["neg"][0][0], 0) if state["neg"] else 0
+    minimum = abs(state["least"][0][0]) if state["least"] else np.nan
+    return {
+        "pos_max": round(pos_max, 3),
+        "neg_max": round(neg_max, 3),
+        "mean": round(2 * state["sum"] / (2 * state["count"] + ncols), 3),
+        "min": round(minimum, 3),
+        "pos_cols": [(i, j) for corr, i, j in state["pos"] if corr == pos_max != 0],
+        "neg_cols": [(i, j) for corr, i, j in state["neg"] if corr == neg_max != 0],
+        "least_cols": [(i, j) for corr, i, j in state["least"] if abs(corr) == minimum],
+    }
+
+
+def _tabledata(summaries: Dict[CorrelationMethod, Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """The table of the statistics of the correlation matrices."""
+    rows = {
+        "Highest Positive Correlation": "pos_max",
+        "Highest Negative Correlation": "neg_max",
+        "Lowest Correlation": "min",
+        "Mean Correlation": "mean",
+    }
+    return {
+        row: {method.name: summary[key] for method, summary in summaries.items()}
+        for row, key in rows.items()
+    }
+
+
+def _insights(
+    summaries: Dict[CorrelationMethod, Dict[str, Any]], cfg: Config, most_show: int, df: DataArray
+) -> Dict[str, List[Any]]:
+    """The insights of the enabled correlation methods."""
+    enabled = {
+        CorrelationMethod.Pearson: cfg.pearson.enable,
+        CorrelationMethod.Spearman: cfg.spearman.enable,
+        CorrelationMethod.KendallTau: cfg.kendall.enable,
+    }
+    insights: Dict[str, List[Any]] = {}
+    for method, summary in summaries.items():
+        if enabled[method]:
+            insights[method.name] = [
+                create_string("positive", summary["pos_cols"], most_show, df),
+                create_string("negative", summary["neg_cols"], most_show, df),
+                create_string("least", summary["least_cols"], most_show, df),
+            ]
+    return insights
+
+
 def correlation_nxn(
-    df: DataArray, cfg: Config
-) -> Tuple[np.ndarray, np.ndarray, Dict[CorrelationMethod, da.Array]]:
+    df: DataArray, cfg: Config, kendall: Optional[Delayed] = None
+) -> Tuple[np.ndarray, np.ndarray, Dict[CorrelationMethod, Delayed]]:
     """
-    Calculation of a n x n correlation matrix for n columns
+    Calculation of a n x n correlation matrix for n columns, the Kendall tau
+    correlations are taken from the delayed dict of kendall_nxn if it is given
 
     Returns
     -------
@@ -165,43 +262,38 @@ def correlation_nxn(
     cordx, cordy = np.meshgrid(range(ncols), range(ncols))
     cordx, cordy = cordy.ravel(), cordx.ravel()
 
-    corrs: Dict[CorrelationMethod, da.Array] = {}
+    corrs: Dict[CorrelationMethod, Delayed] = {}
 
     if cfg.pearson.enable or cfg.stats.enable:
         corrs[CorrelationMethod.Pearson] = _pearson_nxn(df)
     if cfg.spearman.enable or cfg.stats.enable:
-        corrs[CorrelationMethod.Spearman] = _spearman_nxn(df)
+        corrs[CorrelationMethod.Spearman] = _spearman_nxn(
+            df, cfg.spearman.method, cfg.quantile.compression
+        )
     if cfg.kendall.enable or cfg.stats.enable:
-        corrs[CorrelationMethod.KendallTau] = _kendall_tau_nxn(df)
+        if kendall is not None:
+            corrs[CorrelationMethod.KendallTau] = kendall["corr"]
+        else:
+            corrs[CorrelationMethod.KendallTau] = _kendall_tau_nxn(df, cfg.kendall.sample)
 
     return cordx, cordy, corrs
 
 
-def _pearson_nxn(df: DataArray) -> da.Array:
+def _pearson_nxn(df: DataArray) -> Delayed:
     """Calculate column-wise pearson correlation."""
-    return (
-        df.frame.repartition(npartitions=1)
-        .map_partitions(partial(pd.DataFrame.corr, method="pearson"))
-        .to_dask_array()
-    )
+    return pearson_nxn(df.frame)
 
 
-def _spearman_nxn(df: DataArray) -> da.Array:
+def _spearman_nxn(
+    df: DataArray, method: str = "exact", compression: float = TDIGEST_COMPRESSION
+) -> Delayed:
     """Calculate column-wise spearman correlation."""
-    return (
-        df.frame.repartition(npartitions=1)
-        .map_partitions(partial(pd.DataFrame.corr, method="spearman"))
-        .to_dask_array()
-    )
+    return spearman_nxn(df.frame, method, compression)
 
 
-def _kendall_tau_nxn(df: DataArray) -> da.Array:
+def _kendall_tau_nxn(df: DataArray, sample: Optional[int] = None) -> Delayed:
     """Calculate column-wise kendalltau correlation."""
-    return (
-        df.frame.repartition(npartitions=1)
-        .map_partitions(partial(pd.DataFrame.corr, method="kendall"))
-        .to_dask_array()
-    )
+    return kendall_nxn(df.frame, sample)["corr"]
 
 
 def most_corr(corrs: np.ndarray) -> Tuple[float, float, float, List[Any], List[Any]]:
@@ -251,7 +343,7 @@ def least_corr(corrs: np.ndarray) -> Tuple[float, List[Any]]:
     for i in range(corrs_copy.shape[0]):
         corrs_copy[i, i] = 2
     minimum = abs(corrs_copy).min()
-    col1, col2 = np.where(corrs_copy == minimum)
+    col1, col2 = np.where(abs(corrs_copy) == minimum)
 
     for i, _ in enumerate(col1):
         if col1[i] < col2[i]:
@@ -288,58 +380,3 @@ def create_string(flag: str, source: List[Any], most_show: int, df: DataArray) -
         out = temp
 
     return out
-
-
-## The code below is the correlation algorithms for array. Since we don't have
-## block-wise algorithms for spearman and kendalltal, it might be more suitable
-## to just use the pandas version of correlation.
-## The correlations from pandas use double for-loops but they write them in cython
-## and they are super fast already.
-#
-# def _pearson_nxn(data: da.Array) -> da.Array:
-#     """Calculate column-wise pearson correlation."""
-
-#     mean = data.mean(axis=0)[None, :]
-#     dem = data - mean
-
-#     num = dem.T @ dem
-
-#     std = data.std(axis=0, keepdims=True)
-#     dom = data.shape[0] * (std * std.T)
-
-#     correl = num / dom
-
-#     return correl
-
-
-# def _spearman_nxn(array: da.Array) -> da.Array:
-#     rank_array = (
-#         array.rechunk((-1, None))  #! TODO: avoid this
-#         .map_blocks(partial(rankdata, axis=0))
-#         .rechunk("auto")
-#     )
-#     return _pearson_nxn(rank_array)
-
-
-# def _kendall_tau_nxn(array: da.Array) -> da.Array:
-#     """Kendal Tau correlation outputs an n x n correlation matrix for n columns."""
-
-#     _, ncols = array.shape
-
-#     corrmat = []
-#     for _ in range(ncols):
-#         corrmat.append([float("nan")] * ncols)
-
-#     for i in range(ncols):
-#         corrmat[i][i] = 1.0
-
-#     for i in range(ncols):
-#         for j in range(i + 1, ncols):
-
-#             tmp = kendalltau(array[:, i], array[:, j])
-
-#             corrmat[j][i] = corrmat[i][j] = da.from_delayed(
-#                 tmp, shape=(), dtype=np.float
-#             )
-
-#     return da.stack(corrmat)
@@ -2,17 +2,20 @@
 for plot_correlation(df) function."""
 
 import sys
-from typing import Optional, Tuple
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import dask
 import dask.array as da
 import numpy as np
 import pandas as pd
+from dask.delayed import Delayed
 
 from ...configs import Config
 from ...data_array import DataArray, DataFrame
 from ...intermediate import Intermediate
-from .common import CorrelationMethod, corrcoef, kendalltau, nanrankdata
+from ...distribution.compute.sketch import TDIGEST_COMPRESSION
+from .common import CorrelationMethod, kendall_pairs, pearson_1xn, spearman_1xn
 
 
 def _calc_univariate(
@@ -51,79 +54,82 @@ def _calc_univariate(
     xarr = num_df.values[:, num_df.columns == x]
     data = num_df.values[:, num_df.columns != x]
 
-    funcs = []
+    funcs: Dict[CorrelationMethod, Callable[[da.Array, da.Array], Any]] = {}
     if cfg.pearson.enable:
-        funcs.append(_pearson_1xn)
+        funcs[CorrelationMethod.Pearson] = _pearson_1xn
     if cfg.spearman.enable:
-        funcs.append(_spearman_1xn)
+        funcs[CorrelationMethod.Spearman] = partial(
+            _spearman_1xn, method=cfg.spearman.method, compression=cfg.quantile.compression
+        )
     if cfg.kendall.enable:
-        funcs.append(_kendall_tau_1xn)
+        funcs[CorrelationMethod.KendallTau] = partial(_kendall_tau_1xn, sample=cfg.kendall.sample)
 
     dfs = {}
-    (computed,) = dask.compute(
-        {meth: func(xarr, data) for meth, func in zip(CorrelationMethod, funcs)}
-    )
+    (computed,) = dask.compute({meth: func(xarr, data) for meth, func in funcs.items()})
 
-    for meth, corrs in computed.items():
-        indices, corrs = _corr_filter(corrs, value_range, k)
-        if len(indices) == 0:
+    for meth, res in computed.items():
+        dfs[meth.name] = _single_corrs(x, columns, res, value_range, k)
+        if len(dfs[meth.name]) == 0:
             print(
                 f"Correlation for {meth.name} is empty, try to broaden the value_range.",
                 file=sys.stderr,
             )
-        num_df = pd.DataFrame(
-            {
-                "x": np.full(len(indices), x),
-                "y": columns[indices],
-                "correlation": corrs,
-            }
-        )
-        dfs[meth.name] = num_df
 
     return Intermediate(data=dfs, visual_type="correlation_single_heatmaps")
 
 
-def _pearson_1xn(x: da.Array, data: da.Array) -> da.Array:
-    _, ncols = data.shape
-
-    fused = da.concatenate([data, x], axis=1)
-    mask = ~da.isnan(fused)
-
-    corrs = []
-    for j in range(ncols):
-        xy = fused[:, [-1, j]]
-        mask_ = mask[:, -1] & mask[:, j]
-        xy = xy[mask_]
-        corr = da.from_delayed(corrcoef(xy), dtype=np.float, shape=())
-        # not usable because xy has unknown rows due to the null filter
-        # _, (corr, _) = da.corrcoef(xy, rowvar=False)
-        corrs.append(corr)
-
-    return da.stack(corrs)
-
+def _single_corrs(
+    x: str,
+    columns: pd.Index,
+    res: Any,
+    value_range: Optional[Tuple[float, float]] = None,
+    k: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    The filtered correlations of x and the columns, res is the array of the
+    correlations, or the dict of kendall_pairs with the bounds of the confidence
+    intervals of the sampled Kendall tau
+    """
+    res = res if isinstance(res, dict) else {"corr": res}
+    indices, corrs = _corr_filter(res["corr"], value_range, k)
+    return pd.DataFrame(
+        {
+            "x": np.full(len(indices), x),
+            "y": columns[indices],
+            "correlation": corrs,
+            **{key: res[key][indices] for key in ("lower", "upper") if key in res},
+        }
+    )
 
-def _spearman_1xn(x: da.Array, data: da.Array) -> da.Array:
-    xrank = da.from_delayed(nanrankdata(x), dtype=np.float, shape=x.shape)
-    ranks = da.from_delayed(nanrankdata(data), dtype=np.float, shape=data.shape)
 
-    return _pearson_1xn(xrank, ranks)
+def _pearson_1xn(x: da.Array, data: da.Array) -> da.Array:
+    _, ncols = data.shape
+    corrs = pearson_1xn(_fused_parts(x, data))
+    return da.from_delayed(corrs, dtype=np.float64, shape=(ncols,))
 
 
-def _kendall_tau_1xn(x: da.Array, data: da.Array) -> da.Array:
+def _spearman_1xn(
+    x: da.Array, data: da.Array, method: str = "exact", compression: float = TDIGEST_COMPRESSION
+) -> da.Array:
     _, ncols = data.shape
+    corrs = spearman_1xn(_fused_parts(x, data), ncols + 1, method, compression)
+    return da.from_delayed(corrs, dtype=np.float64, shape=(ncols,))
 
-    datamask = da.isnan(data)
-    xmask = da.isnan(x)[:, 0]
 
-    corrs = []
-    for j in range(ncols):
-        y = data[:, [j]]
+def _kendall_tau_1xn(x: da.Array, data: da.Array, sample: Optional[int] = None) -> Delayed:
+    """
+    The delayed dict of kendall_pairs of x and the columns of data
+    """
+    _, ncols = data.shape
+    return kendall_pairs(_fused_parts(x, data), [(ncols, j) for j in range(ncols)], sample)
 
-        mask = ~(xmask | datamask[:, j])
-        corr = da.from_delayed(kendalltau(x[mask], y[mask]), dtype=np.float, shape=())
-        corrs.append(corr)
 
-    return da.stack(corrs)
+def _fused_parts(x: da.Array, data: da.Array) -> List[Delayed]:
+    """
+    The delayed row blocks of data with x as the last column
+    """
+    fused = da.concatenate([data, x], axis=1).rechunk({1: -1})
+    return list(fused.to_delayed().ravel())
 
 
 def _corr_filter(
@@ -2,9 +2,10 @@
     This module implements the visualization for
     plot_correlation(df) function
 """
-from typing import Any, Dict, List, Sequence, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
+import pandas as pd
 from bokeh.layouts import column, row
 from bokeh.models import (
     BasicTicker,
@@ -122,7 +123,7 @@ def render_correlation_impact(
     tabs: List[Panel] = []
     tooltips = [("x", "@x"), ("y", "@y"), ("correlation", "@correlation{1.11}")]
 
-    for method, df in itmdt["data"].items():
+    for method, df in _enabled_methods(itmdt["data"], cfg).items():
         # in case of numerical column names
         df = df.copy()
         df["x"] = df["x"].apply(str)
@@ -139,7 +140,7 @@ def render_correlation_impact(
             x_axis_location="below",
             tools="hover",
             toolbar_location=None,
-            tooltips=tooltips,
+            tooltips=tooltips + _ci_tooltips(df),
             background_fill_color="#fafafa",
             title=" ",
         )
@@ -161,8 +162,8 @@ def render_correlation_impact(
         tabs.append(tab)
 
     return {
-        "insights": itmdt["insights"],
-        "tabledata": itmdt["tabledata"],
+        "insights": _enabled_methods(itmdt["insights"], cfg) if cfg.insight.enable else {},
+        "tabledata": itmdt["tabledata"] if cfg.stats.enable else {},
         "layout": [panel.child for panel in tabs],
         "meta": [panel.title for panel in tabs],
         "container_width": plot_width + 150,
@@ -170,6 +171,27 @@ def render_correlation_impact(
     }
 
 
+def _enabled_methods(data: Dict[str, Any], cfg: Config) -> Dict[str, Any]:
+    """
+    The entries of the enabled correlation methods, an intermediate from the cache
+    may have been computed with more methods enabled
+    """
+    enabled = {
+        "Pearson": cfg.pearson.enable,
+        "Spearman": cfg.spearman.enable,
+        "KendallTau": cfg.kendall.enable,
+    }
+    return {method: val for method, val in data.items() if enabled[method]}
+
+
+def _ci_tooltips(df: pd.DataFrame) -> List[Tuple[str, str]]:
+    """
+    The tooltips of the bounds of the confidence intervals of the correlations,
+    given for the sampled Kendall tau
+    """
+    return [(key, f"@{key}{{1.11}}") for key in ("lower", "upper") if key in df.columns]
+
+
 def corr_how_to_guides(cfg: Config, height: int, width: int) -> Dict[str, List[Tuple[str, str]]]:
     """
     How-to guide for correlation_impact
@@ -188,21 +210,30 @@ def corr_how_to_guides(cfg: Config, height: int, width: int) -> Dict[str, List[T
 
 def render_correlation_heatmaps(itmdt: Intermediate, plot_width: int, plot_height: int) -> Tabs:
     """
-    Render correlation heatmaps in to tabs
+    Render correlation heatmaps in to tabs. The tabs share the ranges and the color
+    mapper, and, when the methods are computed on the same pairs of columns, one
+    source holding the correlations of every method, so that the column names and
+    the palette are serialized once
     """
     tabs: List[Panel] = []
-    tooltips = [("x", "@x"), ("y", "@y"), ("correlation", "@correlation{1.11}")]
-    axis_range = itmdt["axis_range"]
-
-    for method, df in itmdt["data"].items():
-        # in case of numerical column names
-        df = df.copy()
-        df["x"] = df["x"].apply(str)
-        df["y"] = df["y"].apply(str)
+    dfs = itmdt["data"]
+
+    shared = _shared_source(dfs)
+    mapper = create_color_mapper(RDBU)[0]
+    x_range = FactorRange(*itmdt["axis_range"])
+    y_range = FactorRange(*reversed(itmdt["axis_range"]))
+
+    for method, df in dfs.items():
+        field = method if shared is not None else "correlation"
+        if shared is not None:
+            source = shared
+        else:
+            # in case of numerical column names
+            df = df.copy()
+            df["x"] = df["x"].apply(str)
+            df["y"] = df["y"].apply(str)
+            source = ColumnDataSource(df)
 
-        mapper, color_bar = create_color_mapper(RDBU)
-        x_range = FactorRange(*axis_range)
-        y_range = FactorRange(*reversed(axis_range))
         fig = Figure(
             x_range=x_range,
             y_range=y_range,
@@ -211,7 +242,7 @@ def render_correlation_heatmaps(itmdt: Intermediate, plot_width: int, plot_heigh
             x_axis_location="below",
             tools="hover",
             toolbar_location=None,
-            tooltips=tooltips,
+            tooltips=[("x", "@x"), ("y", "@y"), ("correlation", f"@{{{field}}}{{1.11}}")],
             background_fill_color="#fafafa",
         )
 
@@ -222,12 +253,12 @@ def render_correlation_heatmaps(itmdt: Intermediate, plot_width: int, plot_heigh
             y="y",
             width=1,
             height=1,
-            source=df,
-            fill_color={"field": "correlation", "transform": mapper},
+            source=source,
+            fill_color={"field": field, "transform": mapper},
             line_color=None,
         )
 
-        fig.add_layout(color_bar, "right")
+        fig.add_layout(create_color_bar(mapper), "right")
         tab = Panel(child=fig, title=method)
         tabs.append(tab)
 
@@ -235,6 +266,23 @@ def render_correlation_heatmaps(itmdt: Intermediate, plot_width: int, plot_heigh
     return tabs
 
 
+def _shared_source(dfs: Dict[str, pd.DataFrame]) -> Optional[ColumnDataSource]:
+    """
+    One source holding the correlations of every method, None when the methods
+    are not computed on the same pairs of columns
+    """
+    first = next(iter(dfs.values()), None)
+    if first is None or not all(
+        df.index.equals(first.index) and df[["x", "y"]].equals(first[["x", "y"]])
+        for df in dfs.values()
+    ):
+        return None
+    # in case of numerical column names
+    data = {"x": first["x"].apply(str), "y": first["y"].apply(str)}
+    data.update((method, df["correlation"]) for method, df in dfs.items())
+    return ColumnDataSource(data)
+
+
 def render_correlation_single_heatmaps(
     itmdt: Intermediate, plot_width: int, plot_height: int, cfg: Config
 ) -> Dict[str, Any]:
@@ -244,7 +292,7 @@ def render_correlation_single_heatmaps(
     tabs: List[Panel] = []
     tooltips = [("y", "@y"), ("correlation", "@correlation{1.11}")]
 
-    for method, df in itmdt["data"].items():
+    for method, df in _enabled_methods(itmdt["data"], cfg).items():
         mapper, color_bar = create_color_mapper(RDBU)
 
         x_range = FactorRange(*df["x"].unique())
@@ -257,7 +305,7 @@ def render_correlation_single_heatmaps(
             x_axis_location="below",
             tools="hover",
             toolbar_location=None,
-            tooltips=tooltips,
+            tooltips=tooltips + _ci_tooltips(df),
             title=" ",
         )
 
@@ -291,7 +339,14 @@ def create_color_mapper(palette: Sequence[str]) -> Tuple[LinearColorMapper, Colo
     Create a color mapper and a colorbar for heatmap
     """
     mapper = LinearColorMapper(palette=palette, low=-1, high=1)
-    colorbar = ColorBar(
+    return mapper, create_color_bar(mapper)
+
+
+def create_color_bar(mapper: LinearColorMapper) -> ColorBar:
+    """
+    Create a colorbar for the color mapper of a heatmap
+    """
+    return ColorBar(
         color_mapper=mapper,
         major_label_text_font_size="8pt",
         ticker=BasicTicker(),
@@ -300,7 +355,6 @@ def create_color_mapper(palette: Sequence[str]) -> Tuple[LinearColorMapper, Colo
         border_line_color=None,
         location=(0, 0),
     )
-    return mapper, colorbar
 
 
 ######### Scatter #########
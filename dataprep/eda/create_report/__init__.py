@@ -8,6 +8,7 @@ from bokeh.resources import INLINE
 from jinja2 import Environment, PackageLoader
 
 from ..configs import Config
+from ..distribution import Profile
 from .formatter import format_report
 from .report import Report
 
@@ -33,7 +34,9 @@ def create_report(
     Parameters
     ----------
     df
-        The DataFrame for which data are calculated.
+        The DataFrame for which data are calculated. The report needs the rows,
+        so a Profile (see compute_profile) is not accepted, plot(profile) renders
+        its overview.
     config
         A dictionary for configuring the visualizations
         E.g. config={"hist.bins": 20}
@@ -57,14 +60,21 @@ def create_report(
     >>> report = create_report(df)
     >>> report # show report in notebook
     >>> report.save('My Fantastic Report') # save report to local disk
+    >>> report.save('My Fantastic Report', compress=True, resources='cdn') # a smaller copy
     >>> report.show_browser() # show report in the browser
     """
+    if isinstance(df, Profile):
+        raise TypeError(
+            "create_report needs a DataFrame, not a Profile: its sketches only hold the "
+            "overview of the columns, use plot(profile) to render it"
+        )
     cfg = Config.from_dict(display, config)
+    resources = INLINE.render()
     context = {
-        "resources": INLINE.render(),
+        "resources": resources,
         "title": title,
         "components": format_report(df, cfg, mode, progress),
     }
     template_base = ENV_LOADER.get_template("base.html")
     report = template_base.render(context=context)
-    return Report(report)
+    return Report(report, resources)
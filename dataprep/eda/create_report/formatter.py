@@ -1,14 +1,26 @@
 """This module implements the formatting
 for create_report(df) function."""  # pylint: disable=line-too-long,
 
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Any, Dict, List, Optional, Tuple, Union
 from warnings import catch_warnings, filterwarnings
 
 import dask
 import dask.dataframe as dd
+import numpy as np
 import pandas as pd
+from bokeh.core.json_encoder import serialize_json
+from bokeh.core.templates import MACROS, ROOT_DIV
 from bokeh.embed import components
+from bokeh.embed.util import OutputDocumentFor, standalone_docs_json_and_render_items
+from bokeh.model import Model
+from bokeh.models import ColumnDataSource
+from bokeh.settings import settings as bokeh_settings
 from bokeh.plotting import Figure
+from ..cache import cached_compute
 from ..configs import Config
 from ..correlation import render_correlation
 from ..correlation.compute.overview import correlation_nxn
@@ -16,6 +28,8 @@ from ..data_array import DataArray
 from ..distribution import render
 from ..utils import _calc_line_dt
 from ..distribution.compute.overview import calc_stats
+from ..distribution.compute.common import cont_col_histograms
+from ..distribution.compute.profile import nom_profile
 from ..distribution.compute.univariate import calc_stats_dt, cont_comps, nom_comps
 from ..distribution.render import format_cat_stats, format_num_stats, format_ov_stats, stats_viz_dt
 from ..distribution.compute.overview import (
@@ -30,7 +44,7 @@ from ..dtypes import (
     Continuous,
     DateTime,
     Nominal,
-    detect_dtype,
+    detect_dtypes,
     is_dtype,
 )
 from ..intermediate import Intermediate
@@ -40,6 +54,13 @@ from ...progress_bar import ProgressBar
 from ..utils import preprocess_dataframe
 
 
+# the sections of the report, format_basic skips the data of the disabled ones
+REPORT_SECTIONS = ("overview", "variables", "interactions", "correlations", "missingvalues")
+
+# the minimal length of a numerical column to be serialized as a base64 array
+BINARY_MIN_SIZE = 32
+
+
 def format_report(
     df: Union[pd.DataFrame, dd.DataFrame],
     cfg: Config,
@@ -68,9 +89,10 @@ def format_report(
         This variable acts like an API in passing data to the template engine.
     """
     with ProgressBar(minimum=1, disable=not progress):
-        df = preprocess_dataframe(df)
         if mode == "basic":
-            comps = format_basic(df, cfg)
+            setattr(getattr(cfg, "plot"), "report", True)
+            data, dtypes = cached_compute(compute_basic, df, cfg=cfg, sections=REPORT_SECTIONS)
+            comps = format_basic(data, dtypes, cfg)
         # elif mode == "full":
         #     comps = format_full(df)
         # elif mode == "minimal":
@@ -80,26 +102,27 @@ def format_report(
     return comps
 
 
-def format_basic(df: dd.DataFrame, cfg: Config) -> Dict[str, Any]:
+def compute_basic(
+    df: Union[pd.DataFrame, dd.DataFrame], cfg: Config
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
-    Format basic version.
+    Compute the data of the basic version.
 
     Parameters
     ----------
     df
         The DataFrame for which data are calculated.
     cfg
-        The config dict user passed in. E.g. config =  {"hist.bins": 20}
-        Without user's specifications, the default is "auto"
+        The config instance
+
     Returns
     -------
-    Dict[str, Any]
-        A dictionary in which formatted data is stored.
-        This variable acts like an API in passing data to the template engine.
+    Tuple[Dict[str, Any], Dict[str, Any]]
+        The computed data, where the missing values are completed into their
+        intermediate, and the types of the columns.
     """
-    # pylint: disable=too-many-locals,too-many-statements,too-many-branches
+    df = preprocess_dataframe(df)
     # aggregate all computations
-    setattr(getattr(cfg, "plot"), "report", True)
     if cfg.missingvalues.enable:
         data, completions = basic_computations(df, cfg)
     else:
@@ -115,7 +138,40 @@ def format_basic(df: dd.DataFrame, cfg: Config) -> Dict[str, Any]:
             "overflow encountered in long_scalars",
             category=RuntimeWarning,
         )
+        filterwarnings(
+            "ignore",
+            "divide by zero encountered in double_scalars",
+            category=RuntimeWarning,
+        )
         (data,) = dask.compute(data)
+    if cfg.missingvalues.enable:
+        data["miss"] = completions["miss"](data["miss"])
+    dtypes = detect_dtypes(df)
+    if cfg.variables.enable:
+        _pick_dt_comps(data, dtypes)
+    return data, dtypes
+
+
+def format_basic(data: Dict[str, Any], dtypes: Dict[str, Any], cfg: Config) -> Dict[str, Any]:
+    """
+    Format basic version.
+
+    Parameters
+    ----------
+    data
+        The computed data, see compute_basic
+    dtypes
+        The types of the columns
+    cfg
+        The config dict user passed in. E.g. config =  {"hist.bins": 20}
+        Without user's specifications, the default is "auto"
+    Returns
+    -------
+    Dict[str, Any]
+        A dictionary in which formatted data is stored.
+        This variable acts like an API in passing data to the template engine.
+    """
+    # pylint: disable=too-many-locals,too-many-statements,too-many-branches
     # results dictionary
     res: Dict[str, Any] = {}
     # overview
@@ -138,46 +194,9 @@ def format_basic(df: dd.DataFrame, cfg: Config) -> Dict[str, Any]:
 
     # variables
     if cfg.variables.enable:
-        res["variables"] = {}
+        res["variables"] = format_variables(data, dtypes, cfg)
         res["has_variables"] = True
-        for col in df.columns:
-            stats: Any = None  # needed for pylint
-            if is_dtype(detect_dtype(df[col]), Continuous()):
-                itmdt = Intermediate(col=col, data=data[col], visual_type="numerical_column")
-                stats = format_num_stats(data[col])
-            elif is_dtype(detect_dtype(df[col]), Nominal()):
-                itmdt = Intermediate(col=col, data=data[col], visual_type="categorical_column")
-                stats = format_cat_stats(
-                    data[col]["stats"], data[col]["len_stats"], data[col]["letter_stats"]
-                )
-            elif is_dtype(detect_dtype(df[col]), DateTime()):
-                itmdt = Intermediate(
-                    col=col,
-                    data=data[col]["stats"],
-                    line=data[col]["line"],
-                    visual_type="datetime_column",
-                )
-                stats = stats_viz_dt(data[col]["stats"])
-            rndrd = render(itmdt, cfg)
-            layout = rndrd["layout"]
-            figs_var: List[Figure] = []
-            for tab in layout:
-                try:
-                    fig = tab.children[0]
-                except AttributeError:
-                    fig = tab
-                # fig.title = Title(text=tab.title, align="center")
-                figs_var.append(fig)
-            comp = components(figs_var)
-            insight_keys = list(rndrd["insights"].keys())[2:] if rndrd["insights"] else []
-            res["variables"][col] = {
-                "tabledata": stats,
-                "plots": comp,
-                "col_type": itmdt.visual_type.replace("_column", ""),
-                "tab_name": rndrd["meta"],
-                "plots_tab": zip(comp[1][1:], rndrd["meta"][1:], insight_keys),
-                "insights_tab": rndrd["insights"],
-            }
+        res["lazy_variables"] = cfg.variables.lazy
     else:
         res["has_variables"] = False
 
@@ -188,6 +207,7 @@ def format_basic(df: dd.DataFrame, cfg: Config) -> Dict[str, Any]:
             itmdt = Intermediate(data=data["scat"], visual_type="correlation_crossfilter")
             rndrd = render_correlation(itmdt, cfg)
             rndrd.sizing_mode = "stretch_width"
+            encode_sources([rndrd])
             res["interactions"] = components(rndrd)
 
         # correlations
@@ -216,6 +236,7 @@ def format_basic(df: dd.DataFrame, cfg: Config) -> Dict[str, Any]:
                 fig.sizing_mode = "stretch_width"
                 figs_corr.append(fig)
                 res["correlation_names"].append(tab.title)
+            encode_sources(figs_corr)
             res["correlations"] = components(figs_corr)
 
     else:
@@ -224,9 +245,7 @@ def format_basic(df: dd.DataFrame, cfg: Config) -> Dict[str, Any]:
     # missing
     if cfg.missingvalues.enable:
         res["has_missing"] = True
-        itmdt = completions["miss"](data["miss"])
-
-        rndrd = render_missing(itmdt, cfg)
+        rndrd = render_missing(data["miss"], cfg)
         figs_missing: List[Figure] = []
         for fig in rndrd["layout"]:
             fig.sizing_mode = "stretch_width"
@@ -236,12 +255,164 @@ def format_basic(df: dd.DataFrame, cfg: Config) -> Dict[str, Any]:
             #     text_font_size="20px",
             # )
             figs_missing.append(fig)
+        encode_sources(figs_missing)
         res["missing"] = components(figs_missing)
         res["missing_tabs"] = ["Bar Chart", "Spectrum", "Heat Map", "Dendogram"]
 
     return res
 
 
+def format_variables(
+    data: Dict[str, Any], dtypes: Dict[str, Any], cfg: Config
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Render the figures and the stats of the variables section. By default the
+    columns are rendered in this process. With cfg.variables.workers other than 1,
+    they are rendered by a pool of processes, and the results are collected in the
+    order of the columns. The pool needs the "fork" start method, where it is not
+    available the columns are rendered in this process.
+
+    Parameters
+    ----------
+    data
+        The computed data of the report
+    dtypes
+        The types of the columns
+    cfg
+        The config instance
+    """
+    args = [(col, col_dtype, data[col]) for col, col_dtype in dtypes.items()]
+    workers = min(cfg.variables.workers or os.cpu_count() or 1, len(args))
+    if workers > 1 and "fork" in mp.get_all_start_methods():
+        with ProcessPoolExecutor(
+            workers, mp_context=mp.get_context("fork"), initializer=_init_render_worker
+        ) as pool:
+            chunksize = -(-len(args) // (4 * workers))
+            rendered = list(pool.map(partial(_format_variable, cfg=cfg), args, chunksize=chunksize))
+    else:
+        rendered = [_format_variable(arg, cfg) for arg in args]
+
+    variables = {}
+    for (col, _, _), var in zip(args, rendered):
+        insight_keys = var.pop("insight_keys")
+        var["plots_tab"] = zip(var["plots"][1][1:], var["tab_name"][1:], insight_keys)
+        variables[col] = var
+    return variables
+
+
+def _init_render_worker() -> None:
+    """
+    Make the ids of the Bokeh models unique across the rendering processes
+    """
+    bokeh_settings.simple_ids.set_value(False)
+
+
+def _format_variable(arg: Tuple[str, Any, Dict[str, Any]], cfg: Config) -> Dict[str, Any]:
+    """
+    Render the figures and the stats of a column
+    """
+    col, col_dtype, dat = arg
+    stats: Any = None  # needed for pylint
+    if is_dtype(col_dtype, DateTime()) and "line" not in dat:
+        col_dtype = Nominal()  # all-nan datetime column, see _pick_dt_comps
+    if is_dtype(col_dtype, Continuous()):
+        itmdt = Intermediate(col=col, data=dat, visual_type="numerical_column")
+        stats = format_num_stats(dat)
+    elif is_dtype(col_dtype, Nominal()):
+        itmdt = Intermediate(col=col, data=dat, visual_type="categorical_column")
+        stats = format_cat_stats(dat["stats"], dat["len_stats"], dat["letter_stats"])
+    elif is_dtype(col_dtype, DateTime()):
+        itmdt = Intermediate(
+            col=col,
+            data=dat["stats"],
+            line=dat["line"],
+            visual_type="datetime_column",
+        )
+        stats = stats_viz_dt(dat["stats"])
+    rndrd = render(itmdt, cfg)
+    layout = rndrd["layout"]
+    figs_var: List[Figure] = []
+    for tab in layout:
+        try:
+            fig = tab.children[0]
+        except AttributeError:
+            fig = tab
+        # fig.title = Title(text=tab.title, align="center")
+        figs_var.append(fig)
+    encode_sources(figs_var)
+    comp = lazy_components(figs_var) if cfg.variables.lazy else components(figs_var)
+    return {
+        "tabledata": stats,
+        "plots": comp,
+        "col_type": itmdt.visual_type.replace("_column", ""),
+        "tab_name": rndrd["meta"],
+        "insight_keys": list(rndrd["insights"].keys())[2:] if rndrd["insights"] else [],
+        "insights_tab": rndrd["insights"],
+    }
+
+
+def lazy_components(figs: List[Figure]) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Like bokeh.embed.components, but instead of a script that renders the figures
+    when the page loads, the figures are serialized as one JSON document in a
+    <script type="application/json"> tag. The document is rendered by the
+    embedVariable function of the report once the variable is scrolled into view.
+
+    Parameters
+    ----------
+    figs
+        The figures of a variable
+
+    Returns
+    -------
+    Tuple[str, Tuple[str, ...]]
+        The JSON script tag and the divs of the figures
+    """
+    with OutputDocumentFor(figs):
+        docs_json, render_items = standalone_docs_json_and_render_items(figs)
+    chunk = serialize_json(
+        {"docs": docs_json, "items": [item.to_json() for item in render_items]}, pretty=False
+    )
+    # textContent returns the tag verbatim and JSON.parse does not decode entities,
+    # so only "</", which would end the tag early, is escaped as the JSON "<\/"
+    chunk = chunk.replace("</", "<\\/")
+    script = f'<script type="application/json" class="var-doc">{chunk}</script>'
+    divs = tuple(ROOT_DIV.render(root=root, macros=MACROS) for root in render_items[0].roots)
+    return script, divs
+
+
+def encode_sources(models: List[Model]) -> None:
+    """
+    Cast the float columns of the data sources of the models to float64 or float32,
+    which Bokeh serializes as base64 arrays. Lists of floats and the other float
+    dtypes are serialized as JSON lists of numbers, which are about twice as large
+    and much slower to parse in the browser. Integers are left alone, they are about
+    as short in JSON as in base64. So are the columns shorter than BINARY_MIN_SIZE,
+    whose saving is outweighed by the header of a base64 array.
+
+    Parameters
+    ----------
+    models
+        The figures or layouts to be embedded
+    """
+    for model in models:
+        for source in model.select({"type": ColumnDataSource}):
+            # assigning a new dict keeps the old columns that compare equal to the new ones
+            source.data.update({key: _encode_column(col) for key, col in source.data.items()})
+
+
+def _encode_column(col: Any) -> Any:
+    """
+    Cast a float column to a dtype of bokeh.util.serialization.BINARY_ARRAY_TYPES
+    """
+    if not isinstance(col, (list, tuple, np.ndarray, pd.Series)) or len(col) < BINARY_MIN_SIZE:
+        return col
+    arr = np.asarray(col)
+    if arr.ndim != 1 or arr.dtype.kind != "f":
+        return col
+    return arr.astype(np.float32 if arr.dtype == np.float32 else np.float64, copy=False)
+
+
 def basic_computations(
     df: dd.DataFrame, cfg: Config
 ) -> Union[Tuple[Dict[str, Any], Dict[str, Any]], Any]:
@@ -262,48 +433,56 @@ def basic_computations(
     data["num_cols"] = df_num.columns
     first_rows = df.head
 
+    dtypes = detect_dtypes(df.frame)
+
+    if cfg.variables.enable or cfg.overview.enable:
+        # An all-nan numerical column is detected as Nominal since it has
+        # only one distinct value, so it is transformed to string below.
+        nom_cols = [col for col in df.columns if is_dtype(dtypes[col], Nominal())]
+        if nom_cols:
+            # Since it will throw error if column is object while some cells are
+            # numerical, we transform column to string first. All the columns are
+            # cast at once, a cast per column copies the partitions each time.
+            df.frame[nom_cols] = df.frame[nom_cols].astype(str)
+        # the values of all the nominal columns are counted together
+        noms = nom_profile(df.frame[nom_cols], cfg.wordlen.bins) if nom_cols else {}
+
     # variables
     if cfg.variables.enable:
         for col in df.columns:
-            npres = dask.compute(df.frame[col].dropna().shape[0])
-            # Since it will throw error if a numerical column is all-nan,
-            # we transform it to categorical column
-            if npres[0] == 0:
-                df.frame[col] = df.frame[col].astype(str)
-                data[col] = nom_comps(df.frame[col], df.frame[col].head(), cfg)
-            elif is_dtype(detect_dtype(df.frame[col]), Nominal()):
-                # Since it will throw error if column is object while some cells are
-                # numerical, we transform column to string first.
-                df.frame[col] = df.frame[col].astype(str)
-                data[col] = nom_comps(df.frame[col], first_rows[col], cfg)
-            elif is_dtype(detect_dtype(df.frame[col]), Continuous()):
+            col_dtype = dtypes[col]
+            if is_dtype(col_dtype, Nominal()):
+                data[col] = nom_comps(df.frame[col], first_rows[col], cfg, noms[col])
+            elif is_dtype(col_dtype, Continuous()):
                 data[col] = cont_comps(df.frame[col], cfg)
-            elif is_dtype(detect_dtype(df.frame[col]), DateTime()):
-                data[col] = {}
-                data[col]["stats"] = calc_stats_dt(df.frame[col])
-                data[col]["line"] = dask.delayed(_calc_line_dt)(df.frame[[col]], "auto")
+            elif is_dtype(col_dtype, DateTime()):
+                # Whether the column is all-nan is only known after the compute, so
+                # the Nominal computations are built too, on the all-nan partitions
+                # only, and compute_basic keeps one of the two.
+                data[col] = {
+                    "stats": calc_stats_dt(df.frame[col]),
+                    "line": dask.delayed(_calc_dt_line)(df.frame[[col]]),
+                    "nominal": nom_comps(
+                        df.frame[col].map_partitions(_nan_partition_str, meta=(col, object)),
+                        first_rows[col].astype(str),
+                        cfg,
+                    ),
+                }
     # overview
     if cfg.overview.enable:
         data["ov"] = calc_stats(df.frame, cfg, None)
-        head: pd.DataFrame = df.head
         data["insights"] = []
+        # the histograms of all the continuous columns are computed together
+        cont_cols = [col for col in df.columns if is_dtype(dtypes[col], Continuous())]
+        hists = cont_col_histograms(df.frame, cont_cols, cfg.hist.bins)
         for col in df.columns:
-            col_dtype = detect_dtype(df.frame[col])
+            col_dtype = dtypes[col]
             if is_dtype(col_dtype, Continuous()):
                 data["insights"].append(
-                    (col, Continuous(), _cont_calcs(df.frame[col].dropna(), cfg))
+                    (col, Continuous(), _cont_calcs(df.frame[col].dropna(), hists[col], cfg))
                 )
             elif is_dtype(col_dtype, Nominal()):
-                # Since it will throw error if column is object while some cells are
-                # numerical, we transform column to string first.
-                df.frame[col] = df.frame[col].astype(str)
-                data["insights"].append(
-                    (col, Nominal(), _nom_calcs(df.frame[col].dropna(), head[col], cfg))
-                )
-            elif is_dtype(col_dtype, DateTime()):
-                data["insights"].append(
-                    (col, DateTime(), dask.delayed(_calc_line_dt)(df.frame[[col]], cfg.line.unit))
-                )
+                data["insights"].append((col, Nominal(), _nom_calcs(col, noms[col], cfg)))
 
     # interactions
     if cfg.interactions.enable:
@@ -329,6 +508,39 @@ def basic_computations(
         return data
 
 
+def _calc_dt_line(df: pd.DataFrame) -> Any:
+    """
+    The line chart of a datetime column, None for an all-nan column since the
+    line chart needs at least one timestamp
+    """
+    if df[df.columns[0]].count() == 0:
+        return None
+    return _calc_line_dt(df, "auto")
+
+
+def _nan_partition_str(srs: pd.Series) -> pd.Series:
+    """
+    A partition of a datetime column as strings if all its values are nan, and
+    empty otherwise. For an all-nan column, this is the whole column as strings.
+    """
+    if srs.count() == 0:
+        return srs.astype(str)
+    return srs.iloc[:0].astype(str)
+
+
+def _pick_dt_comps(data: Dict[str, Any], dtypes: Dict[str, Any]) -> None:
+    """
+    Keep the computations of a Nominal column for an all-nan datetime column,
+    those of a datetime column otherwise, see basic_computations
+    """
+    for col, col_dtype in dtypes.items():
+        if is_dtype(col_dtype, DateTime()):
+            comps = data[col]
+            nominal = comps.pop("nominal")
+            if comps["line"] is None:
+                data[col] = nominal
+
+
 # def cont_comps_brief(srs: dd.Series, cfg: Config) -> Dict[str, Any]:
 #
 #     """
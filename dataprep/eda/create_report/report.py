@@ -1,12 +1,15 @@
 """
     This module implements the Report class.
 """
+import gzip
 import sys
 import webbrowser
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import Optional
 
+from bokeh.resources import CDN
+
 from ...utils import is_notebook
 
 CELL_HEIGHT_OVERRIDE = """<style>
@@ -24,8 +27,10 @@ class Report:
     This class creates a customized Report object for the create_report function
     """
 
-    def __init__(self, report: str) -> None:
+    def __init__(self, report: str, resources: Optional[str] = None) -> None:
         self.report = report
+        # the inline BokehJS of the report, replaced when saving with CDN resources
+        self.resources = resources
 
     def _repr_html_(self) -> str:
         """
@@ -43,6 +48,9 @@ class Report:
         self,
         filename: Optional[str] = "report",
         to: Optional[str] = None,
+        *,
+        compress: bool = False,
+        resources: str = "inline",
     ) -> None:
         """
         Save report to current working directory.
@@ -53,6 +61,13 @@ class Report:
             The filename used for saving report without the extension name.
         to: Optional[str], default Path.cwd()
             The path to where the report will be saved.
+        compress: bool, default False
+            Whether to save the report gzip-compressed as filename.html.gz, e.g. to be
+            served with "Content-Encoding: gzip".
+        resources: str, default 'inline'
+            Where the report loads BokehJS from. 'inline' embeds it in the report,
+            'cdn' links it from cdn.bokeh.org, which makes the report about 1.3 MB
+            smaller but needs an internet connection to be viewed.
         """
         # pylint: disable=invalid-name
         if to:
@@ -63,9 +78,24 @@ class Report:
         if not path.is_dir():
             raise ValueError("The second parameter is not a valid path.")
 
-        with open(path / f"{filename}.html", "w", encoding="utf-8") as file:
-            file.write(self.report)
-        print(f"Report has been saved to {path}/{filename}.html!")
+        if resources == "inline":
+            report = self.report
+        elif resources == "cdn":
+            if self.resources is None or self.resources not in self.report:
+                raise ValueError("The report has no inline resources to be replaced.")
+            report = self.report.replace(self.resources, CDN.render(), 1)
+        else:
+            raise ValueError(f"Unknown resources: {resources}")
+
+        if compress:
+            filename = f"{filename}.html.gz"
+            with gzip.open(path / filename, "wt", encoding="utf-8") as file:
+                file.write(report)
+        else:
+            filename = f"{filename}.html"
+            with open(path / filename, "w", encoding="utf-8") as file:
+                file.write(report)
+        print(f"Report has been saved to {path}/{filename}!")
 
     def show_browser(self) -> None:
         """
@@ -14,6 +14,9 @@ from .dtypes import CATEGORICAL_PANDAS_DTYPES, NUMERICAL_DTYPES
 
 DataFrame = Union[pd.DataFrame, dd.DataFrame, "DataArray"]
 
+# The number of set bits of each byte
+POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
 
 # class DataArray:
 #     """DataArray provides an abstraction over dask DataFrame
@@ -135,7 +138,7 @@ DataFrame = Union[pd.DataFrame, dd.DataFrame, "DataArray"]
 #         cidx = [self.columns.get_loc(col) for col in subdf.columns]
 #         df = DataArray(subdf)
 #         df._values = {col: self._values[col] for col in df.columns}
-#         df._nulls = self.nulls[:, cidx]  # pylint: disable=W0212
+#         df._nulls = self._nulls[:, cidx]  # pylint: disable=W0212
 #         return df
 
 #     def select_num_columns(self) -> "DataArray":
@@ -179,7 +182,7 @@ class DataArray:
 
     _ddf: dd.DataFrame
     _values: da.Array
-    _nulls: Union[da.Array, np.ndarray]
+    _nulls: da.Array
     _columns: pd.Index
     _head: Optional[pd.DataFrame] = None
 
@@ -208,6 +211,7 @@ class DataArray:
         elif isinstance(df, DataArray):
             self._ddf = df._ddf
             self._values = df._values
+            self._nulls = df._nulls
             self._columns = df._columns
             return
         elif isinstance(df, pd.DataFrame):
@@ -228,8 +232,7 @@ class DataArray:
             self._values = self._ddf.to_dask_array(lengths=True)
         else:
             self._values = self._ddf.to_dask_array()
-        self._nulls = self.frame.isnull().to_dask_array()
-        self._nulls._chunks = self.values.chunks
+        self._nulls = pack_nulls(self.frame.isnull().to_dask_array(), self.values.chunks)
 
     @property
     def columns(self) -> pd.Index:
@@ -243,7 +246,17 @@ class DataArray:
 
     @property
     def nulls(self) -> da.Array:
-        """Return the nullity array of the data."""
+        """Return the nullity array of the data, unpacked block by block from
+        the packed nullity array if the lengths are computed."""
+        if np.isnan(self.shape[0]):
+            nulls = self.frame.isnull().to_dask_array()
+            nulls._chunks = self.values.chunks
+            return nulls
+        return unpack_nulls(self._nulls, self.values.chunks[0])
+
+    @property
+    def packed_nulls(self) -> da.Array:
+        """Return the nullity array of the data packed along the rows, see pack_nulls."""
         return self._nulls
 
     @property
@@ -283,10 +296,9 @@ class DataArray:
             not_computed = np.isnan(self.shape[0])
             if not_computed:
                 self._values = self.frame.to_dask_array(lengths=True)
-                self._nulls = self.frame.isnull().to_dask_array()
-                self._nulls._chunks = self.values.chunks
+                self._nulls = pack_nulls(self.frame.isnull().to_dask_array(), self.values.chunks)
         elif type == "nulls":
-            x = self.nulls
+            x = self.frame.isnull().to_dask_array()
             # Copied from compute_chunk_sizes
             # pylint: disable=invalid-name
             chunk_shapes = x.map_blocks(
@@ -304,11 +316,11 @@ class DataArray:
 
                 c.append(tuple(chunk_shapes[s]))
 
-            chunks_, nulls = dask.compute(tuple(c), self.nulls)
+            chunks_, packed = dask.compute(tuple(c), pack_nulls(x, x.chunks))
             chunks = tuple([tuple([int(chunk) for chunk in chunks]) for chunks in chunks_])
             # pylint: enable=invalid-name
-            self._nulls = nulls
             self._values._chunks = chunks
+            self._nulls = da.from_array(packed, chunks=(_packed_rows(chunks[0]), chunks[1]))
         else:
             raise ValueError(f"{type} not supported.")
 
@@ -338,12 +350,64 @@ class DataArray:
             if df._values.dtype != dtype:
                 df._values = df._values.astype(dtype)
 
-        df._nulls = self.nulls[:, cidx]  # pylint: disable=W0212
+        df._nulls = self._nulls[:, cidx]  # pylint: disable=W0212
         if self._head is not None:
             df._head = self.head[subdf.columns]  # pylint: disable=W0212
         return df
 
 
+def pack_nulls(nulls: da.Array, chunks: Tuple[Tuple[float, ...], ...]) -> da.Array:
+    """Pack a boolean nullity array along the rows by np.packbits, 8 rows a byte.
+    Each row block is packed on its own, so the block of r rows is packed into
+    ceil(r / 8) rows of bytes whose last bits are zeros.
+
+    Parameters
+    ----------
+    nulls
+        The boolean nullity array
+    chunks
+        The chunks of the nullity array, the row lengths may be unknown
+    """
+    return nulls.map_blocks(
+        np.packbits, axis=0, dtype=np.uint8, chunks=(_packed_rows(chunks[0]), chunks[1])
+    )
+
+
+def unpack_nulls(packed: da.Array, rows: Tuple[int, ...]) -> da.Array:
+    """Unpack a nullity array packed by pack_nulls.
+
+    Parameters
+    ----------
+    packed
+        The packed nullity array
+    rows
+        The numbers of rows of the blocks of the nullity array
+    """
+    return packed.map_blocks(
+        _unpack_block,
+        rows=rows,
+        dtype=bool,
+        chunks=(rows, packed.chunks[1]),
+        meta=np.empty((0, 0), dtype=bool),
+    )
+
+
+def popcount(packed: da.Array) -> da.Array:
+    """The number of null values of each byte of a packed nullity array."""
+    return packed.map_blocks(POPCOUNT.take, dtype=np.uint8)
+
+
+def _packed_rows(rows: Tuple[float, ...]) -> Tuple[float, ...]:
+    """The numbers of rows of the blocks of a packed nullity array."""
+    return tuple(np.nan if np.isnan(row) else -(-int(row) // 8) for row in rows)
+
+
+def _unpack_block(block: np.ndarray, rows: Tuple[int, ...], block_info: Any = None) -> np.ndarray:
+    """Unpack a block of a packed nullity array."""
+    count = rows[block_info[0]["chunk-location"][0]]
+    return np.unpackbits(block, axis=0, count=count).view(bool)
+
+
 def _get_chunk_shape(arr: np.ndarray) -> np.ndarray:
     """Given an (x,y,...) N-d array, returns (1,1,...,N) N+1-d array"""
     shape = np.asarray(arr.shape, dtype=int)
@@ -16,13 +16,14 @@ from ...dtypes import (
     Nominal,
     Continuous,
     DateTime,
-    detect_dtype,
+    detect_dtypes,
     get_dtype_cnts_and_num_cols,
     is_dtype,
     drop_null,
     DTypeDef,
 )
 from ...configs import Config
+from ...distribution.compute.common import memory_usage, nrows_distinct
 
 
 class Dfs(UserList):
@@ -160,10 +161,11 @@ def compare_multiple_df(
 
     # OrderedDict for keeping the order
     uniq_cols = list(OrderedDict.fromkeys(sum(dfs_cols, [])))
+    dfs_dtypes = dfs.self_map(detect_dtypes, known_dtype=dtype)
 
     for col in uniq_cols:
         srs = Srs(aligned_dfs[col])
-        col_dtype = srs.self_map(detect_dtype, known_dtype=dtype)
+        col_dtype = [dtypes[col] for dtypes in dfs_dtypes if col in dtypes]
         if len(col_dtype) > 1:
             col_dtype = col_dtype[baseline]
         else:
@@ -217,8 +219,10 @@ def calc_stats(dfs: Dfs, cfg: Config, dtype: Optional[DTypeDef]) -> Dict[str, Li
 
         stats["ncols"] = dfs.shape.getidx(1)
         stats["npresent_cells"] = dfs.apply("count").apply("sum").data
-        stats["nrows_wo_dups"] = dfs.apply("drop_duplicates").shape.getidx(0)
-        stats["mem_use"] = dfs.apply("memory_usage", "deep=True").apply("sum").data
+        stats["nrows_wo_dups"] = [nrows_distinct(df, cfg.stats.duplicates) for df in dfs]
+        stats["mem_use"] = [
+            memory_usage(df, cfg.stats.mem_use, cfg.stats.mem_use__sample)[0] for df in dfs
+        ]
         stats["dtype_cnts"] = dtype_cnts
 
     return stats
@@ -7,18 +7,19 @@ from typing import Any, Dict, List, Optional, Union
 import dask.dataframe as dd
 import pandas as pd
 
+from ..cache import PLOT_SECTIONS, cached_compute
 from ..configs import Config
 from ..container import Container
 from ..dtypes import DTypeDef
 from ...progress_bar import ProgressBar
-from .compute import compute
+from .compute import Profile, compute, compute_profile
 from .render import render
 
-__all__ = ["plot", "compute", "render"]
+__all__ = ["plot", "compute", "render", "compute_profile", "Profile"]
 
 
 def plot(
-    df: Union[pd.DataFrame, dd.DataFrame],
+    df: Union[pd.DataFrame, dd.DataFrame, Profile],
     x: Optional[str] = None,
     y: Optional[str] = None,
     z: Optional[str] = None,
@@ -65,7 +66,8 @@ def plot(
     Parameters
     ----------
     df
-        DataFrame from which visualizations are generated
+        DataFrame from which visualizations are generated, or the Profile of a
+        DataFrame (see compute_profile) from which the overview is generated
     x: Optional[str], default None
         A valid column name from the dataframe
     y: Optional[str], default None
@@ -94,11 +96,12 @@ def plot(
     >>> plot(iris)
     >>> plot(iris, "petal_length")
     >>> plot(iris, "petal_width", "species")
+    >>> plot(compute_profile(iris))
     """
     cfg = Config.from_dict(display, config)
 
     with ProgressBar(minimum=1, disable=not progress):
-        itmdt = compute(df, x, y, z, cfg=cfg, dtype=dtype)
+        itmdt = cached_compute(compute, df, x, y, z, cfg=cfg, dtype=dtype, sections=PLOT_SECTIONS)
 
     to_render = render(itmdt, cfg)
 
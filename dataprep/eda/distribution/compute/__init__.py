@@ -13,15 +13,16 @@ from ...dtypes import DTypeDef, string_dtype_to_object, is_dtype, GeoPoint
 from ...intermediate import Intermediate
 from ...utils import preprocess_dataframe
 from .bivariate import compute_bivariate
-from .overview import compute_overview
+from .overview import compute_overview, compute_overview_profile
+from .sketch import Profile, compute_profile
 from .trivariate import compute_trivariate
 from .univariate import compute_univariate
 
-__all__ = ["compute"]
+__all__ = ["compute", "compute_profile", "Profile"]
 
 
 def compute(
-    df: Union[pd.DataFrame, dd.DataFrame],
+    df: Union[pd.DataFrame, dd.DataFrame, Profile],
     x: Optional[str] = None,
     y: Optional[str] = None,
     z: Optional[str] = None,
@@ -36,7 +37,8 @@ def compute(
     Parameters
     ----------
     df
-        DataFrame from which visualizations are generated
+        DataFrame from which visualizations are generated, or the Profile of a
+        DataFrame from which the overview is generated, see compute_profile
     cfg: Union[Config, Dict[str, Any], None], default None
         When a user call plot(), the created Config object will be passed to compute().
         When a user call compute() directly, if he/she wants to customize the output,
@@ -59,15 +61,20 @@ def compute(
     """
     # pylint: disable=too-many-arguments
 
-    params, exlude, ddf = process_latlong(df, x, y, z)
-    ddf = preprocess_dataframe(ddf, excluded_columns=exlude)
-
     if isinstance(cfg, dict):
         cfg = Config.from_dict(display, cfg)
 
     elif not cfg:
         cfg = Config()
 
+    if isinstance(df, Profile):
+        if any(v is not None for v in (x, y, z)):
+            raise ValueError("Only the overview can be computed from a Profile")
+        return compute_overview_profile(df, cfg)
+
+    params, exlude, ddf = process_latlong(df, x, y, z)
+    ddf = preprocess_dataframe(ddf, excluded_columns=exlude)
+
     if not any(params):
         return compute_overview(ddf, cfg, dtype)
 
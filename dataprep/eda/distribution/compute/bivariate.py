@@ -19,6 +19,7 @@ from ...dtypes import (
     is_dtype,
 )
 from ...intermediate import Intermediate
+from .profile import group_box_sketches, is_tdigest
 from ...utils import (
     DTMAP,
     _calc_box_otlrs,
@@ -205,10 +206,14 @@ def compute_bivariate(
             visual_type="two_cat_cols",
         )
     elif is_dtype(xtype, Continuous()) and is_dtype(ytype, Continuous()):
-        # one partition required for apply(pd.cut) in _calc_box_cont
-        df = df[[x, y]].dropna().repartition(npartitions=1)
+        df = df[[x, y]].dropna()
 
         data: Dict[str, Any] = {}
+        if cfg.box.enable:
+            # box plot
+            data["box"] = _calc_box_cont(df, cfg)
+
+        df = df.repartition(npartitions=1)
         if cfg.scatter.enable:
             # scatter plot data
             data["scat"] = df.map_partitions(
@@ -217,9 +222,6 @@ def compute_bivariate(
         if cfg.hexbin.enable:
             # hexbin plot data
             data["hex"] = df
-        if cfg.box.enable:
-            # box plot
-            data["box"] = _calc_box_cont(df, cfg)
 
         (data,) = dask.compute(data)
 
@@ -253,7 +255,7 @@ def _nom_cont_comps(df: dd.DataFrame, cfg: Config) -> Dict[str, Any]:
             thresh = cnts.nsmallest(cfg.box.ngroups).max()
             df_box = df[df[x].map(cnts) <= thresh]
         grps_box = df_box.groupby(x)[y]
-        data["box"] = grps_box.apply(_box_comps, meta=object)
+        data["box"] = _calc_box_nom(df_box, cfg)
         if (
             cfg.line.enable
             and cfg.box.sort_descending == cfg.line.sort_descending
@@ -301,7 +303,7 @@ def geo_cont_comps(df: dd.DataFrame, cfg: Config) -> Dict[str, Any]:
             thresh = cnts.nsmallest(cfg.box.ngroups).max()
             df_box = df[df[x].map(cnts) <= thresh]
         grps_box = df_box.groupby(x)[y]
-        data["box"] = grps_box.apply(_box_comps, meta=object)
+        data["box"] = _calc_box_nom(df_box, cfg)
         if (
             cfg.line.enable
             and cfg.box.sort_descending == cfg.line.sort_descending
@@ -346,14 +348,33 @@ def geop_cont_comps(df: dd.DataFrame) -> Dict[str, Any]:
     return data
 
 
-def _calc_box_cont(df: dd.DataFrame, cfg: Config) -> dd.Series:
+def _calc_box_nom(df: dd.DataFrame, cfg: Config) -> Any:
+    """
+    Box plot for each group of a nominal variable
+    """
+    x, y = df.columns
+    if is_tdigest(cfg.quantile.method):
+        boxes = group_box_sketches(df, cfg.quantile.compression)
+        return dask.delayed(_box_series, pure=True)(boxes, x)
+    return df.groupby(x)[y].apply(_box_comps, meta=object)
+
+
+def _calc_box_cont(df: dd.DataFrame, cfg: Config) -> Any:
     """
     Box plot for a binned continuous variable
     """
     x, y = df.columns
+    if is_tdigest(cfg.quantile.method):
+        # the bins are the same as pd.cut(bins=cfg.box.bins) over the whole column
+        edges = dask.delayed(_cut_edges, pure=True)(df[x].min(), df[x].max(), cfg.box.bins)
+        boxes = group_box_sketches(df, cfg.quantile.compression, edges)
+        return dask.delayed(_box_series, pure=True)(boxes, "grp", edges)
+
+    # one partition required for apply(pd.cut)
+    df = df.repartition(npartitions=1)
     # group the data into intervals
     # https://stackoverflow.com/questions/42442043/how-to-use-pandas-cut-or-equivalent-in-dask-efficiently
-    df["grp"] = df[x].map_partitions(pd.cut, bins=cfg.box.bins, include_lowest=True)
+    df = df.assign(grp=df[x].map_partitions(pd.cut, bins=cfg.box.bins, include_lowest=True))
     # TODO is this calculating the box plot stats for each group in parallel?
     # https://examples.dask.org/dataframes/02-groupby.html#Groupby-Apply
     # https://github.com/dask/dask/issues/4239
@@ -383,6 +404,41 @@ def _box_comps(srs: pd.Series) -> Dict[str, Union[float, np.array]]:
     return data
 
 
+def _cut_edges(minv: float, maxv: float, bins: int) -> np.ndarray:
+    """
+    The bin edges of pd.cut(srs, bins) for a column with the minimum minv and the
+    maximum maxv
+    """
+    if minv == maxv:
+        minv -= 0.001 * abs(minv) if minv != 0 else 0.001
+        maxv += 0.001 * abs(maxv) if maxv != 0 else 0.001
+        return np.linspace(minv, maxv, bins + 1)
+    edges = np.linspace(minv, maxv, bins + 1)
+    edges[0] -= (maxv - minv) * 0.001
+    return edges
+
+
+def _box_series(
+    boxes: Dict[Any, Dict[str, Any]], name: str, edges: Optional[np.ndarray] = None
+) -> pd.Series:
+    """
+    Arrange the box plot statistics of the groups (see group_box_sketches) like
+    the result of groupby(name).apply(_box_comps). If the groups are the bins of
+    the given edges, all the bins are included in order.
+    """
+    keys = ("q1", "q2", "q3", "lw", "uw", "otlrs")
+    empty = {key: np.nan for key in keys}
+    empty["otlrs"] = np.array([])
+    if edges is not None:
+        grps = list(pd.cut(edges[:1], edges, include_lowest=True).categories)
+        boxes = {grps[i]: boxes.get(i, empty) for i in range(len(grps))}
+    else:
+        boxes = {grp: boxes[grp] for grp in sorted(boxes)}
+    items = {(grp, key): box[key] for grp, box in boxes.items() for key in keys}
+    index = pd.MultiIndex.from_tuples(items.keys(), names=[name, None])
+    return pd.Series(list(items.values()), index=index, dtype=object)
+
+
 def _hist(srs: pd.Series, bins: int, minv: float, maxv: float) -> Any:
     """
     Compute a histogram on a given series
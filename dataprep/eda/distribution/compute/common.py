@@ -0,0 +1,423 @@
+"""Common parts for compute distribution."""
+import sys
+from functools import reduce
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import dask
+import dask.array as da
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+from dask.dataframe.hyperloglog import compute_hll_array, estimate_count
+from dask.delayed import Delayed
+from pandas.util import hash_pandas_object
+from scipy.stats import kstwobign
+
+from ...data_array import DataArray
+from ...dtypes import HLL_BITS
+
+# The number of per-partition results merged by one task of a tree reduction
+SPLIT_EVERY = 8
+
+# The z-score of the confidence bound of the sampled memory usage, a 95% interval
+MEMORY_Z = 1.96
+
+# The maximum number of pairs of columns tested by ks_pairs on the whole sample
+KS_MAX_PAIRS = 1000
+
+# The number of quantiles of each column which bound the statistics of all the pairs
+KS_GRID = 100
+
+# The maximum number of CDF evaluations of one vectorised step of ks_pairs
+KS_BLOCK = 1 << 20
+
+
+def tree_reduce(
+    parts: List[Any], merge: Callable[[List[Any]], Any], split_every: int = SPLIT_EVERY
+) -> Any:
+    """
+    Merge a list of delayed per-partition results into one delayed result
+    by a tree reduction, merge should be associative.
+
+    Parameters
+    ----------
+    parts
+        The delayed per-partition results
+    merge
+        A function which merges a list of results into one result
+    split_every
+        The number of results merged by one task
+    """
+    merge = dask.delayed(merge, pure=True)
+    while len(parts) > 1:
+        parts = [merge(parts[i : i + split_every]) for i in range(0, len(parts), split_every)]
+    return parts[0]
+
+
+def cont_col_histograms(
+    df: dd.DataFrame, cols: List[str], bins: int
+) -> Dict[str, Tuple[da.Array, da.Array]]:
+    """
+    The (counts, edges) histograms of the continuous columns cols of a DataFrame,
+    computed together by cont_histograms
+    """
+    if not cols:
+        return {}
+    counts, edges = cont_histograms(DataArray(df[cols]).values, bins)
+    return {col: (counts[i], edges[i]) for i, col in enumerate(cols)}
+
+
+def cont_histograms(arr: da.Array, bins: int) -> Tuple[da.Array, da.Array]:
+    """
+    Compute the histograms of all the columns of a 2-D numerical array. The ranges
+    of all the columns come from one min/max reduction, then each block is binned
+    for all the columns at once. The histogram of a column is the same as
+    np.histogram over its finite values with range (min, max).
+
+    Parameters
+    ----------
+    arr
+        The 2-D array, e.g., DataArray.values
+    bins
+        The number of bins
+
+    Returns
+    -------
+    Tuple[da.Array, da.Array]
+        The (ncols, bins) counts and the (ncols, bins + 1) bin edges
+    """
+    ncols = arr.shape[1]
+    blocks = arr.rechunk({1: -1}).to_delayed(optimize_graph=False).ravel().tolist()
+    block_range = dask.delayed(_block_range, pure=True)
+    rng = tree_reduce([block_range(blk) for blk in blocks], _merge_ranges)
+    edges = dask.delayed(_hist_edges, pure=True)(rng, bins)
+    block_hist = dask.delayed(_block_hist, pure=True)
+    counts = tree_reduce([block_hist(blk, edges) for blk in blocks], sum)
+    return (
+        da.from_delayed(counts, (ncols, bins), dtype=np.int64),
+        da.from_delayed(edges, (ncols, bins + 1), dtype=float),
+    )
+
+
+def _block_range(blk: np.ndarray) -> np.ndarray:
+    """
+    The minimums and maximums of the finite values of each column of a block,
+    inf and -inf for a column without finite values
+    """
+    blk = blk.astype(float)
+    fin = np.isfinite(blk)
+    return np.stack(
+        [
+            np.min(np.where(fin, blk, np.inf), axis=0, initial=np.inf),
+            np.max(np.where(fin, blk, -np.inf), axis=0, initial=-np.inf),
+        ]
+    )
+
+
+def _merge_ranges(rngs: List[np.ndarray]) -> np.ndarray:
+    """
+    Merge the ranges of several blocks
+    """
+    rng = np.stack(rngs)
+    return np.stack([rng[:, 0].min(axis=0), rng[:, 1].max(axis=0)])
+
+
+def _hist_edges(rng: np.ndarray, bins: int) -> np.ndarray:
+    """
+    The bin edges of each column, the same as np.histogram
+    """
+    low, high = rng
+    empty = low > high  # no finite value
+    low, high = np.where(empty, 0.0, low), np.where(empty, 1.0, high)
+    const = low == high
+    low, high = np.where(const, low - 0.5, low), np.where(const, high + 0.5, high)
+    return np.linspace(low, high, bins + 1, axis=1)
+
+
+def _block_hist(blk: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Count the values of each column of a block in the bins, this follows the
+    computation of np.histogram for equal-width bins
+    """
+    blk = blk.astype(float)
+    ncols, nbins = edges.shape[0], edges.shape[1] - 1
+    first, last = edges[:, 0], edges[:, -1]
+    keep = (blk >= first) & (blk <= last)
+    cols = np.broadcast_to(np.arange(ncols), blk.shape)[keep]
+    vals = blk[keep]
+
+    norm = nbins / (last - first)
+    idx = ((vals - first[cols]) * norm[cols]).astype(np.intp)
+    idx[idx == nbins] -= 1
+    idx[vals < edges[cols, idx]] -= 1
+    idx[(vals >= edges[cols, idx + 1]) & (idx != nbins - 1)] += 1
+    return np.bincount(cols * nbins + idx, minlength=ncols * nbins).reshape(ncols, nbins)
+
+
+def nrows_distinct(df: dd.DataFrame, method: str = "exact") -> Delayed:
+    """
+    The number of distinct rows of a DataFrame, the same as
+    df.drop_duplicates().shape[0] but without shuffling the rows. Each row is
+    fingerprinted by a 64-bit hash of its values in its partition, only the
+    fingerprints leave the partitions.
+
+    Parameters
+    ----------
+    df
+        The DataFrame
+    method
+        With "exact", the distinct fingerprints of the partitions are merged by a
+        tree reduction, which is exact unless two distinct rows collide in 64
+        bits. With "approx", the fingerprints are folded into HyperLogLog
+        registers, which take constant memory and have a relative error of
+        about 1.04 / sqrt(2**HLL_BITS)
+    """
+    if method not in ("exact", "approx"):
+        raise ValueError(f"Unknown method {method!r}, expected 'exact' or 'approx'")
+
+    parts = df.to_delayed(optimize_graph=False)
+    if method == "exact":
+        chunk = dask.delayed(_row_fingerprints, pure=True)
+        state = tree_reduce([chunk(part) for part in parts], _merge_fingerprints)
+        return dask.delayed(len, pure=True)(state)
+
+    chunk = dask.delayed(_row_registers, pure=True)
+    state = tree_reduce([chunk(part) for part in parts], _merge_registers)
+    return dask.delayed(_count_registers, pure=True)(state)
+
+
+def _row_fingerprints(df: pd.DataFrame) -> np.ndarray:
+    """
+    The sorted distinct 64-bit hashes of the rows of a partition
+    """
+    return np.unique(hash_pandas_object(df, index=False).to_numpy())
+
+
+def _merge_fingerprints(fps: List[np.ndarray]) -> np.ndarray:
+    """
+    The sorted distinct hashes of a list of sets of hashes
+    """
+    return np.unique(np.concatenate(fps))
+
+
+def _row_registers(df: pd.DataFrame) -> Tuple[np.ndarray, int]:
+    """
+    The HyperLogLog registers of the rows of a partition and the number of rows
+    """
+    return compute_hll_array(df, HLL_BITS), df.shape[0]
+
+
+def _merge_registers(states: List[Tuple[np.ndarray, int]]) -> Tuple[np.ndarray, int]:
+    """
+    Merge the HyperLogLog registers and the row counts of partitions
+    """
+    return reduce(np.maximum, [regs for regs, _ in states]), sum(nrows for _, nrows in states)
+
+
+def _count_registers(state: Tuple[np.ndarray, int]) -> int:
+    """
+    The distinct count estimated from HyperLogLog registers, at most the number of rows
+    """
+    regs, nrows = state
+    return min(nrows, int(round(estimate_count(regs, HLL_BITS))))
+
+
+def memory_usage(df: dd.DataFrame, method: str = "sample", sample: int = 1000) -> Delayed:
+    """
+    The deep memory usage of a DataFrame, the same as df.memory_usage(deep=True).sum(),
+    as a delayed tuple of the usage and its error bound. Only the Python objects of
+    the object columns and of an object index are expensive to measure.
+
+    Parameters
+    ----------
+    df
+        The DataFrame
+    method
+        With "exact", every object is measured and the bound is 0. With "sample",
+        the objects are measured on a sample of the rows of each partition and
+        extrapolated, the bound is the half width of a 95% confidence interval
+        of the stratified estimate
+    sample
+        The number of rows sampled from each partition
+    """
+    if method not in ("exact", "sample"):
+        raise ValueError(f"Unknown method {method!r}, expected 'exact' or 'sample'")
+
+    chunk = dask.delayed(_memory_chunk, pure=True)
+    nsample = sample if method == "sample" else None
+    parts = [chunk(part, nsample) for part in df.to_delayed(optimize_graph=False)]
+    state = tree_reduce(parts, _merge_memory)
+    return dask.delayed(_finalize_memory, pure=True)(state)
+
+
+def _memory_chunk(df: pd.DataFrame, sample: Optional[int]) -> Tuple[float, float]:
+    """
+    The memory usage of a partition and the variance of its estimate
+    """
+    nrows = df.shape[0]
+    usage = float(df.memory_usage(deep=False).sum())
+    objs = [df.index.to_numpy()] if pd.api.types.is_object_dtype(df.index.dtype) else []
+    for i, dtype in enumerate(df.dtypes):
+        if pd.api.types.is_object_dtype(dtype):
+            objs.append(df.iloc[:, i].to_numpy())
+        else:
+            # e.g., the categories of a categorical column, which are few
+            srs = df.iloc[:, i]
+            usage += srs.memory_usage(index=False, deep=True) - srs.memory_usage(index=False)
+    if not objs or nrows == 0:
+        return usage, 0.0
+
+    if sample is None or nrows <= sample:
+        usage += sum(np.fromiter(map(sys.getsizeof, arr), np.float64, nrows).sum() for arr in objs)
+        return usage, 0.0
+
+    sample = max(sample, 2)  # the variance needs two sizes
+    idx = np.random.choice(nrows, sample, replace=False)
+    sizes = np.sum(
+        [np.fromiter(map(sys.getsizeof, arr[idx]), np.float64, sample) for arr in objs], axis=0
+    )
+    usage += nrows * sizes.mean()
+    var = nrows ** 2 * (1 - sample / nrows) * sizes.var(ddof=1) / sample
+    return usage, var
+
+
+def _merge_memory(states: List[Tuple[float, float]]) -> Tuple[float, float]:
+    """
+    Sum the memory usages and the variances of partitions
+    """
+    return sum(usage for usage, _ in states), sum(var for _, var in states)
+
+
+def _finalize_memory(state: Tuple[float, float]) -> Tuple[float, float]:
+    """
+    The memory usage and the half width of its confidence interval
+    """
+    usage, var = state
+    return usage, MEMORY_Z * np.sqrt(var)
+
+
+def ks_pairs(
+    df: pd.DataFrame, max_pairs: int = KS_MAX_PAIRS, block: int = KS_BLOCK
+) -> List[Tuple[Any, Any, float]]:
+    """
+    The two-sample Kolmogorov-Smirnov tests of all the pairs of columns of a DataFrame,
+    as a list of (column 1, column 2, p-value) in the order of combinations(columns, 2).
+    The values of all the columns are replaced by their ranks in one pooled sort, which
+    leaves the statistics unchanged, so the empirical CDFs of every pair are evaluated
+    by a few searchsorted calls into one array. The p-values are the asymptotic ones
+    with Stephens' correction. If there are more than max_pairs pairs, the statistics
+    of all the pairs are first bounded from below on a grid of the quantiles of each
+    column, and only the max_pairs most similar pairs are tested and returned.
+
+    Parameters
+    ----------
+    df
+        The sample of the numerical columns, the non-finite values are ignored
+    max_pairs
+        The maximum number of pairs which are tested on the whole sample
+    block
+        The maximum number of CDF evaluations of one vectorised step
+    """
+    samples = {col: df[col].to_numpy(dtype=np.float64) for col in df.columns}
+    samples = {col: arr[np.isfinite(arr)] for col, arr in samples.items()}
+    samples = {col: arr for col, arr in samples.items() if arr.size > 0}
+    if len(samples) < 2:
+        return []
+
+    pooled = _pool_ranks(list(samples.values()))
+    starts = pooled[2]
+    lhs, rhs = np.triu_indices(len(samples), 1)
+    if lhs.size > max_pairs:
+        lhs, rhs = _ks_candidates(pooled, lhs, rhs, max_pairs, block)
+
+    pts = [np.arange(starts[i], starts[i + 1]) for i in range(len(samples))]
+    dstat = _ks_stats(pooled, pts, lhs, rhs, block)
+    nvals = np.diff(starts)
+    scale = np.sqrt(nvals[lhs] * nvals[rhs] / (nvals[lhs] + nvals[rhs]))
+    pvals = np.clip(kstwobign.sf((scale + 0.12 + 0.11 / scale) * dstat), 0, 1)
+    cols = list(samples)
+    return [(cols[i], cols[j], pval) for i, j, pval in zip(lhs, rhs, pvals)]
+
+
+def _pool_ranks(samples: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """
+    Sort the values of all the columns into one array by their pooled ranks, offset by
+    column. Returns the sorted codes, the CDF of its own column at each code, the start
+    of each column in the codes and the number of distinct ranks.
+    """
+    nvals = np.array([arr.size for arr in samples])
+    _, ranks = np.unique(np.concatenate(samples), return_inverse=True)
+    nranks = int(ranks.max()) + 1
+    starts = np.concatenate([[0], np.cumsum(nvals)])
+    colidx = np.repeat(np.arange(len(samples)), nvals)
+    codes = np.sort(ranks + colidx * nranks)
+    cdfs = (np.searchsorted(codes, codes, side="right") - starts[colidx]) / nvals[colidx]
+    return codes, cdfs, starts, nranks
+
+
+def _ks_candidates(
+    pooled: Tuple[np.ndarray, np.ndarray, np.ndarray, int],
+    lhs: np.ndarray,
+    rhs: np.ndarray,
+    max_pairs: int,
+    block: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The max_pairs pairs with the smallest statistics on a grid of KS_GRID quantiles of
+    each column, the statistic on a subset of the points is a lower bound of the
+    statistic on all of them
+    """
+    # pylint: disable=too-many-arguments
+    starts = pooled[2]
+    grid = np.linspace(0, 1, KS_GRID)
+    pts = [
+        start + np.unique(np.round(grid * (n - 1)).astype(int))
+        for start, n in zip(starts, np.diff(starts))
+    ]
+    dstat = _ks_stats(pooled, pts, lhs, rhs, block)
+    keep = np.sort(np.argpartition(dstat, max_pairs)[:max_pairs])
+    return lhs[keep], rhs[keep]
+
+
+def _ks_stats(
+    pooled: Tuple[np.ndarray, np.ndarray, np.ndarray, int],
+    pts: List[np.ndarray],
+    lhs: np.ndarray,
+    rhs: np.ndarray,
+    block: int,
+) -> np.ndarray:
+    """
+    The largest distance between the empirical CDFs of the columns lhs[k] and rhs[k]
+    at the points of both columns, see _pool_ranks, pts[i] are the positions of the
+    points of column i in the codes
+    """
+    npts = np.array([pt.size for pt in pts])
+    dstat = np.zeros(lhs.size)
+    for this, other in ((lhs, rhs), (rhs, lhs)):
+        # split the pairs into steps of about block points
+        steps = (np.cumsum(npts[this]) - 1) // block
+        for sel in np.split(np.arange(this.size), np.flatnonzero(np.diff(steps)) + 1):
+            dist = _ks_distances(pooled, pts, this[sel], other[sel])
+            dstat[sel] = np.maximum(dstat[sel], dist)
+    return dstat
+
+
+def _ks_distances(
+    pooled: Tuple[np.ndarray, np.ndarray, np.ndarray, int],
+    pts: List[np.ndarray],
+    this: np.ndarray,
+    other: np.ndarray,
+) -> np.ndarray:
+    """
+    The largest distance between the CDFs of the columns this[k] and other[k] at the
+    points of the columns this[k]
+    """
+    codes, cdfs, starts, nranks = pooled
+    sizes = np.array([pts[i].size for i in this])
+    pos = np.concatenate([pts[i] for i in this])
+    idx = np.repeat(other, sizes)
+    vals = codes[pos] + (idx - np.repeat(this, sizes)) * nranks
+    diff = cdfs[pos] - (np.searchsorted(codes, vals, side="right") - starts[idx]) / (
+        starts[idx + 1] - starts[idx]
+    )
+    return np.maximum.reduceat(np.abs(diff), np.cumsum(sizes) - sizes)
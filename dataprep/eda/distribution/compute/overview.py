@@ -1,6 +1,6 @@
 """Computations for plot(df)"""
 
-from itertools import combinations
+from collections import defaultdict
 from typing import Any, Dict, List, Optional, Tuple
 
 import dask
@@ -9,6 +9,7 @@ import dask.dataframe as dd
 import numpy as np
 import pandas as pd
 from dask.array.stats import chisquare
+from dask.delayed import Delayed
 
 from ...configs import Config
 from ...dtypes import (
@@ -18,12 +19,15 @@ from ...dtypes import (
     DTypeDef,
     Nominal,
     GeoGraphy,
-    detect_dtype,
+    detect_dtypes,
     get_dtype_cnts_and_num_cols,
     is_dtype,
 )
-from ...utils import _calc_line_dt, ks_2samp, normaltest, skewtest
+from ...utils import _calc_line_dt, normaltest, skewtest
 from ...intermediate import Intermediate
+from .common import cont_col_histograms, ks_pairs, memory_usage, nrows_distinct
+from .profile import nom_profile, nom_value_counts
+from .sketch import ContProfile, NomProfile, Profile
 
 
 def compute_overview(df: dd.DataFrame, cfg: Config, dtype: Optional[DTypeDef]) -> Intermediate:
@@ -48,30 +52,97 @@ def compute_overview(df: dd.DataFrame, cfg: Config, dtype: Optional[DTypeDef]) -
         # extract the first rows to check if a column contains a mutable type
         head: pd.DataFrame = df.head()  # head triggers a (small) data read
 
+    dtypes = detect_dtypes(df, dtype)
+    if cfg.hist.enable or cfg.insight.enable:
+        # the histograms of all the continuous columns are computed together
+        cont_cols = [col for col, col_dtype in dtypes.items() if is_dtype(col_dtype, Continuous())]
+        hists = cont_col_histograms(df, cont_cols, cfg.hist.bins)
+
+    if cfg.bar.enable or cfg.insight.enable:
+        nom_cols, str_cols = [], []
+        for col, col_dtype in dtypes.items():
+            if is_dtype(col_dtype, Nominal()):
+                # Since it will throw error if column is object while some cells are
+                # numerical, we transform column to string first.
+                str_cols.append(col)
+                nom_cols.append(col)
+            elif is_dtype(col_dtype, GeoGraphy()):
+                # cast the column as string type if it contains a mutable type
+                try:
+                    head[col].apply(hash)
+                except TypeError:
+                    str_cols.append(col)
+                nom_cols.append(col)
+        if str_cols:
+            # cast all the columns at once, a cast per column copies the partitions each time
+            df = df.astype({col: str for col in str_cols})
+        # the values of all the nominal columns are counted together
+        noms = nom_profile(df[nom_cols]) if nom_cols else {}
+
     data: List[Tuple[str, DType, Any]] = []
-    for col in df.columns:
-        col_dtype = detect_dtype(df[col], dtype)
+    for col, col_dtype in dtypes.items():
         if is_dtype(col_dtype, Continuous()) and (cfg.hist.enable or cfg.insight.enable):
-            data.append((col, Continuous(), _cont_calcs(df[col].dropna(), cfg)))
+            data.append((col, Continuous(), _cont_calcs(df[col].dropna(), hists[col], cfg)))
         elif is_dtype(col_dtype, Nominal()) and (cfg.bar.enable or cfg.insight.enable):
-            # Since it will throw error if column is object while some cells are
-            # numerical, we transform column to string first.
-            df[col] = df[col].astype(str)
-            data.append((col, Nominal(), _nom_calcs(df[col].dropna(), head[col], cfg)))
+            data.append((col, Nominal(), _nom_calcs(col, noms[col], cfg)))
         elif is_dtype(col_dtype, GeoGraphy()) and (cfg.bar.enable or cfg.insight.enable):
-            # cast the column as string type if it contains a mutable type
-            try:
-                head[col].apply(hash)
-            except TypeError:
-                df[col] = df[col].astype(str)
-            data.append((col, GeoGraphy(), _nom_calcs(df[col].dropna(), head[col], cfg)))
+            data.append((col, GeoGraphy(), _nom_calcs(col, noms[col], cfg)))
         elif is_dtype(col_dtype, DateTime()) and (cfg.line.enable or cfg.insight.enable):
             data.append((col, DateTime(), dask.delayed(_calc_line_dt)(df[[col]], cfg.line.unit)))
 
     ov_stats = calc_stats(df, cfg, dtype)  # overview statistics
     data, ov_stats = dask.compute(data, ov_stats)
 
-    # extract the plotting data, and detect and format the insights
+    return _format_overview(data, ov_stats, cfg)
+
+
+def compute_overview_profile(prof: Profile, cfg: Config) -> Intermediate:
+    """
+    Compute functions for plot(profile), the overview is derived from the
+    sketches of a profile instead of the rows: the bar charts show the most
+    frequent values of the Space-Saving summaries, and the numbers of distinct
+    values are estimated once a summary overflows. The line charts of the
+    datetime columns and the similar distribution insights are not shown.
+
+    Parameters
+    ----------
+    prof
+        The profile of a DataFrame, see compute_profile
+    cfg
+        Config instance
+    """
+    data: List[Tuple[str, DType, Any]] = []
+    for col, cprof in prof.columns.items():
+        if isinstance(cprof, ContProfile) and (cfg.hist.enable or cfg.insight.enable):
+            counts, edges = cprof.histogram(cfg.hist.bins)
+            hist = (da.from_array(counts), da.from_array(edges))
+            data.append((col, Continuous(), _cont_calcs_sketch(hist, cprof, cfg)))
+        elif isinstance(cprof, NomProfile) and (cfg.bar.enable or cfg.insight.enable):
+            data.append((col, Nominal(), _nom_calcs_sketch(col, cprof, cfg)))
+
+    dtype_cnts: Dict[str, int] = defaultdict(int)
+    names = {"Continuous": "Numerical", "Nominal": "Categorical", "DateTime": "DateTime"}
+    for dtype in prof.dtypes.values():
+        dtype_cnts[names[dtype]] += 1
+    ov_stats = {
+        "nrows": prof.nrows,
+        "ncols": len(prof.columns),
+        "npresent_cells": sum(cprof.npres for cprof in prof.columns.values()),
+        "nrows_wo_dups": min(prof.nrows, round(prof.rows.count())),
+        "mem_use": prof.mem_use,
+        "dtype_cnts": dtype_cnts,
+    }
+    (data,) = dask.compute(data)
+
+    return _format_overview(data, ov_stats, cfg)
+
+
+def _format_overview(
+    data: List[Tuple[str, DType, Any]], ov_stats: Dict[str, Any], cfg: Config
+) -> Intermediate:
+    """
+    Extract the plotting data, and detect and format the insights for plot(df)
+    """
     plot_data: List[Tuple[str, DType, Any]] = []
     col_insights: Dict[str, List[str]] = {}
     all_ins = _format_ov_ins(ov_stats, cfg) if cfg.insight.enable else []
@@ -104,9 +175,18 @@ def compute_overview(df: dd.DataFrame, cfg: Config, dtype: Optional[DTypeDef]) -
     )
 
 
-def _cont_calcs(srs: dd.Series, cfg: Config) -> Dict[str, Any]:
+def _cont_calcs(srs: dd.Series, hist: Tuple[da.Array, da.Array], cfg: Config) -> Dict[str, Any]:
     """
     Computations for a continuous column in plot(df)
+
+    Parameters
+    ----------
+    srs
+        The column with the null values dropped
+    hist
+        The counts and the bin edges of the histogram of the column, see cont_histograms
+    cfg
+        Config instance
     """
     # dictionary of data for the histogram and related insights
     data: Dict[str, Any] = {}
@@ -118,7 +198,7 @@ def _cont_calcs(srs: dd.Series, cfg: Config) -> Dict[str, Any]:
     srs = srs[~srs.isin({np.inf, -np.inf})]
 
     # histogram
-    data["hist"] = da.histogram(srs, bins=cfg.hist.bins, range=(srs.min(), srs.max()))
+    data["hist"] = hist
 
     if cfg.insight.enable:
         data["chisq"] = chisquare(data["hist"][0])
@@ -131,15 +211,24 @@ def _cont_calcs(srs: dd.Series, cfg: Config) -> Dict[str, Any]:
     return data
 
 
-def _nom_calcs(srs: dd.Series, head: pd.Series, cfg: Config) -> Dict[str, Any]:
+def _nom_calcs(col: Any, prof: Delayed, cfg: Config) -> Dict[str, Any]:
     """
     Computations for a nominal column in plot(df)
+
+    Parameters
+    ----------
+    col
+        The column name
+    prof
+        The profile of the column, see nom_profile
+    cfg
+        Config instance
     """
     # dictionary of data for the bar chart and related insights
     data: Dict[str, Any] = {}
 
     # value counts for barchart and uniformity insight
-    grps = srs.value_counts(sort=False)
+    grps = nom_value_counts(prof, col)
 
     if cfg.bar.enable:
         # select the largest or smallest groups
@@ -151,10 +240,52 @@ def _nom_calcs(srs: dd.Series, head: pd.Series, cfg: Config) -> Dict[str, Any]:
     if cfg.insight.enable:
         data["chisq"] = chisquare(grps.values)  # chi-squared test for uniformity
         data["nuniq"] = grps.shape[0]  # number of unique values
-        data["npres"] = grps.sum()  # number of present (not null) values
-        if not head.apply(lambda x: isinstance(x, str)).all():
-            srs = srs.astype(str)  # srs must be a string to compute the value lengths
-        data["min_len"], data["max_len"] = srs.str.len().min(), srs.str.len().max()
+        data["npres"] = prof["npres"]  # number of present (not null) values
+        data["min_len"] = prof["len_stats"]["Minimum"]
+        data["max_len"] = prof["len_stats"]["Maximum"]
+
+    return data
+
+
+def _cont_calcs_sketch(
+    hist: Tuple[da.Array, da.Array], prof: ContProfile, cfg: Config
+) -> Dict[str, Any]:
+    """
+    Computations for a continuous column in plot(profile)
+    """
+    data: Dict[str, Any] = {"hist": hist}
+    if cfg.insight.enable:
+        data["npres"] = prof.npres
+        data["chisq"] = chisquare(hist[0])
+        data["norm"] = normaltest(hist[0])
+        data["skew"] = skewtest(hist[0])
+        data["nneg"] = prof.nneg
+        data["nuniq"] = prof.hll.count()
+        data["nzero"] = prof.nzero
+    return data
+
+
+def _nom_calcs_sketch(col: str, prof: NomProfile, cfg: Config) -> Dict[str, Any]:
+    """
+    Computations for a nominal column in plot(profile)
+    """
+    data: Dict[str, Any] = {}
+    grps = prof.topk.counts.rename(col)
+
+    if cfg.bar.enable:
+        data["bar"] = (
+            grps.nlargest(cfg.bar.bars) if cfg.bar.sort_descending else grps.nsmallest(cfg.bar.bars)
+        )
+        data["nuniq"] = round(prof.nuniq)
+
+    if cfg.insight.enable:
+        # the uniformity is only tested on the counts of all the values
+        data["chisq"] = (
+            chisquare(da.from_array(grps.values)) if prof.topk.exact else (np.nan, np.nan)
+        )
+        data["nuniq"] = round(prof.nuniq)
+        data["npres"] = prof.npres
+        data["min_len"], data["max_len"] = prof.len_min, prof.len_max
 
     return data
 
@@ -171,19 +302,19 @@ def calc_stats(df: dd.DataFrame, cfg: Config, dtype: Optional[DTypeDef]) -> Dict
     if cfg.stats.enable:
         stats["ncols"] = df.shape[1]
         stats["npresent_cells"] = df.count().sum()
-        stats["nrows_wo_dups"] = df.drop_duplicates().shape[0]
-        stats["mem_use"] = df.memory_usage(deep=True).sum()
+        stats["nrows_wo_dups"] = nrows_distinct(df, cfg.stats.duplicates)
+        mem_use = memory_usage(df, cfg.stats.mem_use, cfg.stats.mem_use__sample)
+        stats["mem_use"] = mem_use[0]
         stats["dtype_cnts"] = dtype_cnts
+        stats["mem_use_err"] = mem_use[1]
 
     if not cfg.stats.enable and cfg.insight.enable:
-        stats["nrows_wo_dups"] = df.drop_duplicates().shape[0]
+        stats["nrows_wo_dups"] = nrows_distinct(df, cfg.stats.duplicates)
 
     if cfg.insight.enable:
         # compute distribution similarity on a data sample
         df_smp = df.map_partitions(lambda x: x.sample(min(1000, x.shape[0])), meta=df)
-        stats["ks_tests"] = []
-        for col1, col2 in combinations(num_cols, 2):
-            stats["ks_tests"].append((col1, col2, ks_2samp(df_smp[col1], df_smp[col2])[1]))
+        stats["ks_tests"] = dask.delayed(ks_pairs, pure=True)(df_smp[num_cols])
 
     return stats
 
@@ -0,0 +1,474 @@
+"""
+Single-scan profiles of the columns of a DataFrame: every partition is summarized
+by one task, and the summaries are merged by a tree reduction.
+"""
+import sys
+from functools import reduce
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
+
+import dask
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+from dask.array.percentile import _percentile, merge_percentiles
+from dask.base import tokenize
+from dask.dataframe.core import new_dd_object
+from dask.dataframe.hyperloglog import compute_hll_array, estimate_count
+from dask.delayed import Delayed
+from dask.highlevelgraph import HighLevelGraph
+
+from ...dtypes import HLL_BITS
+from .common import tree_reduce
+from .sketch import TDigest, _grid_histogram, _grid_sketch, _merge_grids, _merge_moments, _moments
+
+# The maximum number of values sampled from each group by group_box_sketches
+SAMPLE_SIZE = 1000
+
+
+def cont_profile(
+    srs: dd.Series,
+    quantiles: Sequence[float] = (),
+    bins: Sequence[int] = (),
+    sample: bool = False,
+    value_counts: bool = False,
+    nuniq: bool = False,
+    digest: Optional[float] = None,
+) -> Delayed:
+    """
+    Profile a numerical column in a single scan. Every partition is summarized by
+    _cont_chunk, then the summaries are merged by a tree reduction and finalized
+    into a dict with the keys "nrows", "npres", "nreals", "nzero", "nneg", "min",
+    "max", "mean", "std", "skew", "kurt" and "mem_use", where the statistics after
+    "npres" are computed on the finite values. The following keys are optional:
+
+    "qntls": a Series of the quantiles, identical to dask's Series.quantile, or
+        estimated by a t-digest if digest is given
+    "digest": the TDigest of the finite values if digest is given
+    "hist": a dict mapping each number of bins to the (counts, edges) of a histogram
+        over [min, max], the same as np.histogram if a single partition holds the
+        finite values, otherwise derived from the merged grid histograms of the
+        partitions (see _grid_histogram)
+    "sample": a sample of at most 1000 finite values from each partition
+    "value_counts": the counts of the finite values
+    "nuniq": the approximate number of distinct finite values
+
+    Parameters
+    ----------
+    srs
+        The numerical column
+    quantiles
+        The quantiles to compute, between 0 and 1
+    bins
+        The numbers of bins of the histograms to compute
+    sample
+        Whether to sample the values, e.g., for a kernel density estimate
+    value_counts
+        Whether to count the values
+    nuniq
+        Whether to estimate the number of distinct values by HyperLogLog
+    digest
+        The compression of a t-digest which estimates the quantiles, instead of
+        merging the percentiles of the partitions
+    """
+    # pylint: disable=too-many-arguments
+    quantiles, bins = sorted(quantiles), sorted(set(bins))
+    parts = srs.to_delayed(optimize_graph=False)
+    chunk = dask.delayed(_cont_chunk, pure=True)
+    state = tree_reduce(
+        [chunk(part, quantiles, bins, sample, value_counts, nuniq, digest) for part in parts],
+        _cont_merge,
+    )
+    return dask.delayed(_cont_finalize, pure=True)(state, quantiles, bins, srs.name)
+
+
+def _cont_chunk(
+    srs: pd.Series,
+    quantiles: List[float],
+    bins: List[int],
+    sample: bool,
+    value_counts: bool,
+    nuniq: bool,
+    digest: Optional[float],
+) -> Dict[str, Any]:
+    """
+    Summarize a partition of a numerical column
+    """
+    # pylint: disable=too-many-arguments
+    state: Dict[str, Any] = {"nrows": srs.shape[0]}
+    srs = srs.dropna()
+    state["npres"] = srs.shape[0]
+    srs = srs[~srs.isin({np.inf, -np.inf})]
+    arr = srs.to_numpy()
+    state["nreals"] = arr.shape[0]
+    state["nzero"] = int((arr == 0).sum())
+    state["nneg"] = int((arr < 0).sum())
+    state["mem_use"] = srs.memory_usage(deep=True)
+
+    if arr.shape[0] > 0:
+        state["min"], state["max"] = arr.min(), arr.max()
+        state["moments"] = _moments(arr.astype(float))
+        if bins:
+            # the exact histograms are kept until the partition is merged with
+            # another one which has finite values, then only the grid remains
+            state["grid"] = _grid_sketch(arr)
+            state["hists"] = {nbins: np.histogram(arr, nbins) for nbins in bins}
+    if digest is not None:
+        state["digest"] = TDigest(digest).update(arr)
+    elif quantiles:
+        # the same percentiles as dask's Series.quantile, with 0 and 100 added
+        state["qntls"] = [_percentile(arr, _calc_qs(quantiles))]
+    if sample:
+        state["sample"] = srs.sample(min(1000, srs.shape[0])).to_numpy()
+    if value_counts:
+        state["value_counts"] = srs.value_counts(sort=False)
+    if nuniq:
+        state["hll"] = compute_hll_array(srs, HLL_BITS)
+    return state
+
+
+def _cont_merge(states: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge the summaries of several partitions of a numerical column
+    """
+    return reduce(_cont_merge2, states)
+
+
+def _cont_merge2(lhs: Dict[str, Any], rhs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge the summaries of two partitions of a numerical column
+    """
+    state = {
+        key: lhs[key] + rhs[key] for key in ("nrows", "npres", "nreals", "nzero", "nneg", "mem_use")
+    }
+
+    if lhs["nreals"] == 0 or rhs["nreals"] == 0:
+        src = rhs if lhs["nreals"] == 0 else lhs
+        keys = ("min", "max", "moments", "grid", "hists")
+        state.update({key: src[key] for key in keys if key in src})
+    else:
+        state["min"] = min(lhs["min"], rhs["min"])
+        state["max"] = max(lhs["max"], rhs["max"])
+        state["moments"] = _merge_moments(
+            lhs["nreals"], lhs["moments"], rhs["nreals"], rhs["moments"]
+        )
+        if "grid" in lhs:
+            state["grid"] = _merge_grids(lhs["grid"], rhs["grid"])
+
+    if "digest" in lhs:
+        state["digest"] = lhs["digest"].merge(rhs["digest"])
+    if "qntls" in lhs:
+        state["qntls"] = lhs["qntls"] + rhs["qntls"]
+    if "sample" in lhs:
+        state["sample"] = np.concatenate([lhs["sample"], rhs["sample"]])
+    if "value_counts" in lhs:
+        vcnts = pd.concat([lhs["value_counts"], rhs["value_counts"]])
+        state["value_counts"] = vcnts.groupby(level=0, sort=False).sum()
+    if "hll" in lhs:
+        state["hll"] = np.maximum(lhs["hll"], rhs["hll"])
+    return state
+
+
+def _cont_finalize(
+    state: Dict[str, Any],
+    quantiles: List[float],
+    bins: List[int],
+    name: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Compute the profile of a numerical column from the merged summary
+    """
+    data = {key: state[key] for key in ("nrows", "npres", "nreals", "nzero", "nneg", "mem_use")}
+
+    nreals = state["nreals"]
+    if nreals > 0:
+        mean, sum2, sum3, sum4 = state["moments"]
+        data["min"], data["max"] = state["min"], state["max"]
+        data["mean"] = mean
+        data["std"] = np.sqrt(sum2 / (nreals - 1)) if nreals > 1 else np.nan
+        # the biased estimators, the same as dask.array.stats
+        data["skew"] = (sum3 / nreals) / (sum2 / nreals) ** 1.5 if sum2 != 0 else 0.0
+        data["kurt"] = (sum4 / nreals) / (sum2 / nreals) ** 2 - 3 if sum2 != 0 else -3.0
+    else:
+        data.update({key: np.nan for key in ("min", "max", "mean", "std", "skew", "kurt")})
+
+    if bins:
+        data["hist"] = _cont_hists(state, bins)
+    if "digest" in state:
+        data["digest"] = state["digest"]
+        if quantiles:
+            vals = state["digest"].quantile(np.asarray(quantiles))
+            data["qntls"] = pd.Series(vals, index=quantiles, name=name)
+    elif quantiles:
+        data["qntls"] = pd.Series(
+            _merge_qntls(state["qntls"], quantiles), index=quantiles, name=name
+        )
+    for key in ("sample", "value_counts"):
+        if key in state:
+            data[key] = state[key]
+    if "hll" in state:
+        data["nuniq"] = estimate_count(state["hll"], HLL_BITS)
+    return data
+
+
+def _cont_hists(state: Dict[str, Any], bins: List[int]) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+    """
+    The histograms of the finite values of a numerical column from the merged summary
+    """
+    if state["nreals"] == 0:
+        return {nbins: np.histogram([], nbins) for nbins in bins}
+    if "hists" in state:
+        return cast(Dict[int, Tuple[np.ndarray, np.ndarray]], state["hists"])
+    return {
+        nbins: _grid_histogram(state["grid"], nbins, state["min"], state["max"]) for nbins in bins
+    }
+
+
+def _merge_qntls(qntls: List[Tuple[np.ndarray, int]], quantiles: List[float]) -> np.ndarray:
+    """
+    Merge the percentiles of the partitions into the quantiles, like dask's
+    Series.quantile
+    """
+    qntls = [qntl for qntl in qntls if qntl[1] > 0]
+    if not qntls:
+        return np.full(len(quantiles), np.nan)
+    calc_qs = _calc_qs(quantiles)
+    return merge_percentiles(np.asarray(quantiles) * 100, [calc_qs] * len(qntls), qntls)
+
+
+def _calc_qs(quantiles: List[float]) -> np.ndarray:
+    """
+    The percentiles computed on each partition for the quantiles
+    """
+    return np.concatenate([[0], np.asarray(quantiles) * 100, [100]])
+
+
+def is_tdigest(method: str) -> bool:
+    """
+    Whether the quantile method of the config, cfg.quantile.method, estimates the
+    quantiles by t-digests
+    """
+    if method not in ("default", "tdigest"):
+        raise ValueError(f"Unknown method {method!r}, expected 'default' or 'tdigest'")
+    return method == "tdigest"
+
+
+def box_sketch(digest: TDigest, sample: np.ndarray) -> Dict[str, Any]:
+    """
+    Estimate the box plot statistics of a set of values from its t-digest and a
+    sample of the values: the quartiles "q1", "q2" and "q3", the whiskers "lw" and
+    "uw" (the fences clipped to the extrema), at most 100 outliers "otlrs" drawn
+    from the sample and the estimated number of outliers "notlrs"
+    """
+    qrt1, qrt2, qrt3 = digest.quantile(np.array([0.25, 0.5, 0.75]))
+    iqr = qrt3 - qrt1
+    low, high = qrt1 - 1.5 * iqr, qrt3 + 1.5 * iqr
+    otlrs = sample[(sample < low) | (sample > high)]
+    if otlrs.shape[0] > 100:
+        otlrs = np.random.choice(otlrs, 100, replace=False)
+    notlrs = digest.count * (digest.cdf(low) + 1 - digest.cdf(high)) if digest.count else 0
+    return {
+        "q1": qrt1,
+        "q2": qrt2,
+        "q3": qrt3,
+        "lw": max(low, digest.min),
+        "uw": min(high, digest.max),
+        "otlrs": otlrs,
+        "notlrs": int(round(notlrs)),
+    }
+
+
+def group_box_sketches(
+    df: dd.DataFrame, compression: float, edges: Optional[Delayed] = None
+) -> Delayed:
+    """
+    Estimate the box plot statistics (see box_sketch) of the values of the second
+    column of a DataFrame in each group of the first column, or in each bin of the
+    first column if the bin edges are given. Every partition keeps a t-digest and
+    a sample of at most SAMPLE_SIZE values per group, which are merged by a tree
+    reduction, so that the statistics of all the groups are computed in one scan.
+
+    Parameters
+    ----------
+    df
+        The DataFrame with the group (or binned) column and the numerical column
+    compression
+        The compression of the t-digests
+    edges
+        The delayed bin edges of the first column, the bins are labeled by their
+        indices as pd.cut(..., labels=False, include_lowest=True)
+
+    Returns
+    -------
+    Delayed
+        A dict mapping each non-empty group to its box plot statistics
+    """
+    chunk = dask.delayed(_group_box_chunk, pure=True)
+    parts = [chunk(part, compression, edges) for part in df.to_delayed(optimize_graph=False)]
+    state = tree_reduce(parts, _merge_group_boxes)
+    return dask.delayed(_finalize_group_boxes, pure=True)(state)
+
+
+def _group_box_chunk(
+    df: pd.DataFrame, compression: float, edges: Optional[np.ndarray]
+) -> Dict[Any, Tuple[TDigest, np.ndarray]]:
+    """
+    The t-digest and a sample of the values of each group of a partition
+    """
+    x, y = df.columns
+    df = df[np.isfinite(df[y].astype(float))]
+    keys = df[x] if edges is None else pd.cut(df[x], edges, labels=False, include_lowest=True)
+    state = {}
+    for key, srs in df[y].groupby(keys, sort=False):
+        vals = srs.to_numpy(dtype=float)
+        if vals.shape[0] > SAMPLE_SIZE:
+            smp = np.random.choice(vals, SAMPLE_SIZE, replace=False)
+        else:
+            smp = vals
+        state[key] = (TDigest(compression).update(vals), smp)
+    return state
+
+
+def _merge_group_boxes(
+    states: List[Dict[Any, Tuple[TDigest, np.ndarray]]]
+) -> Dict[Any, Tuple[TDigest, np.ndarray]]:
+    """
+    Merge the t-digests and the samples of the groups of several partitions
+    """
+    merged: Dict[Any, Tuple[TDigest, np.ndarray]] = {}
+    for state in states:
+        for key, (digest, smp) in state.items():
+            if key in merged:
+                digest = merged[key][0].merge(digest)
+                smp = np.concatenate([merged[key][1], smp])
+                if smp.shape[0] > SAMPLE_SIZE:
+                    smp = np.random.choice(smp, SAMPLE_SIZE, replace=False)
+            merged[key] = (digest, smp)
+    return merged
+
+
+def _finalize_group_boxes(state: Dict[Any, Tuple[TDigest, np.ndarray]]) -> Dict[Any, Any]:
+    """
+    The box plot statistics of each group
+    """
+    return {key: box_sketch(digest, smp) for key, (digest, smp) in state.items()}
+
+
+def nom_profile(df: dd.DataFrame, len_bins: Optional[int] = None) -> Dict[Any, Delayed]:
+    """
+    Profile all the nominal columns of a DataFrame in a single scan. Each partition
+    is summarized by counting the values of every column, the counts of all the
+    columns are merged by one tree reduction, then the statistics of the lengths of
+    the values are derived from the counts. The profile of a column is a dict with
+    the keys "nrows", "npres", "mem_use", "value_counts", "len_stats" and, if
+    len_bins is given, "len_hist". The statistics exclude the null values.
+
+    Parameters
+    ----------
+    df
+        The DataFrame of nominal columns
+    len_bins
+        The number of bins of the histogram of the value lengths
+    """
+    chunk = dask.delayed(_nom_chunk, pure=True)
+    parts = [chunk(part) for part in df.to_delayed(optimize_graph=False)]
+    state = tree_reduce(parts, _nom_merge)
+    prof = dask.delayed(_nom_finalize, pure=True)(state, len_bins)
+    return {col: prof[col] for col in df.columns}
+
+
+def nom_value_counts(prof: Delayed, name: Any) -> dd.Series:
+    """
+    The value counts in the profile of a nominal column as a dask Series,
+    the same as dd.Series.value_counts(sort=False)
+    """
+    meta = pd.Series([], dtype=np.int64, name=name, index=pd.Index([], dtype=object))
+    counts = prof["value_counts"]
+    # dd.from_delayed flattens the whole graph of the profile for every column
+    key = "nom-value-counts-" + tokenize(counts)
+    graph = HighLevelGraph.from_collections(key, {(key, 0): counts.key}, dependencies=[counts])
+    return new_dd_object(graph, key, meta, [None, None])
+
+
+def _nom_chunk(df: pd.DataFrame) -> Dict[Any, Dict[str, Any]]:
+    """
+    Count the values of each column of a partition
+    """
+    state = {}
+    for col in df.columns:
+        srs = df[col].dropna()
+        vcnts = srs.value_counts(sort=False)
+        if pd.api.types.is_object_dtype(srs.dtype):
+            # the deep size from the counts, so that each distinct value is measured once
+            sizes = vcnts.index.map(sys.getsizeof).to_numpy(dtype=np.int64)
+            mem_use = srs.memory_usage(index=False) + srs.index.memory_usage(deep=True)
+            mem_use += int(sizes @ vcnts.to_numpy())
+        else:
+            mem_use = srs.memory_usage(deep=True)
+        state[col] = {"nrows": df.shape[0], "mem_use": mem_use, "value_counts": vcnts}
+    return state
+
+
+def _nom_merge(states: List[Dict[Any, Dict[str, Any]]]) -> Dict[Any, Dict[str, Any]]:
+    """
+    Merge the value counts of several partitions
+    """
+    return {
+        col: {
+            "nrows": sum(state[col]["nrows"] for state in states),
+            "mem_use": sum(state[col]["mem_use"] for state in states),
+            "value_counts": pd.concat([state[col]["value_counts"] for state in states])
+            .groupby(level=0)
+            .sum(),
+        }
+        for col in states[0]
+    }
+
+
+def _nom_finalize(
+    state: Dict[Any, Dict[str, Any]], len_bins: Optional[int]
+) -> Dict[Any, Dict[str, Any]]:
+    """
+    Compute the profiles of the nominal columns from the merged value counts
+    """
+    profs = {}
+    for col, cstate in _nom_merge([state]).items():
+        vcnts = cstate["value_counts"]
+        cnts = vcnts.to_numpy()
+        lens = vcnts.index.astype(str).str.len().to_numpy()
+        npres = int(cnts.sum())
+
+        prof = {"nrows": cstate["nrows"], "npres": npres, "mem_use": cstate["mem_use"]}
+        prof["value_counts"] = vcnts
+        if npres > 0:
+            mean = (lens * cnts).sum() / npres
+            var = ((lens - mean) ** 2 * cnts).sum() / (npres - 1) if npres > 1 else np.nan
+            prof["len_stats"] = {
+                "Mean": mean,
+                "Standard Deviation": np.sqrt(var),
+                "Median": _weighted_median(lens, cnts),
+                "Minimum": lens.min(),
+                "Maximum": lens.max(),
+            }
+        else:
+            prof["len_stats"] = dict.fromkeys(
+                ("Mean", "Standard Deviation", "Median", "Minimum", "Maximum"), np.nan
+            )
+        if len_bins is not None:
+            rng = (lens.min(), lens.max()) if npres > 0 else None
+            hist, edges = np.histogram(lens, len_bins, rng, weights=cnts)
+            prof["len_hist"] = (hist.astype(np.int64), edges)
+        profs[col] = prof
+    return profs
+
+
+def _weighted_median(vals: np.ndarray, cnts: np.ndarray) -> float:
+    """
+    The median of the values where vals[i] appears cnts[i] times,
+    interpolated linearly like pd.Series.median
+    """
+    order = np.argsort(vals, kind="mergesort")
+    vals, cumcnts = vals[order], np.cumsum(cnts[order])
+    pos = (cumcnts[-1] - 1) / 2
+    low = vals[np.searchsorted(cumcnts, np.floor(pos), side="right")]
+    high = vals[np.searchsorted(cumcnts, np.ceil(pos), side="right")]
+    return float(low + (high - low) * (pos - np.floor(pos)))
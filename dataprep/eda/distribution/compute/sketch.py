@@ -0,0 +1,828 @@
+"""
+Mergeable sketches of the columns of a DataFrame. A Profile summarizes a table
+with a fixed amount of memory per column, it is filled chunk by chunk and two
+profiles of disjoint sets of rows are merged into the profile of their union, so
+that a table which grows by appends is profiled by only scanning the new rows.
+"""
+import pickle
+from functools import reduce
+from typing import Any, Dict, List, Optional, Tuple, Type, Union, cast
+
+import dask
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+from dask.dataframe.hyperloglog import estimate_count
+from pandas.util import hash_pandas_object
+
+from ...dtypes import (
+    HLL_BITS,
+    Continuous,
+    DateTime,
+    DType,
+    DTypeDef,
+    GeoGraphy,
+    Nominal,
+    detect_dtypes,
+    is_dtype,
+)
+from ...utils import preprocess_dataframe, to_dask
+from .common import tree_reduce
+
+__all__ = ["Profile", "compute_profile"]
+
+# The number of counters of the Space-Saving summaries of the nominal columns
+TOPK_CAPACITY = 1024
+
+# The version of the serialized profiles
+PROFILE_VERSION = 1
+
+# The default compression of the t-digests, a digest keeps at most this many centroids
+TDIGEST_COMPRESSION = 200
+
+# The maximum number of cells of the grid histogram kept for a numerical column
+GRID_CELLS = 8192
+
+# A grid histogram (exp, start, counts, lows, highs), see _grid_sketch
+Grid = Tuple[int, int, np.ndarray, np.ndarray, np.ndarray]
+
+
+class HyperLogLog:
+    """
+    A HyperLogLog sketch of the number of distinct values, the registers are
+    compatible with dask's nunique_approx
+
+    Parameters
+    ----------
+    precision
+        The number of bits of the register index, the sketch has 2**precision
+        registers and a relative error of about 1.04 / sqrt(2**precision)
+    """
+
+    def __init__(self, precision: int = HLL_BITS) -> None:
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, obj: Union[pd.Series, pd.DataFrame]) -> "HyperLogLog":
+        """
+        Add the values of a Series, or the rows of a DataFrame, to the sketch
+        """
+        if obj.shape[0] > 0:
+            hashes = hash_pandas_object(obj, index=False).to_numpy().astype(np.uint32)
+            # the position of the lowest set bit, 33 for a zero hash
+            low = hashes & (~hashes + np.uint32(1))
+            first_bit = np.where(hashes == 0, 33, np.log2(np.maximum(low, 1)) + 1).astype(np.uint8)
+            np.maximum.at(self.registers, hashes >> (32 - self.precision), first_bit)
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """
+        The sketch of the values of both sketches
+        """
+        if self.precision != other.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precisions")
+        hll = HyperLogLog(self.precision)
+        hll.registers = np.maximum(self.registers, other.registers)
+        return hll
+
+    def count(self) -> float:
+        """
+        Estimate the number of distinct values
+        """
+        return float(estimate_count(self.registers, self.precision))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the sketch
+        """
+        return {"precision": self.precision, "registers": self.registers}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HyperLogLog":
+        """
+        Deserialize a sketch
+        """
+        hll = cls(data["precision"])
+        hll.registers = data["registers"]
+        return hll
+
+
+class SpaceSaving:
+    """
+    A Space-Saving summary of the most frequent values (Metwally et al., "Efficient
+    Computation of Frequent and Top-k Elements in Data Streams"), merged as in
+    Cafaro et al., "A parallel space saving algorithm for frequent items and the
+    Hurwitz zeta distribution". The counts overestimate the frequencies of the
+    monitored values by at most their errors, and a value which is not monitored
+    occurs at most min(counts) times. While the number of distinct values is at
+    most the capacity, the counts are exact.
+
+    Parameters
+    ----------
+    capacity
+        The maximum number of monitored values
+    """
+
+    def __init__(self, capacity: int = TOPK_CAPACITY) -> None:
+        self.capacity = capacity
+        self.counts = pd.Series([], dtype=np.int64, index=pd.Index([], dtype=object))
+        self.errors = self.counts.copy()
+        self.exact = True
+
+    def update(self, values: pd.Series) -> "SpaceSaving":
+        """
+        Add the values of a Series without null values to the summary
+        """
+        counts = values.value_counts()
+        summary = SpaceSaving(self.capacity)
+        summary.exact = counts.shape[0] <= self.capacity
+        summary.counts = counts.iloc[: self.capacity].rename(None)
+        summary.errors = pd.Series(0, index=summary.counts.index, dtype=np.int64)
+        merged = self.merge(summary)
+        self.counts, self.errors, self.exact = merged.counts, merged.errors, merged.exact
+        return self
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """
+        The summary of the values of both summaries
+        """
+        index = self.counts.index.union(other.counts.index)
+        counts: Any = 0
+        errors: Any = 0
+        for summary in (self, other):
+            # the count of a value which is not monitored by a summary is bounded
+            # by the smallest count of the summary
+            floor = 0 if summary.exact or summary.counts.empty else summary.counts.min()
+            counts = counts + summary.counts.reindex(index, fill_value=floor)
+            errors = errors + summary.errors.reindex(index, fill_value=floor)
+        merged = SpaceSaving(max(self.capacity, other.capacity))
+        merged.exact = self.exact and other.exact and index.shape[0] <= merged.capacity
+        counts = pd.Series(counts, index=index, dtype=np.int64)
+        merged.counts = counts.sort_values(ascending=False, kind="mergesort").iloc[
+            : merged.capacity
+        ]
+        merged.errors = pd.Series(errors, index=index, dtype=np.int64)[merged.counts.index]
+        return merged
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the summary
+        """
+        return {
+            "capacity": self.capacity,
+            "counts": self.counts,
+            "errors": self.errors,
+            "exact": self.exact,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SpaceSaving":
+        """
+        Deserialize a summary
+        """
+        summary = cls(data["capacity"])
+        summary.counts, summary.errors = data["counts"], data["errors"]
+        summary.exact = data["exact"]
+        return summary
+
+
+class TDigest:
+    """
+    A merging t-digest of a set of finite values (Dunning and Ertl, "Computing
+    Extremely Accurate Quantiles Using t-Digests"). The values are clustered into
+    centroids, and the centroids are kept small near the quantiles 0 and 1 by the
+    scale function k(q) = compression / (2 * pi) * arcsin(2q - 1): a centroid spans
+    at most 2 units of k, so the centroid around the quantile q holds at most a
+    fraction 4 * pi * sqrt(q * (1 - q)) / compression of the values.
+
+    Parameters
+    ----------
+    compression
+        The compression, a digest keeps at most this many centroids
+    """
+
+    def __init__(self, compression: float = TDIGEST_COMPRESSION) -> None:
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min, self.max = np.inf, -np.inf
+
+    @property
+    def count(self) -> float:
+        """The number of values"""
+        return float(self.weights.sum())
+
+    def update(self, values: np.ndarray) -> "TDigest":
+        """
+        Add the finite values of an array to the digest
+        """
+        values = np.asarray(values, dtype=float)
+        values = values[np.isfinite(values)]
+        if values.shape[0] > 0:
+            self.min, self.max = min(self.min, values.min()), max(self.max, values.max())
+            self.compress(
+                np.concatenate([self.means, values]),
+                np.concatenate([self.weights, np.ones(values.shape[0])]),
+            )
+        return self
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        """
+        The digest of the values of both digests
+        """
+        digest = TDigest(max(self.compression, other.compression))
+        digest.min, digest.max = min(self.min, other.min), max(self.max, other.max)
+        digest.compress(
+            np.concatenate([self.means, other.means]),
+            np.concatenate([self.weights, other.weights]),
+        )
+        return digest
+
+    def compress(self, means: np.ndarray, weights: np.ndarray) -> None:
+        """
+        Replace the centroids of the digest by the clusters of the given centroids:
+        the consecutive centroids in sorted order which start in the same unit of k
+        and span less than one unit of k each are merged
+        """
+        order = np.argsort(means, kind="mergesort")
+        means, weights = means[order], weights[order]
+        if means.shape[0] == 0:
+            self.means, self.weights = means, weights
+            return
+        cum = np.cumsum(weights)
+        scale = self.compression / (2 * np.pi)
+        kleft = scale * np.arcsin(np.clip(2 * (cum - weights) / cum[-1] - 1, -1, 1))
+        kright = scale * np.arcsin(np.clip(2 * cum / cum[-1] - 1, -1, 1))
+        wide = kright - kleft >= 1
+        unit = np.floor(kleft)
+        start = np.ones(means.shape[0], dtype=bool)
+        start[1:] = wide[1:] | wide[:-1] | (unit[1:] != unit[:-1])
+        starts = np.flatnonzero(start)
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    def quantile(self, quantiles: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Estimate the quantiles quantiles, between 0 and 1. The values are interpolated
+        linearly between the centers of the centroids, the minimum and the maximum
+        """
+        total = self.count
+        if total == 0:
+            return np.full(np.shape(quantiles), np.nan)
+        centers = np.cumsum(self.weights) - self.weights / 2
+        ranks = np.concatenate([[0], centers, [total]])
+        values = np.concatenate([[self.min], self.means, [self.max]])
+        return np.interp(np.asarray(quantiles) * total, ranks, values)
+
+    def cdf(self, values: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Estimate the fractions of the values which are at most the given values
+        """
+        total = self.count
+        if total == 0:
+            return np.full(np.shape(values), np.nan)
+        centers = np.cumsum(self.weights) - self.weights / 2
+        ranks = np.concatenate([[0], centers, [total]])
+        points = np.concatenate([[self.min], self.means, [self.max]])
+        return np.interp(values, points, ranks) / total
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the digest
+        """
+        return {
+            "compression": self.compression,
+            "means": self.means,
+            "weights": self.weights,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TDigest":
+        """
+        Deserialize a digest
+        """
+        digest = cls(data["compression"])
+        digest.means, digest.weights = data["means"], data["weights"]
+        digest.min, digest.max = data["min"], data["max"]
+        return digest
+
+
+class ColumnProfile:
+    """
+    The profile of a column: the number of rows, of present (not null) values and
+    the memory usage of the present values
+    """
+
+    dtype: Type[DType] = DateTime
+
+    def __init__(self) -> None:
+        self.nrows = 0
+        self.npres = 0
+        self.mem_use = 0
+
+    def update(self, srs: pd.Series) -> "ColumnProfile":
+        """
+        Add the values of a chunk of the column to the profile
+        """
+        vars(self).update(vars(self.merge(self.summarize(srs))))
+        return self
+
+    @classmethod
+    def summarize(cls, srs: pd.Series) -> "ColumnProfile":
+        """
+        The profile of a chunk of the column
+        """
+        prof = cls()
+        cls._summarize(prof, srs)
+        return prof
+
+    def _summarize(self, srs: pd.Series) -> None:
+        """
+        Fill an empty profile with the statistics of a chunk of the column
+        """
+        self.nrows = srs.shape[0]
+        srs = srs.dropna()
+        self.npres = srs.shape[0]
+        self.mem_use = srs.memory_usage(deep=True)
+
+    def merge(self, other: "ColumnProfile") -> "ColumnProfile":
+        """
+        The profile of the values of both profiles
+        """
+        prof = type(self)()
+        prof.nrows = self.nrows + other.nrows
+        prof.npres = self.npres + other.npres
+        prof.mem_use = self.mem_use + other.mem_use
+        return prof
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the profile
+        """
+        return {"dtype": self.dtype.__name__, **vars(self)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ColumnProfile":
+        """
+        Deserialize a profile
+        """
+        prof = cls()
+        prof.nrows, prof.npres, prof.mem_use = data["nrows"], data["npres"], data["mem_use"]
+        return prof
+
+
+class ContProfile(ColumnProfile):
+    """
+    The profile of a numerical column. The statistics except npres are computed on
+    the finite values: the moments, a grid histogram (see _grid_sketch), a
+    t-digest of the quantiles and a HyperLogLog of the distinct values.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    dtype = Continuous
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.nreals = 0
+        self.nzero = 0
+        self.nneg = 0
+        self.min, self.max = np.nan, np.nan
+        self.moments: Optional[Tuple[float, float, float, float]] = None
+        self.grid: Optional[Grid] = None
+        self.digest = TDigest()
+        self.hll = HyperLogLog()
+
+    def _summarize(self, srs: pd.Series) -> None:
+        super()._summarize(srs)
+        srs = srs.dropna()
+        srs = srs[~srs.isin({np.inf, -np.inf})]
+        arr = srs.to_numpy(dtype=float)
+        self.nreals = arr.shape[0]
+        if arr.shape[0] > 0:
+            self.nzero, self.nneg = int((arr == 0).sum()), int((arr < 0).sum())
+            self.min, self.max = arr.min(), arr.max()
+            self.moments = _moments(arr)
+            self.grid = _grid_sketch(arr)
+            self.digest.update(arr)
+            self.hll.update(srs)
+
+    def merge(self, other: ColumnProfile) -> "ContProfile":
+        other = cast(ContProfile, other)
+        prof = cast(ContProfile, super().merge(other))
+        prof.nreals = self.nreals + other.nreals
+        prof.nzero, prof.nneg = self.nzero + other.nzero, self.nneg + other.nneg
+        if self.moments is None or other.moments is None:
+            src = other if self.moments is None else self
+            prof.min, prof.max, prof.moments, prof.grid = src.min, src.max, src.moments, src.grid
+        else:
+            prof.min, prof.max = min(self.min, other.min), max(self.max, other.max)
+            prof.moments = _merge_moments(self.nreals, self.moments, other.nreals, other.moments)
+            prof.grid = _merge_grids(self.grid, other.grid)
+        prof.digest = self.digest.merge(other.digest)
+        prof.hll = self.hll.merge(other.hll)
+        return prof
+
+    @property
+    def mean(self) -> float:
+        """The mean of the finite values"""
+        return float(self.moments[0]) if self.moments is not None else float("nan")
+
+    @property
+    def std(self) -> float:
+        """The sample standard deviation of the finite values"""
+        if self.moments is None or self.nreals < 2:
+            return float("nan")
+        return float(np.sqrt(self.moments[1] / (self.nreals - 1)))
+
+    def histogram(self, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The (counts, edges) of the histogram of the finite values over [min, max]
+        """
+        if self.grid is None:
+            counts, edges = np.histogram([], bins)
+            return counts, edges
+        return _grid_histogram(self.grid, bins, self.min, self.max)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        data.update(digest=self.digest.to_dict(), hll=self.hll.to_dict())
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ContProfile":
+        prof = cast(ContProfile, super().from_dict(data))
+        for key in ("nreals", "nzero", "nneg", "min", "max", "moments", "grid"):
+            setattr(prof, key, data[key])
+        prof.digest = TDigest.from_dict(data["digest"])
+        prof.hll = HyperLogLog.from_dict(data["hll"])
+        return prof
+
+
+class NomProfile(ColumnProfile):
+    """
+    The profile of a nominal column, the values are compared as strings: a
+    Space-Saving summary of the most frequent values, a HyperLogLog of the
+    distinct values and the moments and the extrema of the value lengths.
+    """
+
+    dtype = Nominal
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.len_min, self.len_max = np.nan, np.nan
+        self.len_moments: Optional[Tuple[float, float, float, float]] = None
+        self.topk = SpaceSaving()
+        self.hll = HyperLogLog()
+
+    def _summarize(self, srs: pd.Series) -> None:
+        super()._summarize(srs)
+        srs = srs.dropna().astype(str)
+        if srs.shape[0] > 0:
+            lens = srs.str.len().to_numpy(dtype=float)
+            self.len_min, self.len_max = lens.min(), lens.max()
+            self.len_moments = _moments(lens)
+            self.topk.update(srs)
+            self.hll.update(srs)
+
+    def merge(self, other: ColumnProfile) -> "NomProfile":
+        other = cast(NomProfile, other)
+        prof = cast(NomProfile, super().merge(other))
+        if self.len_moments is None or other.len_moments is None:
+            src = other if self.len_moments is None else self
+            prof.len_min, prof.len_max, prof.len_moments = src.len_min, src.len_max, src.len_moments
+        else:
+            prof.len_min = min(self.len_min, other.len_min)
+            prof.len_max = max(self.len_max, other.len_max)
+            prof.len_moments = _merge_moments(
+                self.npres, self.len_moments, other.npres, other.len_moments
+            )
+        prof.topk = self.topk.merge(other.topk)
+        prof.hll = self.hll.merge(other.hll)
+        return prof
+
+    @property
+    def nuniq(self) -> float:
+        """The number of distinct values, estimated if the summary is not exact"""
+        return float(self.topk.counts.shape[0] if self.topk.exact else self.hll.count())
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        data.update(topk=self.topk.to_dict(), hll=self.hll.to_dict())
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NomProfile":
+        prof = cast(NomProfile, super().from_dict(data))
+        prof.len_min, prof.len_max = data["len_min"], data["len_max"]
+        prof.len_moments = data["len_moments"]
+        prof.topk = SpaceSaving.from_dict(data["topk"])
+        prof.hll = HyperLogLog.from_dict(data["hll"])
+        return prof
+
+
+PROFILE_TYPES: Dict[str, Type[ColumnProfile]] = {
+    prof.dtype.__name__: prof for prof in (ColumnProfile, ContProfile, NomProfile)
+}
+
+
+def _moments(arr: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    The mean and the sums of the 2nd, 3rd and 4th powers of the deviations from the
+    mean of a non-empty array, see _merge_moments
+    """
+    mean = arr.mean()
+    dev = arr - mean
+    dev2 = dev * dev
+    return mean, dev2.sum(), (dev2 * dev).sum(), (dev2 * dev2).sum()
+
+
+def _merge_moments(
+    nlhs: int,
+    lhs: Tuple[float, float, float, float],
+    nrhs: int,
+    rhs: Tuple[float, float, float, float],
+) -> Tuple[float, float, float, float]:
+    """
+    Merge the means and the sums of the 2nd, 3rd and 4th powers of the deviations
+    from the mean of two sets of values, see Pebay, "Formulas for Robust, One-Pass
+    Parallel Computation of Covariances and Arbitrary-Order Statistical Moments"
+    """
+    # pylint: disable=invalid-name,too-many-locals
+    mean1, m21, m31, m41 = lhs
+    mean2, m22, m32, m42 = rhs
+    n1, n2 = float(nlhs), float(nrhs)
+    n = n1 + n2
+    delta = mean2 - mean1
+    mean = mean1 + delta * n2 / n
+    m2 = m21 + m22 + delta ** 2 * n1 * n2 / n
+    m3 = (
+        m31
+        + m32
+        + delta ** 3 * n1 * n2 * (n1 - n2) / n ** 2
+        + 3 * delta * (n1 * m22 - n2 * m21) / n
+    )
+    m4 = (
+        m41
+        + m42
+        + delta ** 4 * n1 * n2 * (n1 ** 2 - n1 * n2 + n2 ** 2) / n ** 3
+        + 6 * delta ** 2 * (n1 ** 2 * m22 + n2 ** 2 * m21) / n ** 2
+        + 4 * delta * (n1 * m32 - n2 * m31) / n
+    )
+    return mean, m2, m3, m4
+
+
+def _grid_sketch(arr: np.ndarray) -> Grid:
+    """
+    Count a non-empty array of finite values in a grid histogram (exp, start,
+    counts, lows, highs), where counts[i] is the number of values in
+    [(start + i) * 2**exp, (start + i + 1) * 2**exp) and lows[i] and highs[i] are
+    their extrema (inf and -inf in an empty cell). The cells are aligned to the
+    multiples of a power of two, so that two grids are merged exactly by
+    coarsening the finer one.
+    """
+    low, high = arr.min(), arr.max()
+    # the finest cells that keep the number of cells below GRID_CELLS, but not
+    # finer than the float64 precision of the values
+    exp = np.frexp(max(abs(low), abs(high)))[1] - 52 if high != 0 or low != 0 else 0
+    if high > low:
+        exp = max(exp, int(np.ceil(np.log2((high - low) / (GRID_CELLS - 1)))))
+    while np.floor(np.ldexp(high, -exp)) - np.floor(np.ldexp(low, -exp)) >= GRID_CELLS:
+        exp += 1
+    idx = np.floor(np.ldexp(arr, -exp)).astype(np.int64)
+    start = int(idx.min())
+    return (exp, start, *_grid_cells(idx - start, arr, int(idx.max()) - start + 1))
+
+
+def _grid_cells(
+    idx: np.ndarray, counts: np.ndarray, ncells: int, lows: Any = None, highs: Any = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    The counts and the extrema of the cells of a grid, where the i-th value (or
+    the counts[i] values within [lows[i], highs[i]] if lows and highs are given)
+    is in the cell idx[i]
+    """
+    # pylint: disable=too-many-arguments
+    if lows is None:
+        lows, highs, counts = counts, counts, np.ones_like(idx)
+    cell_lows, cell_highs = np.full(ncells, np.inf), np.full(ncells, -np.inf)
+    np.minimum.at(cell_lows, idx, lows)
+    np.maximum.at(cell_highs, idx, highs)
+    return np.bincount(idx, counts, ncells).astype(np.int64), cell_lows, cell_highs
+
+
+def _merge_grids(lhs: Optional[Grid], rhs: Optional[Grid]) -> Optional[Grid]:
+    """
+    Merge two grid histograms, None is the grid of no value
+    """
+    if lhs is None or rhs is None:
+        return rhs if lhs is None else lhs
+    exp = max(lhs[0], rhs[0])
+    lhs, rhs = _coarsen_grid(lhs, exp), _coarsen_grid(rhs, exp)
+    while max(lhs[1] + len(lhs[2]), rhs[1] + len(rhs[2])) - min(lhs[1], rhs[1]) > GRID_CELLS:
+        exp += 1
+        lhs, rhs = _coarsen_grid(lhs, exp), _coarsen_grid(rhs, exp)
+    start = min(lhs[1], rhs[1])
+    ncells = max(lhs[1] + len(lhs[2]), rhs[1] + len(rhs[2])) - start
+    idx = np.concatenate([np.arange(len(grid[2])) + grid[1] - start for grid in (lhs, rhs)])
+    counts, lows, highs = [np.concatenate([lhs[key], rhs[key]]) for key in (2, 3, 4)]
+    return (exp, start, *_grid_cells(idx, counts, ncells, lows, highs))
+
+
+def _coarsen_grid(grid: Grid, exp: int) -> Grid:
+    """
+    Coarsen a grid histogram to the cells of size 2**exp
+    """
+    shift = exp - grid[0]
+    if shift == 0:
+        return grid
+    idx = (grid[1] + np.arange(len(grid[2]), dtype=np.int64)) >> shift
+    start = int(idx[0])
+    return (exp, start, *_grid_cells(idx - start, grid[2], int(idx[-1]) - start + 1, *grid[3:]))
+
+
+def _grid_histogram(
+    grid: Grid, nbins: int, minv: float, maxv: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Derive the histogram with nbins equal-width bins over [minv, maxv] from a grid
+    histogram, the same as np.histogram. The values of a cell are assumed to be
+    uniformly distributed between the extrema of the cell, so the histogram is
+    exact unless a bin edge falls between the extrema of a cell, e.g., it is exact
+    on integers spanning less than GRID_CELLS. The bin counts are rounded such
+    that they sum up to the number of values.
+    """
+    exp, start, counts, lows, highs = grid
+    if minv == maxv:
+        hist, edges = np.histogram([minv], nbins)
+        return hist * counts.sum(), edges
+    edges = np.linspace(minv, maxv, nbins + 1)
+    # the number of values below each edge: the cells before the cell of the
+    # edge, plus the part of its cell below the edge
+    idx = np.clip(np.floor(np.ldexp(edges, -exp)).astype(np.int64) - start, 0, len(counts) - 1)
+    below = np.concatenate([[0], np.cumsum(counts)])[idx]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frac = np.clip((edges - lows[idx]) / (highs[idx] - lows[idx]), 0, 1)
+    frac[edges > highs[idx]] = 1
+    frac[edges <= lows[idx]] = 0
+    cum = below + frac * counts[idx]
+    cum[0], cum[-1] = 0, counts.sum()
+    return np.diff(np.round(cum)).astype(np.int64), edges
+
+
+class Profile:
+    """
+    The mergeable profile of a DataFrame: the profile of each column, the number
+    of rows, the memory usage and a HyperLogLog of the distinct rows. A profile is
+    created by compute_profile, updated in place with a new chunk of rows by
+    update, and combined with the profile of other rows by merge. It is serialized
+    by to_dict or save, and rendered by plot(profile).
+
+    Parameters
+    ----------
+    dtypes
+        The column names mapped to the names of their types, "Continuous",
+        "Nominal" or "DateTime"
+    """
+
+    def __init__(self, dtypes: Dict[str, str]) -> None:
+        self.columns: Dict[str, ColumnProfile] = {
+            col: PROFILE_TYPES[dtype]() for col, dtype in dtypes.items()
+        }
+        self.nrows = 0
+        self.mem_use = 0
+        self.rows = HyperLogLog()
+
+    @property
+    def dtypes(self) -> Dict[str, str]:
+        """The names of the types of the columns"""
+        return {col: prof.dtype.__name__ for col, prof in self.columns.items()}
+
+    def update(self, df: pd.DataFrame) -> "Profile":
+        """
+        Add a chunk of rows, with the same columns as the profile, to the profile
+        """
+        if list(df.columns) != list(self.columns):
+            raise ValueError("The columns of the rows and of the profile differ")
+        self.nrows += df.shape[0]
+        self.mem_use += df.memory_usage(deep=True).sum()
+        self.rows.update(df)
+        for col, prof in self.columns.items():
+            prof.update(df[col])
+        return self
+
+    def merge(self, other: "Profile") -> "Profile":
+        """
+        The profile of the rows of both profiles
+        """
+        if self.dtypes != other.dtypes:
+            raise ValueError("Cannot merge the profiles of tables with different columns")
+        prof = Profile({})
+        prof.nrows = self.nrows + other.nrows
+        prof.mem_use = self.mem_use + other.mem_use
+        prof.rows = self.rows.merge(other.rows)
+        prof.columns = {col: self.columns[col].merge(other.columns[col]) for col in self.columns}
+        return prof
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the profile into a dict of numbers, arrays and Series
+        """
+        return {
+            "version": PROFILE_VERSION,
+            "nrows": self.nrows,
+            "mem_use": self.mem_use,
+            "rows": self.rows.to_dict(),
+            "columns": {col: prof.to_dict() for col, prof in self.columns.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Profile":
+        """
+        Deserialize a profile
+        """
+        if data.get("version") != PROFILE_VERSION:
+            raise ValueError(f"Unsupported profile version {data.get('version')}")
+        prof = cls({})
+        prof.nrows, prof.mem_use = data["nrows"], data["mem_use"]
+        prof.rows = HyperLogLog.from_dict(data["rows"])
+        prof.columns = {
+            col: PROFILE_TYPES[cprof["dtype"]].from_dict(cprof)
+            for col, cprof in data["columns"].items()
+        }
+        return prof
+
+    def save(self, path: str) -> None:
+        """
+        Save the profile to a file
+        """
+        with open(path, "wb") as file:
+            pickle.dump(self.to_dict(), file, protocol=4)
+
+    @classmethod
+    def load(cls, path: str) -> "Profile":
+        """
+        Load a profile saved by save
+        """
+        with open(path, "rb") as file:
+            return cls.from_dict(pickle.load(file))
+
+
+def compute_profile(
+    df: Union[pd.DataFrame, dd.DataFrame],
+    dtype: Optional[DTypeDef] = None,
+    profile: Optional[Profile] = None,
+) -> Profile:
+    """
+    Profile a DataFrame in a single scan, each partition is profiled separately
+    and the profiles are merged by a tree reduction.
+
+    Parameters
+    ----------
+    df
+        The DataFrame to profile
+    dtype: str or DType or dict of str or dict of DType, default None
+        Specify Data Types for designated column or all columns.
+    profile
+        The profile of earlier rows of the same table, the returned profile covers
+        the rows of both. The types of the columns are taken from this profile.
+
+    Examples
+    --------
+    >>> prof = compute_profile(df)
+    >>> prof = compute_profile(new_rows, profile=prof)
+    >>> plot(prof)
+    """
+    df = preprocess_dataframe(to_dask(df))
+    if profile is not None:
+        dtypes = profile.dtypes
+    else:
+        dtypes = {}
+        for col, col_dtype in detect_dtypes(df, dtype).items():
+            if is_dtype(col_dtype, Continuous()):
+                dtypes[col] = Continuous.__name__
+            elif is_dtype(col_dtype, Nominal()) or is_dtype(col_dtype, GeoGraphy()):
+                dtypes[col] = Nominal.__name__
+            else:
+                dtypes[col] = DateTime.__name__
+    df = df[list(dtypes)]
+
+    chunk = dask.delayed(_profile_chunk, pure=True)
+    parts = [chunk(part, dtypes) for part in df.to_delayed()]
+    prof: Profile = dask.compute(tree_reduce(parts, _merge_profiles))[0]
+    return prof if profile is None else profile.merge(prof)
+
+
+def _profile_chunk(df: pd.DataFrame, dtypes: Dict[str, str]) -> Profile:
+    """
+    Profile a partition
+    """
+    return Profile(dtypes).update(df)
+
+
+def _merge_profiles(profs: List[Profile]) -> Profile:
+    """
+    Merge the profiles of several partitions
+    """
+    return reduce(Profile.merge, profs)
@@ -2,7 +2,7 @@
 Computations for plot(df, x)
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import math
 import dask
@@ -10,8 +10,10 @@ import dask.array as da
 import dask.dataframe as dd
 import numpy as np
 import pandas as pd
-from dask.array.stats import chisquare, kurtosis, skew
+from dask.array.stats import chisquare
+from dask.delayed import Delayed
 from nltk.stem import PorterStemmer, WordNetLemmatizer
+from scipy.stats import gaussian_kde as gaussian_kde_
 
 from ....assets.english_stopwords import english_stopwords as ess
 from ....errors import UnreachableError
@@ -27,7 +29,8 @@ from ...dtypes import (
     is_dtype,
 )
 from ...intermediate import Intermediate
-from ...utils import _calc_line_dt, gaussian_kde, normaltest
+from ...utils import _calc_line_dt, normaltest
+from .profile import box_sketch, cont_profile, is_tdigest, nom_profile, nom_value_counts
 
 
 def compute_univariate(
@@ -104,16 +107,32 @@ def compute_univariate(
         raise UnreachableError
 
 
-def nom_comps(srs: dd.Series, head: pd.Series, cfg: Config) -> Dict[str, Any]:
+def nom_comps(
+    srs: dd.Series, head: pd.Series, cfg: Config, prof: Optional[Delayed] = None
+) -> Dict[str, Any]:
     """
     All computations required for plot(df, Nominal)
+
+    Parameters
+    ----------
+    srs
+        The nominal column
+    head
+        The first rows of the column
+    cfg
+        Config instance
+    prof
+        The profile of the column computed by nom_profile with
+        len_bins=cfg.wordlen.bins, if the column is profiled with others
     """
     # pylint: disable=too-many-branches
     data: Dict[str, Any] = dict()
 
-    data["nrows"] = srs.shape[0]  # total rows
+    if prof is None:
+        prof = nom_profile(srs.to_frame(), cfg.wordlen.bins)[srs.name]
+    data["nrows"] = prof["nrows"]  # total rows
     srs = srs.dropna()  # drop null values
-    grps = srs.value_counts(sort=False)  # counts of unique values in the series
+    grps = nom_value_counts(prof, srs.name)  # counts of unique values in the series
     data["geo"] = grps
 
     if cfg.stats.enable or cfg.bar.enable or cfg.pie.enable:
@@ -147,20 +166,20 @@ def nom_comps(srs: dd.Series, head: pd.Series, cfg: Config) -> Dict[str, Any]:
 
     df = grps.reset_index()  # dataframe with group names and counts
 
-    if cfg.stats.enable or cfg.wordlen.enable:
-        if not head.apply(lambda x: isinstance(x, str)).all():
-            srs = srs.astype(str)  # srs must be a string to compute the value lengths
     if cfg.stats.enable or cfg.wordcloud.enable or cfg.wordfreq.enable:
         if not head.apply(lambda x: isinstance(x, str)).all():
             df[df.columns[0]] = df[df.columns[0]].astype(str)
 
+    # the value lengths are computed on the string representations of the values
     if cfg.stats.enable:
-        data.update(_calc_nom_stats(srs, df, data["nrows"], data["nuniq"]))
+        data.update(_calc_nom_stats(srs, df, prof, data["nuniq"]))
     elif cfg.wordfreq.enable and cfg.insight.enable:
-        data["len_stats"] = {"Minimum": srs.str.len().min(), "Maximum": srs.str.len().max()}
+        data["len_stats"] = {
+            "Minimum": prof["len_stats"]["Minimum"],
+            "Maximum": prof["len_stats"]["Maximum"],
+        }
     if cfg.wordlen.enable:
-        lens = srs.str.len()
-        data["len_hist"] = da.histogram(lens, cfg.wordlen.bins, (lens.min(), lens.max()))
+        data["len_hist"] = prof["len_hist"]
     if cfg.wordcloud.enable or cfg.wordfreq.enable:
         if all(
             getattr(cfg.wordcloud, att) == getattr(cfg.wordfreq, att)
@@ -206,59 +225,102 @@ def cont_comps(srs: dd.Series, cfg: Config) -> Dict[str, Any]:
     # pylint: disable=too-many-branches
     data: Dict[str, Any] = {}
 
+    # compute only the required amount of quantiles
+    quantiles: List[float] = []
+    if cfg.qqnorm.enable:
+        quantiles = list(np.linspace(0.01, 0.99, 99))
+    elif cfg.stats.enable:
+        quantiles = [0.05, 0.25, 0.5, 0.75, 0.95]
+    elif cfg.box.enable:
+        quantiles = [0.25, 0.5, 0.75]
+    bins = []
+    if cfg.hist.enable or cfg.qqnorm.enable and cfg.insight.enable:
+        bins.append(cfg.hist.bins)
+    if cfg.kde.enable:
+        bins.append(cfg.kde.bins)
+    tdigest = is_tdigest(cfg.quantile.method)
+    # one scan computes all the statistics below, except the exact box plot which
+    # needs the quartiles first
+    prof = cont_profile(
+        srs,
+        quantiles,
+        bins,
+        sample=cfg.kde.enable or cfg.box.enable and tdigest,
+        value_counts=cfg.value_table.enable,
+        nuniq=cfg.stats.enable and not cfg.value_table.enable,
+        digest=cfg.quantile.compression if tdigest else None,
+    )
+
     if cfg.stats.enable or cfg.hist.enable:
-        data["nrows"] = srs.shape[0]  # total rows
-    srs = srs.dropna()
+        data["nrows"] = prof["nrows"]  # total rows
     if cfg.stats.enable:
-        data["npres"] = srs.shape[0]  # number of present (not null) values
-    srs = srs[~srs.isin({np.inf, -np.inf})]  # remove infinite values
+        data["npres"] = prof["npres"]  # number of present (not null) values
     if cfg.hist.enable or cfg.qqnorm.enable and cfg.insight.enable:
-        data["hist"] = da.histogram(srs, cfg.hist.bins, (srs.min(), srs.max()))
+        data["hist"] = prof["hist"][cfg.hist.bins]
+        counts = da.from_delayed(data["hist"][0], (cfg.hist.bins,), dtype=np.int64)
         if cfg.insight.enable:
-            data["norm"] = normaltest(data["hist"][0])
+            data["norm"] = normaltest(counts)
     if cfg.hist.enable and cfg.insight.enable:
-        data["chisq"] = chisquare(data["hist"][0])
-    # compute only the required amount of quantiles
-    if cfg.qqnorm.enable:
-        data["qntls"] = srs.quantile(np.linspace(0.01, 0.99, 99))
-    elif cfg.stats.enable:
-        data["qntls"] = srs.quantile([0.05, 0.25, 0.5, 0.75, 0.95])
-    elif cfg.box.enable:
-        data["qntls"] = srs.quantile([0.25, 0.5, 0.75])
+        data["chisq"] = chisquare(counts)
+    if quantiles:
+        data["qntls"] = dd.from_delayed(prof["qntls"], meta=pd.Series([], dtype=float))
     if cfg.stats.enable or cfg.hist.enable and cfg.insight.enable:
-        data["skew"] = skew(srs)
+        data["skew"] = prof["skew"]
     if cfg.stats.enable or cfg.qqnorm.enable:
-        data["mean"] = srs.mean()
-        data["std"] = srs.std()
+        data["mean"], data["std"] = prof["mean"], prof["std"]
     if cfg.stats.enable:
-        data["min"] = srs.min()
-        data["max"] = srs.max()
-        data["nreals"] = srs.shape[0]
-        data["nzero"] = (srs == 0).sum()
-        data["nneg"] = (srs < 0).sum()
-        data["kurt"] = kurtosis(srs)
-        data["mem_use"] = srs.memory_usage(deep=True)
+        for key in ("min", "max", "nreals", "nzero", "nneg", "kurt", "mem_use"):
+            data[key] = prof[key]
     # compute the density histogram
     if cfg.kde.enable:
-        # To avoid the singular matrix problem, gaussian_kde needs a non-zero std.
-        if not math.isclose(dask.compute(data["min"])[0], dask.compute(data["max"])[0]):
-            data["dens"] = da.histogram(srs, cfg.kde.bins, (srs.min(), srs.max()), density=True)
-            # gaussian kernel density estimate
-            data["kde"] = gaussian_kde(
-                srs.map_partitions(lambda x: x.sample(min(1000, x.shape[0])), meta=srs)
-            )
-        else:
-            data["kde"] = None
-    if cfg.box.enable:
+        data["dens"] = dask.delayed(_density)(prof["hist"][cfg.kde.bins])
+        # gaussian kernel density estimate
+        data["kde"] = _calc_kde(prof["sample"], prof["min"], prof["max"])
+    if cfg.box.enable and tdigest:
+        data.update(_calc_box_sketch(prof, cfg))
+    elif cfg.box.enable:
+        srs = srs.dropna()
+        srs = srs[~srs.isin({np.inf, -np.inf})]  # remove infinite values
         data.update(_calc_box(srs, data["qntls"], cfg))
     if cfg.value_table.enable:
-        value_counts = srs.value_counts(sort=False)
         if cfg.stats.enable:
-            data["nuniq"] = value_counts.shape[0]
-        data["value_table"] = value_counts.nlargest(cfg.value_table.ngroups)
+            data["nuniq"] = prof["value_counts"].shape[0]
+        data["value_table"] = prof["value_counts"].nlargest(cfg.value_table.ngroups)
     elif cfg.stats.enable:
-        data["nuniq"] = srs.nunique_approx()
+        data["nuniq"] = prof["nuniq"]
+
+    return data
+
+
+def _density(hist: Tuple[np.ndarray, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Normalize a histogram to a probability density, like np.histogram(density=True)
+    """
+    counts, edges = hist
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return counts / np.diff(edges) / counts.sum(), edges
 
+
+@dask.delayed(name="calc-kde", pure=True)  # pylint: disable=no-value-for-parameter
+def _calc_kde(sample: pd.Series, minv: float, maxv: float) -> Any:
+    """
+    Gaussian kernel density estimate of a sample, or None if the column is constant
+    """
+    # To avoid the singular matrix problem, gaussian_kde needs a non-zero std.
+    if math.isclose(minv, maxv):
+        return None
+    return gaussian_kde_(sample)
+
+
+def _calc_box_sketch(prof: Delayed, cfg: Config) -> Dict[str, Any]:
+    """
+    Box plot calculations from the t-digest and the sample of a column profile
+    """
+    box = dask.delayed(box_sketch, pure=True)(prof["digest"], prof["sample"])
+    data = {f"qrtl{i}": box[f"q{i}"] for i in (1, 2, 3)}
+    data.update(lw=box["lw"], uw=box["uw"], otlrs=box["otlrs"])
+    if cfg.insight.enable:
+        data["notlrs"] = box["notlrs"]
     return data
 
 
@@ -325,7 +387,7 @@ def _calc_word_freq(
 def _calc_nom_stats(
     srs: dd.Series,
     df: dd.DataFrame,
-    nrows: int,
+    prof: Delayed,
     nuniq: dd.core.Scalar,
 ) -> Dict[str, Any]:
     """
@@ -333,20 +395,14 @@ def _calc_nom_stats(
     """
     # overview stats
     stats = {
-        "nrows": nrows,
-        "npres": srs.shape[0],
+        "nrows": prof["nrows"],
+        "npres": prof["npres"],
         "nuniq": nuniq,
-        "mem_use": srs.memory_usage(deep=True),
+        "mem_use": prof["mem_use"],
         "first_rows": srs.reset_index(drop=True).loc[:4],
     }
     # length stats
-    leng = {
-        "Mean": srs.str.len().mean(),
-        "Standard Deviation": srs.str.len().std(),
-        "Median": srs.str.len().quantile(0.5),
-        "Minimum": srs.str.len().min(),
-        "Maximum": srs.str.len().max(),
-    }
+    leng = prof["len_stats"]
     # letter stats
     # computed on groupby-count:
     # compute the statistic for each group then multiply by the count of the group
@@ -33,7 +33,7 @@ from scipy.stats import norm
 from wordcloud import WordCloud
 
 from ..configs import KDE, Bar, Box, Config, Pie, QQNorm, WordFrequency
-from ..dtypes import Continuous, DateTime, Nominal, is_dtype, GeoGraphy
+from ..dtypes import Continuous, DateTime, DType, Nominal, is_dtype, GeoGraphy
 from ..intermediate import Intermediate
 from ..palette import CATEGORY20, PASTEL1, RDBU, VIRIDIS, YlGnBu
 from ..utils import tweak_figure, _format_ticks, _format_axis, _format_bin_intervals
@@ -1372,7 +1372,8 @@ def format_ov_stats(stats: Dict[str, Any]) -> Tuple[Dict[str, str], Dict[str, An
     Render statistics information for distribution grid
     """
     # pylint: disable=too-many-locals
-    nrows, ncols, npresent_cells, nrows_wo_dups, mem_use, dtypes_cnt = stats.values()
+    nrows, ncols, npresent_cells = stats["nrows"], stats["ncols"], stats["npresent_cells"]
+    nrows_wo_dups, mem_use = stats["nrows_wo_dups"], stats["mem_use"]
     ncells = nrows * ncols
 
     data = {
@@ -1385,7 +1386,13 @@ def format_ov_stats(stats: Dict[str, Any]) -> Tuple[Dict[str, str], Dict[str, An
         "Total Size in Memory": float(mem_use),
         "Average Row Size in Memory": mem_use / nrows,
     }
-    return {k: _format_values(k, v) for k, v in data.items()}, dtypes_cnt
+    res = {k: _format_values(k, v) for k, v in data.items()}
+    if stats.get("mem_use_err"):
+        # the memory usage is estimated from a sample
+        err = stats["mem_use_err"]
+        res["Total Size in Memory"] += " ± " + _format_values("Memory", float(err))
+        res["Average Row Size in Memory"] += " ± " + _format_values("Memory", err / nrows)
+    return res, stats["dtype_cnts"]
 
 
 def format_num_stats(data: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
@@ -1483,7 +1490,7 @@ def render_distribution_grid(itmdt: Intermediate, cfg: Config) -> Dict[str, Any]
     htgs: Dict[str, Any] = {}
     nrows = itmdt["stats"]["nrows"]
     titles: List[str] = []
-    for col, dtp, data in itmdt["data"]:
+    for col, dtp, data in _grid_enabled(itmdt["data"], cfg):
         if is_dtype(dtp, Nominal()) or is_dtype(dtp, GeoGraphy()):
             df, ttl_grps = data
             fig = bar_viz(
@@ -1530,6 +1537,24 @@ def render_distribution_grid(itmdt: Intermediate, cfg: Config) -> Dict[str, Any]
     }
 
 
+def _grid_enabled(data: List[Tuple[str, DType, Any]], cfg: Config) -> List[Tuple[str, DType, Any]]:
+    """
+    The plots of plot(df) that compute_overview keeps with the enable flags of cfg.
+    An intermediate from the cache may have been computed with more plots enabled.
+    """
+    enabled = []
+    for col, dtp, dat in data:
+        if is_dtype(dtp, Continuous()):
+            enable = cfg.hist.enable
+        elif is_dtype(dtp, DateTime()):
+            enable = cfg.line.enable or cfg.insight.enable
+        else:  # Nominal or GeoGraphy
+            enable = cfg.bar.enable
+        if enable:
+            enabled.append((col, dtp, dat))
+    return enabled
+
+
 def render_cat(itmdt: Intermediate, cfg: Config) -> Dict[str, Any]:
     """
     Create visualizations for plot(df, Nominal)
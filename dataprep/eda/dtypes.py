@@ -1,12 +1,17 @@
 """
 In this module lives the type tree.
 """
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from typing import Any, DefaultDict, Dict, List, Optional, Tuple, Type, Union
 
+import dask
 import dask.dataframe as dd
 import numpy as np
 import pandas as pd
+from dask.base import tokenize
+from dask.utils import M
+from dask.dataframe.core import apply_concat_apply
+from dask.dataframe.hyperloglog import compute_hll_array, estimate_count
 from ..clean import validate_country, validate_lat_long
 from ..errors import UnreachableError
 
@@ -46,6 +51,18 @@ NULL_VALUES = {
     "",
 }
 
+# The maximum number of detection results kept in the dtype cache
+DTYPE_CACHE_SIZE = 4096
+
+# The number of rows inspected to detect the geography and geopoint types
+GEO_PROBE_SIZE = 100
+
+# The maximum number of partitions the rows above are drawn from
+GEO_PROBE_NPARTITIONS = 4
+
+# The number of bits used by HyperLogLog, the same as dask's nunique_approx
+HLL_BITS = 16
+
 
 class DType:
     """
@@ -133,6 +150,11 @@ DTypeOrStr = Union[DType, Type[DType], str, None]
 DTypeDict = Union[Dict[str, Union[DType, Type[DType], str]], None]
 DTypeDef = Union[Dict[str, Union[DType, Type[DType], str]], DType, Type[DType], None]
 
+# Detection results keyed by (dask graph token of the column, name of the user specified dtype).
+# Identical data yields identical dask graph names, so the cache is shared by all
+# the EDA functions and by repeated calls on the same DataFrame.
+_DTYPE_CACHE: "OrderedDict[Tuple[str, Optional[str]], DType]" = OrderedDict()
+
 
 def detect_dtype(
     col: dd.Series,
@@ -151,6 +173,120 @@ def detect_dtype(
         known_dtype = {"a": Continuous(), "b": "nominal"} or
         known_dtype = Continuous() or known_dtype = "Continuous" or known_dtype = Continuous()
     """
+    key = (tokenize(col), _known_dtype_key(col, known_dtype))
+    if key in _DTYPE_CACHE:
+        _DTYPE_CACHE.move_to_end(key)
+        return _DTYPE_CACHE[key]
+
+    dtype = _detect_dtype(col, known_dtype)
+
+    _DTYPE_CACHE[key] = dtype
+    if len(_DTYPE_CACHE) > DTYPE_CACHE_SIZE:
+        _DTYPE_CACHE.popitem(last=False)
+    return dtype
+
+
+def detect_dtypes(df: dd.DataFrame, known_dtype: Optional[DTypeDef] = None) -> Dict[str, DType]:
+    """
+    Detect the types of all the columns of a DataFrame. Unlike calling detect_dtype on
+    each column, the columns that are not in the dtype cache are detected together in a
+    single dask.compute: the distinct counts of the numerical columns are estimated by
+    one HyperLogLog reduction, and the geography and geopoint types are decided on a
+    bounded sample of rows, see geo_probe.
+
+    Parameters
+    ----------
+    df: dask.dataframe.DataFrame
+        A DataFrame
+    known_dtype: Optional[Union[Dict[str, Union[DType, str]], DType]], default None
+        The user specified types, see detect_dtype
+    """
+    dtypes: Dict[str, DType] = {}
+    keys: Dict[str, Tuple[str, Optional[str]]] = {}
+    num_cols: List[str] = []
+    nom_cols: List[str] = []
+    for col in df.columns:
+        srs = df[col]
+        key = (tokenize(srs), _known_dtype_key(srs, known_dtype))
+        if key in _DTYPE_CACHE:
+            _DTYPE_CACHE.move_to_end(key)
+            dtypes[col] = _DTYPE_CACHE[key]
+            continue
+        keys[col] = key
+
+        if key[1] is not None:  # the user specified the type, no data read is needed
+            dtypes[col] = _detect_dtype(srs, known_dtype)
+        elif is_nominal(srs.dtype):
+            nom_cols.append(col)
+        elif is_continuous(srs.dtype):
+            num_cols.append(col)
+        elif is_datetime(srs.dtype):
+            dtypes[col] = DateTime()
+        else:
+            raise UnreachableError
+
+    nuniques, head = dask.compute(
+        _nunique_approx(df[num_cols]) if num_cols else pd.Series([], dtype=float),
+        geo_probe(df[nom_cols]) if nom_cols else pd.DataFrame(),
+    )
+    head = head.iloc[:GEO_PROBE_SIZE]
+
+    for col in num_cols:
+        dtypes[col] = _numerical_dtype(nuniques[col])
+    for col in nom_cols:
+        dtypes[col] = _nominal_dtype(head[col])
+
+    for col, key in keys.items():
+        _DTYPE_CACHE[key] = dtypes[col]
+        if len(_DTYPE_CACHE) > DTYPE_CACHE_SIZE:
+            _DTYPE_CACHE.popitem(last=False)
+
+    return {col: dtypes[col] for col in df.columns}
+
+
+def _nunique_approx(df: dd.DataFrame) -> dd.Series:
+    """
+    Estimate the number of distinct values of every column using one HyperLogLog reduction.
+    The estimates are identical to calling nunique_approx on each column.
+    """
+    return apply_concat_apply(
+        [df],
+        chunk=_hll_chunk,
+        combine=_hll_combine,
+        aggregate=_hll_aggregate,
+        meta=pd.Series([], dtype=float),
+        token="nunique-approx-columns",
+        columns=list(df.columns),
+    )
+
+
+def _hll_chunk(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """
+    The HyperLogLog states of each column of a partition, flattened into one row
+    """
+    return np.concatenate([compute_hll_array(df[col], HLL_BITS) for col in columns])[None, :]
+
+
+def _hll_combine(states: np.ndarray, columns: List[str]) -> np.ndarray:
+    """
+    Merge the HyperLogLog states
+    """
+    # pylint: disable=unused-argument
+    return states.max(axis=0, keepdims=True)
+
+
+def _hll_aggregate(states: np.ndarray, columns: List[str]) -> pd.Series:
+    """
+    Merge the HyperLogLog states and estimate the distinct count of each column
+    """
+    state = states.max(axis=0).reshape(len(columns), -1)
+    return pd.Series([estimate_count(row, HLL_BITS) for row in state], index=columns)
+
+
+def _detect_dtype(col: dd.Series, known_dtype: Optional[DTypeDef] = None) -> DType:
+    """
+    Detect the type of a column without looking up the dtype cache
+    """
     if not known_dtype:
         return detect_without_known(col)
 
@@ -165,6 +301,28 @@ def detect_dtype(
     return detect_without_known(col)
 
 
+def _known_dtype_key(col: dd.Series, known_dtype: Optional[DTypeDef]) -> Optional[str]:
+    """
+    Return the name of the user specified dtype that applies to the column, if any
+    """
+    if not known_dtype:
+        return None
+
+    if isinstance(known_dtype, dict):
+        if col.name not in known_dtype:
+            return None
+        return type(map_dtype(normalize_dtype(known_dtype[col.name]))).__name__
+
+    return type(map_dtype(normalize_dtype(known_dtype))).__name__
+
+
+def clear_dtype_cache() -> None:
+    """
+    Remove all the detection results in the dtype cache
+    """
+    _DTYPE_CACHE.clear()
+
+
 def map_dtype(dtype: DType) -> DType:
     """
     Currently, we want to keep our Type System flattened.
@@ -199,12 +357,7 @@ def detect_without_known(col: dd.Series) -> DType:
             return Nominal()
 
     elif is_continuous(col.dtype):
-        # detect as categorical if distinct value is small
-        nuniques = col.nunique_approx().compute()
-        if nuniques < 10:
-            return Nominal()
-        else:
-            return Continuous()
+        return _numerical_dtype(col.nunique_approx().compute())
 
     elif is_datetime(col.dtype):
         return DateTime()
@@ -212,6 +365,29 @@ def detect_without_known(col: dd.Series) -> DType:
         raise UnreachableError
 
 
+def _numerical_dtype(nuniques: float) -> DType:
+    """
+    Decide the type of a numerical column from its (approximate) number of distinct values
+    """
+    # detect as categorical if distinct value is small
+    if nuniques < 10:
+        return Nominal()
+    else:
+        return Continuous()
+
+
+def _nominal_dtype(head: pd.Series) -> DType:
+    """
+    Decide the type of a nominal column from its first rows
+    """
+    if _is_geography(head):
+        return GeoGraphy()
+    if _is_geopoint(head):
+        return GeoPoint()
+    else:
+        return Nominal()
+
+
 def is_dtype(dtype1: Any, dtype2: DType) -> bool:
     """
     This function detects if dtype2 is dtype1.
@@ -267,20 +443,56 @@ def is_nominal(dtype: Any) -> bool:
         return any(isinstance(dtype, c) for c in CATEGORICAL_PANDAS_DTYPES)
 
 
+def geo_probe(df: Union[dd.DataFrame, dd.Series]) -> Union[dd.DataFrame, dd.Series]:
+    """
+    Return the rows used to detect the geography and geopoint types. The rows are
+    the leading rows of at most GEO_PROBE_NPARTITIONS partitions spread evenly over
+    the data, so that the cost of the detection does not grow with the data size and
+    the sample is not restricted to the beginning of a sorted dataset. The result has
+    slightly more than GEO_PROBE_SIZE rows when they do not divide evenly.
+
+    Parameters
+    ----------
+    df: Union[dask.dataframe.DataFrame, dask.dataframe.Series]
+        A DataFrame or a column
+    """
+    nparts = min(df.npartitions, GEO_PROBE_NPARTITIONS)
+    parts = np.unique(np.linspace(0, df.npartitions - 1, nparts).round().astype(int))
+    nrows = -(-GEO_PROBE_SIZE // len(parts))
+    return df.partitions[parts.tolist()].map_partitions(M.head, nrows)
+
+
 def is_geography(col: dd.Series) -> bool:
     """
     Given a column, return if its type is a geography type
     """
-    geo = col.compute()[:100]
-    geo_ratio: float = np.sum(validate_country(geo)) / geo.shape[0]
-    return geo_ratio > 0.8
+    return _is_geography(geo_probe(col).compute().iloc[:GEO_PROBE_SIZE])
 
 
 def is_geopoint(col: dd.Series) -> bool:
     """
     Given a column, return if its type is a geopoint type
     """
-    lat_long = pd.Series(col.compute()[:100], dtype="string")
+    return _is_geopoint(geo_probe(col).compute().iloc[:GEO_PROBE_SIZE])
+
+
+def _is_geography(geo: pd.Series) -> bool:
+    """
+    Given some values of a column, return if most of them are countries
+    """
+    if geo.shape[0] == 0:
+        return False
+    geo_ratio: float = np.sum(validate_country(geo)) / geo.shape[0]
+    return geo_ratio > 0.8
+
+
+def _is_geopoint(lat_long: pd.Series) -> bool:
+    """
+    Given some values of a column, return if most of them are (latitude, longitude) pairs
+    """
+    if lat_long.shape[0] == 0:
+        return False
+    lat_long = pd.Series(lat_long, dtype="string")
     lat_long_ratio: float = np.sum(validate_lat_long(lat_long)) / lat_long.shape[0]
     return lat_long_ratio > 0.8
 
@@ -355,8 +567,7 @@ def get_dtype_cnts_and_num_cols(
     """
     dtype_cnts: DefaultDict[str, int] = defaultdict(int)
     num_cols: List[str] = []
-    for col in df.columns:
-        col_dtype = detect_dtype(df[col], dtype)
+    for col, col_dtype in detect_dtypes(df, dtype).items():
         if is_dtype(col_dtype, Nominal()):
             dtype_cnts["Categorical"] += 1
         elif is_dtype(col_dtype, Continuous()):
@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Optional, Union
 import dask.dataframe as dd
 import pandas as pd
 
+from ..cache import PLOT_SECTIONS, cached_compute
 from ..configs import Config
 from ..container import Container
 from ..dtypes import DTypeDef
@@ -65,7 +66,9 @@ def plot_missing(
     cfg = Config.from_dict(display, config)
 
     with ProgressBar(minimum=1, disable=not progress):
-        itmdt = compute_missing(df, x, y, cfg=cfg, dtype=dtype)
+        itmdt = cached_compute(
+            compute_missing, df, x, y, cfg=cfg, dtype=dtype, sections=PLOT_SECTIONS
+        )
 
     to_render = render_missing(itmdt, cfg)
 
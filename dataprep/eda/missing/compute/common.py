@@ -1,44 +1,116 @@
 """Common parts for compute missing."""
-from typing import Optional, Tuple
+from functools import reduce
+from typing import Any, Dict, List, Optional, Tuple
 
+import dask
 import dask.array as da
 import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+from dask.delayed import Delayed
 
-from ...configs import Config
-from ...dtypes import Continuous, DTypeDef, Nominal, detect_dtype, is_dtype, GeoGraphy
+from ...distribution.compute.common import tree_reduce
+from ...distribution.compute.sketch import Grid, _grid_histogram, _grid_sketch, _merge_grids
+from ...dtypes import Continuous, DType, DTypeDef, Nominal, detect_dtype, is_dtype, GeoGraphy
 
 LABELS = ["Orignal data", "After drop missing values"]
 
 
-def uni_histogram(
-    srs: dd.Series,
-    cfg: Config,
-    dtype: Optional[DTypeDef] = None,
-) -> Tuple[da.Array, ...]:
-    """Calculate "histogram" for both numerical and categorical."""
-
-    if is_dtype(detect_dtype(srs, dtype), Continuous()):
-
-        counts, edges = da.histogram(srs, cfg.hist.bins, (srs.min(), srs.max()))
-        centers = (edges[:-1] + edges[1:]) / 2
-
-        return counts, centers, edges
-
-    elif is_dtype(detect_dtype(srs, dtype), Nominal()) or is_dtype(
-        detect_dtype(srs, dtype), GeoGraphy()
-    ):
-        # Dask array's unique is way slower than the values_counts on Series
-        # See https://github.com/dask/dask/issues/2851
-        # centers, counts = da.unique(arr, return_counts=True)
-
-        value_counts = srs.value_counts()
-
-        counts = value_counts.to_dask_array()
-        centers = value_counts.index.to_dask_array()
-
-        return (counts, centers)
+def impact_histograms(df: dd.DataFrame, x: str, dtypes: Dict[str, DType], bins: int) -> Delayed:
+    """Calculate the "histograms" of the columns before and after dropping the
+    rows where x is missing, by one pass over the partitions: each partition
+    computes the mask of x once, and the sketches of all the columns on both
+    sides of it. A continuous column is counted in mergeable grid histograms,
+    from which both histograms are derived over the range of the column. The
+    result is a delayed dict from the columns to the (counts, centers, edges)
+    or (counts, values) of both sides.
+
+    Parameters
+    ----------
+    df
+        The DataFrame
+    x
+        The column whose missing values are dropped
+    dtypes
+        The types of the columns to calculate, Continuous or Nominal
+    bins
+        The number of bins of the continuous columns
+    """
+    cont_cols = [col for col, dtype in dtypes.items() if is_dtype(dtype, Continuous())]
+    nom_cols = [col for col in dtypes if col not in cont_cols]
+
+    chunk = dask.delayed(_impact_chunk, pure=True)
+    parts = [chunk(part, x, cont_cols, nom_cols) for part in df.to_delayed(optimize_graph=False)]
+    state = tree_reduce(parts, _merge_impact)
+    return dask.delayed(_finalize_impact, pure=True)(state, cont_cols, bins)
+
+
+def _impact_chunk(
+    part: pd.DataFrame, x: str, cont_cols: List[str], nom_cols: List[str]
+) -> Dict[str, List[Any]]:
+    """Calculate the sketches of the columns of a partition before and after
+    dropping the rows where x is missing"""
+    mask = part[x].notna().to_numpy()
+    hists: Dict[str, List[Any]] = {}
+    for col in cont_cols:
+        arr = part[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        fin = np.isfinite(arr)
+        hists[col] = [_grid_sketch(arr[sel]) if sel.any() else None for sel in [fin, fin & mask]]
+    for col in nom_cols:
+        srs = part[col]
+        hists[col] = [srs.value_counts(), srs[mask].value_counts()]
+    return hists
+
+
+def _merge_impact(states: List[Dict[str, List[Any]]]) -> Dict[str, List[Any]]:
+    """Merge the sketches of several partitions"""
+    merged = {}
+    for col, hists in states[0].items():
+        merged[col] = [
+            reduce(lambda lhs, rhs: lhs.add(rhs, fill_value=0), [state[col][i] for state in states])
+            if isinstance(hist, pd.Series)
+            else reduce(_merge_grids, [state[col][i] for state in states])
+            for i, hist in enumerate(hists)
+        ]
+    return merged
+
+
+def _finalize_impact(
+    state: Dict[str, List[Any]], cont_cols: List[str], bins: int
+) -> Dict[str, Tuple[Tuple[np.ndarray, ...], Tuple[np.ndarray, ...]]]:
+    """The (counts, centers, edges) of the continuous columns and the (counts,
+    values) of the nominal columns, from the most frequent value"""
+    hists: Dict[str, Tuple[Tuple[np.ndarray, ...], Tuple[np.ndarray, ...]]] = {}
+    for col, (before, after) in state.items():
+        if col in cont_cols:
+            hists[col] = _impact_cont_hists(before, after, bins)
+        else:
+            before, after = before.sort_values(ascending=False), after.sort_values(ascending=False)
+            hists[col] = (
+                (before.to_numpy(dtype=np.int64), before.index.to_numpy()),
+                (after.to_numpy(dtype=np.int64), after.index.to_numpy()),
+            )
+    return hists
+
+
+def _impact_cont_hists(
+    before: Optional[Grid], after: Optional[Grid], bins: int
+) -> Tuple[Tuple[np.ndarray, ...], Tuple[np.ndarray, ...]]:
+    """The (counts, centers, edges) of a continuous column before and after
+    dropping the missing values, over the range of the column, (0, 1) if it has
+    no values"""
+    if before is None:
+        edges = np.histogram_bin_edges([], bins, (0.0, 1.0))
+        counts = [np.zeros(bins, dtype=np.int64)] * 2
     else:
-        raise ValueError(f"Unsupported dtype {srs.dtype}")
+        # the first and the last cells of a grid hold the minimum and the maximum
+        minv, maxv = before[3][0], before[4][-1]
+        cnts, edges = _grid_histogram(before, bins, minv, maxv)
+        counts = [cnts, np.zeros(bins, dtype=np.int64)]
+        if after is not None:
+            counts[1] = _grid_histogram(after, bins, minv, maxv)[0]
+    centers = (edges[:-1] + edges[1:]) / 2
+    return (counts[0], centers, edges), (counts[1], centers, edges)
 
 
 def histogram(
@@ -1,7 +1,7 @@
 """This module implements the plot_missing(df) function's
 calculating intermediate part
 """
-from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
+from typing import Any, Dict, Generator, List, Optional, Tuple
 
 import dask.array as da
 import dask.dataframe as dd
@@ -9,13 +9,18 @@ import numpy as np
 import pandas as pd
 from dask import delayed
 from scipy.cluster import hierarchy
+from scipy.spatial.distance import squareform
 
 from ...configs import Config
-from ...data_array import DataArray
+from ...data_array import DataArray, popcount
+from ...distribution.compute.common import tree_reduce
 from ...intermediate import Intermediate
 from ...staged import staged
 from ...utils import cut_long_name
 
+# The number of rows unpacked at a time to count the co-null pairs of columns
+GRAM_ROWS = 1 << 16
+
 
 def _compute_missing_nullivariate(df: DataArray, cfg: Config) -> Generator[Any, Any, Intermediate]:
     """Calculate the data for visualizing the plot_missing(df).
@@ -26,14 +31,13 @@ def _compute_missing_nullivariate(df: DataArray, cfg: Config) -> Generator[Any,
 
     df.compute()
 
-    nullity = df.nulls
-    null_cnts = nullity.sum(axis=0)
+    null_cnts = missing_col_counts(df)
     nrows = df.shape[0]
     ncols = df.shape[1]
     null_perc = null_cnts / nrows
-    miss_perc = nullity.sum() / (nrows * ncols)
-    avg_row = nullity.sum() / nrows
-    avg_col = nullity.sum() / ncols
+    miss_perc = null_cnts.sum() / (nrows * ncols)
+    avg_row = null_cnts.sum() / nrows
+    avg_col = null_cnts.sum() / ncols
 
     tasks = (
         missing_spectrum(df, cfg.spectrum.bins) if cfg.spectrum.enable else None,
@@ -41,7 +45,7 @@ def _compute_missing_nullivariate(df: DataArray, cfg: Config) -> Generator[Any,
         missing_bars(null_cnts, df.columns.values, nrows) if cfg.bar.enable else None,
         missing_heatmap(df) if cfg.heatmap.enable else None,
         missing_dendrogram(df) if cfg.dendro.enable else None,
-        nullity.sum() if cfg.stats.enable else None,
+        null_cnts.sum() if cfg.stats.enable else None,
         missing_col_cnt(df) if cfg.stats.enable else None,
         missing_row_cnt(df) if cfg.stats.enable else None,
         missing_most_col(df) if cfg.insight.enable else None,
@@ -71,12 +75,9 @@ def _compute_missing_nullivariate(df: DataArray, cfg: Config) -> Generator[Any,
 
     if cfg.heatmap.enable:
         sel = ~((null_perc == 0) | (null_perc == 1))
-        if nrows != 1:
-            heatmap = pd.DataFrame(
-                data=heatmap[:, sel][sel, :], columns=df.columns[sel], index=df.columns[sel]
-            )
-        else:
-            heatmap = pd.DataFrame(data=heatmap, columns=df.columns[sel], index=df.columns[sel])
+        heatmap = pd.DataFrame(
+            data=heatmap[:, sel][sel, :], columns=df.columns[sel], index=df.columns[sel]
+        )
 
     if cfg.stats.enable:
         missing_stat = {
@@ -144,84 +145,62 @@ def _compute_missing_nullivariate(df: DataArray, cfg: Config) -> Generator[Any,
 compute_missing_nullivariate = staged(_compute_missing_nullivariate)  # pylint: disable=invalid-name
 
 
-def missing_perc_blockwise(bin_size: int) -> Callable[[np.ndarray], np.ndarray]:
-    """Compute the missing percentage in a block."""
-
-    def imp(block: np.ndarray) -> np.ndarray:
-        nbins = block.shape[0] // bin_size
-
-        sep = nbins * bin_size
-        block1 = block[:sep].reshape((bin_size, nbins, *block.shape[1:]))
-        ret = block1.sum(axis=0) / bin_size
-
-        # remaining data that cannot be fit into a single bin
-        if block.shape[0] != sep:
-            ret_remainder = block[sep:].sum(axis=0, keepdims=True) / (block.shape[0] - sep)
-            ret = np.concatenate([ret, ret_remainder], axis=0)
-
-        return ret
-
-    return imp
-
-
-def missing_spectrum(
-    df: DataArray, bins: int
-) -> Dict[str, da.Array]:  # pylint: disable=too-many-locals
-    """Calculate a missing spectrum for each column."""
+def missing_spectrum(df: DataArray, bins: int) -> Dict[str, Any]:
+    """Calculate a missing spectrum for each column. The rows are split into bins
+    of equal size but the last one. Each row block of the packed nullity adds up
+    the missing values of the bins it overlaps, the bins which span two blocks
+    are summed from both, so the nullity is read once and never rechunked."""
 
     nrows, ncols = df.shape
-    data = df.nulls
-
-    if nrows > 1:
-        num_bins = min(bins, nrows - 1)
-        bin_size = nrows // num_bins
-        chunk_size = min(
-            1024 * 1024 * 128, nrows * ncols
-        )  # max 1024 x 1024 x 128 Bytes bool values
-        nbins_per_chunk = max(chunk_size // (bin_size * data.shape[1]), 1)
-        chunk_size = nbins_per_chunk * bin_size
-        data = data.rechunk((chunk_size, None))
-        sep = nrows // chunk_size * chunk_size
-    else:
-        # avoid division or module by zero
-        bin_size = 1
-        nbins_per_chunk = 1
-        chunk_size = 1
-        data = data.rechunk((chunk_size, None))
-        sep = 1
-
-    spectrum_missing_percs = data[:sep].map_blocks(
-        missing_perc_blockwise(bin_size),
-        chunks=(nbins_per_chunk, *data.chunksize[1:]),
-        dtype=float,
-    )
-
-    # calculation for the last chunk
-    if sep != nrows:
-        spectrum_missing_percs_remain = data[sep:].map_blocks(
-            missing_perc_blockwise(bin_size),
-            chunks=(int(np.ceil((nrows - sep) / bin_size)), *data.shape[1:]),
-            dtype=float,
-        )
-        spectrum_missing_percs = da.concatenate(
-            [spectrum_missing_percs, spectrum_missing_percs_remain], axis=0
-        )
-
-    num_bins = spectrum_missing_percs.shape[0]
-
-    locs0 = da.arange(num_bins) * bin_size
-    locs1 = da.minimum(locs0 + bin_size, nrows)
+    bin_size = nrows // min(bins, nrows - 1) if nrows > 1 else 1
+    num_bins = -(-nrows // bin_size)
+
+    rows = df.values.chunks[0]
+    offsets = np.cumsum((0,) + rows[:-1])
+    blocks = df.packed_nulls.rechunk({1: -1}).to_delayed().ravel()
+    chunk = delayed(_spectrum_block, pure=True)
+    parts = [chunk(*args, bin_size) for args in zip(blocks, rows, offsets)]
+    rates = delayed(_spectrum_rates, pure=True)(parts, num_bins, bin_size, nrows, ncols)
+
+    locs0 = np.arange(num_bins) * bin_size
+    locs1 = np.minimum(locs0 + bin_size, nrows)
     locs_middle = locs0 + bin_size / 2
 
     return {
-        "column": da.repeat(da.from_array(df.columns.values, (1,)), num_bins),
-        "location": da.tile(locs_middle, ncols),
-        "missing_rate": spectrum_missing_percs.T.ravel().rechunk(locs_middle.shape[0]),
-        "loc_start": da.tile(locs0, ncols),
-        "loc_end": da.tile(locs1, ncols),
+        "column": np.repeat(df.columns.values, num_bins),
+        "location": np.tile(locs_middle, ncols),
+        "missing_rate": da.from_delayed(rates, shape=(num_bins * ncols,), dtype=float),
+        "loc_start": np.tile(locs0, ncols),
+        "loc_end": np.tile(locs1, ncols),
     }
 
 
+def _spectrum_block(
+    block: np.ndarray, nrows: int, offset: int, bin_size: int
+) -> Tuple[int, np.ndarray]:
+    """Calculate the missing counts of the bins overlapped by a block of the packed
+    nullity, and the index of the first of these bins."""
+    if nrows == 0:
+        return 0, np.zeros((0, block.shape[1]), dtype=np.int64)
+    first, last = offset // bin_size, (offset + nrows - 1) // bin_size
+    starts = np.maximum(np.arange(first, last + 1) * bin_size - offset, 0)
+    nulls = np.unpackbits(block, axis=0, count=nrows)
+    return first, np.add.reduceat(nulls, starts, axis=0, dtype=np.int64)
+
+
+def _spectrum_rates(
+    parts: List[Tuple[int, np.ndarray]], num_bins: int, bin_size: int, nrows: int, ncols: int
+) -> np.ndarray:
+    """Merge the missing counts of the bins of the blocks into the missing rates of
+    the bins, column by column."""
+    cnts = np.zeros((num_bins, ncols), dtype=np.int64)
+    for first, part in parts:
+        cnts[first : first + part.shape[0]] += part
+    locs0 = np.arange(num_bins) * bin_size
+    lens = np.minimum(locs0 + bin_size, nrows) - locs0
+    return (cnts / lens[:, None]).T.ravel()
+
+
 def missing_bars(
     null_cnts: da.Array, cols: np.ndarray, nrows: dd.core.Scalar
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -234,13 +213,13 @@ def missing_heatmap(df: DataArray) -> Optional[pd.DataFrame]:
     """Calculate a heatmap visualization of nullity correlation
     in the given DataFrame."""
 
-    return da.corrcoef(df.nulls, rowvar=False)
+    return delayed(_nullity_corr, pure=True)(missing_gram(df), df.shape[0])
 
 
 def missing_dendrogram(df: DataArray) -> Any:
     """Calculate a missing values dendrogram."""
     # Link the hierarchical output matrix, figure out orientation, construct base dendrogram.
-    linkage_matrix = delayed(hierarchy.linkage)(df.nulls.T, "average")
+    linkage_matrix = delayed(_nullity_linkage, pure=True)(missing_gram(df))
 
     dendrogram = delayed(hierarchy.dendrogram)(
         Z=linkage_matrix,
@@ -253,22 +232,85 @@ def missing_dendrogram(df: DataArray) -> Any:
     return dendrogram
 
 
+def missing_gram(df: DataArray) -> Any:
+    """Calculate the co-null counts of all the pairs of columns, the numbers of
+    rows where both columns are missing, with the missing counts of the columns on
+    the diagonal. Each row block is reduced to its counts from the packed nullity,
+    and the counts are summed by a tree reduction."""
+    rows = df.values.chunks[0]
+    blocks = df.packed_nulls.rechunk({1: -1}).to_delayed().ravel()
+    chunk = delayed(_gram_block, pure=True)
+    return tree_reduce([chunk(block, nrows) for block, nrows in zip(blocks, rows)], sum)
+
+
+def _gram_block(block: np.ndarray, nrows: int) -> np.ndarray:
+    """Calculate the co-null counts of a block of the packed nullity."""
+    gram = np.zeros((block.shape[1], block.shape[1]), dtype=np.int64)
+    # unpack a slice of rows at a time, the float32 products are exact below 2^24 rows
+    step = GRAM_ROWS // 8
+    for start in range(0, block.shape[0], step):
+        count = min(nrows - start * 8, GRAM_ROWS)
+        nulls = np.unpackbits(block[start : start + step], axis=0, count=count)
+        nulls = nulls.astype(np.float32)
+        gram += (nulls.T @ nulls).astype(np.int64)
+    return gram
+
+
+def _nullity_corr(gram: np.ndarray, nrows: int) -> np.ndarray:
+    """Calculate the nullity correlation matrix from the co-null counts."""
+    cnts = np.diag(gram)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = gram / nrows - np.outer(cnts, cnts) / nrows ** 2
+        var = np.diag(cov)
+        denom = np.sqrt(np.outer(var, var))
+        corr = np.where(denom > 0, cov / denom, np.nan)
+    return np.clip(corr, -1, 1)
+
+
+def _nullity_linkage(gram: np.ndarray) -> np.ndarray:
+    """Calculate the average linkage of the columns from the co-null counts. The
+    euclidean distance of the nullity of two columns is the square root of the
+    number of rows where exactly one of them is missing."""
+    cnts = np.diag(gram)
+    dists = np.sqrt(np.maximum(cnts[:, None] + cnts[None, :] - 2 * gram, 0))
+    np.fill_diagonal(dists, 0)
+    return hierarchy.linkage(squareform(dists, checks=False), "average")
+
+
+def missing_col_counts(df: DataArray) -> da.Array:
+    """Count the missing values of each column by the popcounts of the packed nullity."""
+    return popcount(df.packed_nulls).sum(axis=0)
+
+
+def missing_row_counts(df: DataArray) -> da.Array:
+    """Count the missing values of each row from the packed nullity, one bit
+    of the bytes at a time."""
+    rows = df.values.chunks[0]
+    return df.packed_nulls.map_blocks(
+        _row_counts,
+        rows=rows,
+        dtype=np.int64,
+        chunks=(rows,),
+        drop_axis=1,
+        meta=np.empty(0, dtype=np.int64),
+    )
+
+
+def _row_counts(block: np.ndarray, rows: Tuple[int, ...], block_info: Any = None) -> np.ndarray:
+    """Count the missing values of each row of a block of the packed nullity."""
+    count = rows[block_info[0]["chunk-location"][0]]
+    cnts = [((block >> (7 - bit)) & 1).sum(axis=1) for bit in range(8)]
+    return np.stack(cnts, axis=1).ravel()[:count]
+
+
 def missing_col_cnt(df: DataArray) -> Any:
     """Calculate how many columns contain missing values."""
-    nulls = df.nulls
-    rst = nulls.sum(0)
-    rst = rst[rst > 0]
-
-    return (rst > 0).sum()
+    return (missing_col_counts(df) > 0).sum()
 
 
 def missing_row_cnt(df: DataArray) -> Any:
     """Calculate how many rows contain missing values."""
-    nulls = df.nulls
-    rst = nulls.sum(1)
-    rst = rst[rst > 0]
-
-    return (rst > 0).sum()
+    return (missing_row_counts(df) > 0).sum()
 
 
 def missing_most_col(df: DataArray) -> Tuple[int, float, List[Any]]:
@@ -288,8 +330,7 @@ def missing_most_col(df: DataArray) -> Tuple[int, float, List[Any]]:
     rst
         a list of column indices with highest missing rate
     """
-    nulls = df.nulls
-    col_sum = nulls.sum(axis=0)
+    col_sum = missing_col_counts(df)
     maximum = col_sum.max()
     rate = maximum / df.shape[0]
     cnt = (col_sum == maximum).sum()
@@ -315,8 +356,7 @@ def missing_most_row(df: DataArray) -> Tuple[int, float, List[Any]]:
     rst
         a list of row indices with highest missing rate
     """
-    nulls = df.nulls
-    row_sum = nulls.sum(axis=1)
+    row_sum = missing_row_counts(df)
     maximum = row_sum.max()
     rate = maximum / df.shape[1]
     cnt = (row_sum == maximum).sum()
@@ -8,10 +8,10 @@ import pandas as pd
 
 from ...configs import Config
 from ...data_array import DataArray
-from ...dtypes import DTypeDef, Continuous, Nominal, GeoGraphy, detect_dtype, is_dtype
+from ...dtypes import DTypeDef, Continuous, Nominal, GeoGraphy, detect_dtypes, is_dtype
 from ...intermediate import ColumnsMetadata, Intermediate
 from ...staged import staged
-from .common import LABELS, uni_histogram
+from .common import LABELS, impact_histograms
 
 
 def _compute_missing_univariate(  # pylint: disable=too-many-locals
@@ -24,28 +24,24 @@ def _compute_missing_univariate(  # pylint: disable=too-many-locals
     the missing values in x is dropped."""
     # pylint: disable = too-many-boolean-expressions
 
-    # dataframe with all rows where column x is null removed
-    ddf = df.frame[~df.frame[x].isna()]
-
-    hists = {}
-
-    for col in df.columns:
+    dtypes = {}
+    for col, col_dtype in detect_dtypes(df.frame, dtype).items():
         if (
             col == x
-            or (
-                is_dtype(detect_dtype(df.frame[col]), Nominal())
-                or is_dtype(detect_dtype(df.frame[col]), GeoGraphy())
-            )
+            or (is_dtype(col_dtype, Nominal()) or is_dtype(col_dtype, GeoGraphy()))
             and not cfg.bar.enable
-            or is_dtype(detect_dtype(df.frame[col]), Continuous())
+            or is_dtype(col_dtype, Continuous())
             and not cfg.hist.enable
         ):
             continue
+        if not any(
+            is_dtype(col_dtype, dtype_) for dtype_ in [Continuous(), Nominal(), GeoGraphy()]
+        ):
+            raise ValueError(f"Unsupported dtype {df.frame[col].dtype}")
+        dtypes[col] = col_dtype
 
-        srs0 = df.frame[col].dropna()  # series from original dataframe
-        srs1 = ddf[col].dropna()  # series with null rows from col x removed
-
-        hists[col] = [uni_histogram(srs, cfg, dtype) for srs in [srs0, srs1]]
+    # the histograms of all the columns before and after the rows where x is null are removed
+    hists = impact_histograms(df.frame, x, dtypes, cfg.hist.bins)
 
     ### Lazy Region End
     hists = yield hists
@@ -82,8 +78,7 @@ def _compute_missing_univariate(  # pylint: disable=too-many-locals
         # If the cardinality of a categorical column is too large,
         # we show the top `num_bins` values, sorted by their count before drop
         if len(counts[0]) > cfg.bar.bars and (
-            is_dtype(detect_dtype(df.frame[col_name], dtype), Nominal())
-            or is_dtype(detect_dtype(df.frame[col_name], dtype), GeoGraphy())
+            is_dtype(dtypes[col_name], Nominal()) or is_dtype(dtypes[col_name], GeoGraphy())
         ):
             sortidx = np.argsort(-counts[0])
             selected_xs = xs[0][sortidx[: cfg.bar.bars]]
@@ -92,7 +87,7 @@ def _compute_missing_univariate(  # pylint: disable=too-many-locals
         else:
             meta[col_name, "shown"] = len(counts[0])
         meta[col_name, "total"] = len(counts[0])
-        meta[col_name, "dtype"] = detect_dtype(df.frame[col_name], dtype)
+        meta[col_name, "dtype"] = dtypes[col_name]
         dfs[col_name] = ret_df
 
     return Intermediate(data=dfs, x=x, meta=meta, visual_type="missing_impact_1vn")
@@ -346,7 +346,7 @@ def render_missing_impact(itmdt: Intermediate, cfg: Config) -> Dict[str, Any]:
         stat_dict = {name: itmdt["missing_stat"][name] for name in itmdt["missing_stat"]}
 
     return {
-        "insights": itmdt["insights"],
+        "insights": itmdt["insights"] if cfg.insight.enable else {},
         "tabledata": {"Missing Statistics": stat_dict} if cfg.stats.enable else {},
         "layout": [panel.child.children[0] for panel in tabs],
         "meta": [panel.title for panel in tabs],
@@ -628,13 +628,15 @@ def render_missing_impact_1vn(itmdt: Intermediate, cfg: Config) -> Dict[str, Any
     plot_width = cfg.plot.width if cfg.plot.width is not None else 300
     plot_height = cfg.plot.height if cfg.plot.height is not None else 300
 
-    dfs = itmdt["data"]
     x = itmdt["x"]
     meta = itmdt["meta"]
     panels = []
     htgs: Dict[str, List[Tuple[str, str]]] = {}
     titles: List[str] = []
-    for col, df in dfs.items():
+    for col, df in itmdt["data"].items():
+        enable = cfg.hist.enable if is_dtype(meta[col]["dtype"], Continuous()) else cfg.bar.enable
+        if not enable:
+            continue  # an intermediate from the cache may have more columns enabled
         title = f"Missing impact of {x} by {col}"
         fig = render_hist(df, col, meta[col], plot_width, plot_height, False)
         fig.frame_height = plot_height
@@ -0,0 +1,106 @@
+"""
+    module for testing the cache of the computed intermediates.
+"""
+import os
+from pathlib import Path
+from typing import Any, List
+
+import numpy as np
+import pandas as pd
+
+from ...eda import create_report, plot, plot_correlation, plot_missing
+from ...eda.cache import cached_compute, clear_cache
+from ...eda.configs import Config
+from ...eda.dtypes import Nominal
+
+
+def test_cached_compute(tmp_path: Path) -> None:
+    calls: List[Any] = []
+
+    def compute(df: pd.DataFrame, x: str, *, cfg: Config, dtype: Any = None) -> Any:
+        calls.append(x)
+        return df[x].sum(), cfg.hist.bins
+
+    def run(df: pd.DataFrame, x: str = "a", **kwargs: Any) -> Any:
+        config = {"cache.enable": True, "cache.path": str(tmp_path), **kwargs.pop("config", {})}
+        cfg = Config.from_dict(None, config)
+        return cached_compute(compute, df, x, cfg=cfg, sections=["hist", "kde"], **kwargs)
+
+    df = pd.DataFrame({"a": range(100), "b": ["x", "y"] * 50})
+    assert run(df) == (4950, 50)
+    # the same data, another size of the plots or a subset of the sections hits the cache
+    assert run(df.copy()) == (4950, 50)
+    assert run(df, config={"height": 100}) == (4950, 50)
+    assert run(df, config={"kde.enable": False}) == (4950, 50)
+    assert len(calls) == 1
+    # other data, arguments, computation parameters or enabled plots miss the cache
+    assert run(df.assign(a=df["a"] + 1)) == (5050, 50)
+    assert run(df, "b", dtype={"b": Nominal()}) == ("xy" * 50, 50)
+    assert run(df, config={"hist.bins": 10}) == (4950, 10)
+    assert run(df, config={"bar.enable": False}) == (4950, 50)
+    assert len(calls) == 5
+    # an entry computed for a subset of the sections is not reused for more sections
+    run(df.iloc[:10], config={"kde.enable": False})
+    run(df.iloc[:10])
+    assert len(calls) == 7
+    # the cache is off by default
+    cached_compute(compute, df, "a", cfg=Config())
+    assert len(calls) == 8
+
+    clear_cache(str(tmp_path))
+    assert not list(tmp_path.iterdir())
+
+
+def test_cache_eviction(tmp_path: Path) -> None:
+    calls: List[int] = []
+
+    def compute(df: pd.DataFrame, *, cfg: Config) -> Any:  # pylint: disable=unused-argument
+        calls.append(df.index[0])
+        return df.values
+
+    size = 3 * 9000  # an entry takes about 8.5 kB
+    config = {"cache.enable": True, "cache.path": str(tmp_path), "cache.size": size}
+    cfg = Config.from_dict(None, config)
+    dfs = [pd.DataFrame({"a": np.random.rand(1000)}, index=range(i, i + 1000)) for i in range(5)]
+    for i, df in enumerate(dfs):
+        cached_compute(compute, df, cfg=cfg)
+        # the entries are ordered by their modification time, whose resolution may be coarse
+        for entry in tmp_path.glob("*.pkl"):
+            os.utime(entry, (entry.stat().st_atime, entry.stat().st_mtime - 10))
+        if i == 2:
+            cached_compute(compute, dfs[0], cfg=cfg)  # dfs[0] becomes the most recently used
+    assert calls == [0, 1, 2, 3, 4]
+
+    entries = list(tmp_path.glob("*.pkl"))
+    assert len(entries) == 3
+    assert sum(entry.stat().st_size for entry in entries) <= size
+    for df in [dfs[0], dfs[3], dfs[4]]:
+        assert np.array_equal(cached_compute(compute, df, cfg=cfg), df.values)
+    assert calls == [0, 1, 2, 3, 4]
+
+
+def test_cache_plots(tmp_path: Path) -> None:
+    df = pd.DataFrame({"a": [1.0, np.nan] * 50, "c": np.arange(100.0)})
+    df["b"] = ["x", None, "y", "z"] * 25
+    config = {"cache.enable": True, "cache.path": str(tmp_path)}
+
+    first = plot_missing(df, config=config, progress=False)
+    second = plot_missing(df, config={**config, "height": 200}, progress=False)
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+    assert first.context.meta == second.context.meta
+
+    # fewer displayed plots hit the cache, and only the displayed plots are rendered
+    third = plot_missing(df, config=config, display=["Bar Chart"], progress=False)
+    assert third.context.meta == ["Bar Chart"]
+    assert plot(df, config=config, progress=False).context.meta == ["a", "c", "b"]
+    grid = plot(df, config=config, display=["Histogram"], progress=False)
+    assert grid.context.meta == ["c"]
+    plot_correlation(df, config=config, progress=False)
+    corr = plot_correlation(df, config=config, display=["Spearman"], progress=False)
+    assert corr.context.meta == ["Spearman"]
+    assert len(list(tmp_path.glob("*.pkl"))) == 3
+
+    create_report(df, config=config, progress=False)
+    report = create_report(df, config=config, display=["Missing Values"], progress=False)
+    assert len(list(tmp_path.glob("*.pkl"))) == 4
+    assert "Missing Values" in report.report and "Interactions" not in report.report
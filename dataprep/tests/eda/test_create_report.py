@@ -1,11 +1,22 @@
 """
     module for testing create_report(df) function.
 """
+import gzip
+import json
 import logging
+import re
+from pathlib import Path
+
+import dask.dataframe as dd
 import numpy as np
 import pandas as pd
 import pytest
-from ...eda import create_report
+from bokeh.models import ColumnDataSource
+from bokeh.plotting import figure
+from bokeh.resources import CDN
+from ...eda import compute_profile, create_report
+from ...eda.configs import Config
+from ...eda.create_report.formatter import compute_basic, encode_sources, format_report
 
 LOGGER = logging.getLogger(__name__)
 
@@ -39,7 +50,14 @@ def simpledf() -> pd.DataFrame:
 
 @pytest.fixture(scope="module")  # type: ignore
 def constantdf() -> pd.DataFrame:
-    df = pd.DataFrame({"a": [0] * 10, "b": [1] * 10, "c": [np.nan] * 10})
+    df = pd.DataFrame(
+        {
+            "a": [0] * 10,
+            "b": [1] * 10,
+            "c": [np.nan] * 10,
+            "d": pd.Series([pd.NaT] * 10, dtype="datetime64[ns]"),
+        }
+    )
 
     return df
 
@@ -73,3 +91,79 @@ def test_report_constant(constantdf: pd.DataFrame) -> None:
 
         matplotlib.use("PS")
     create_report(constantdf, mode="basic")
+
+
+def test_datetime_fallback() -> None:
+    dates = pd.Series(pd.to_datetime(["2020-01-01", "2020-02-01"] * 50))
+    df = dd.from_pandas(pd.DataFrame({"a": dates, "b": dates.where(dates.index >= 60)}), 2)
+    df["c"] = df["a"].where(df["a"].isna())
+    data, _ = compute_basic(df, Config())
+    # a partition without timestamps does not make the column all-nan
+    assert "line" in data["a"] and "line" in data["b"] and "nominal" not in data["b"]
+    assert "line" not in data["c"] and data["c"]["nrows"] == 100
+
+
+def test_report_workers(simpledf: pd.DataFrame) -> None:
+    # the pool forks the process, so it is opt-in
+    assert Config().variables.workers == 1
+    cfg = Config.from_dict(display=["Variables"], config={"variables.workers": 2})
+    variables = format_report(simpledf, cfg, "basic", progress=False)["variables"]
+    assert list(variables) == list(simpledf.columns)
+    divs = [div for var in variables.values() for div in var["plots"][1]]
+    ids = re.findall(r'data-root-id="([^"]+)"', "".join(divs))
+    assert len(ids) == len(divs) == len(set(ids))
+
+
+def test_report_lazy(simpledf: pd.DataFrame) -> None:
+    report = create_report(
+        simpledf, display=["Variables"], config={"variables.lazy": True}, progress=False
+    ).report
+    docs = re.findall(r'<script type="application/json" class="var-doc">(.*?)</script>', report)
+    assert len(docs) == simpledf.shape[1]
+    for doc in docs:
+        chunk = json.loads(doc)
+        roots = chunk["items"][0]["roots"]
+        assert set(roots) <= set(chunk["docs"][chunk["items"][0]["docid"]]["roots"]["root_ids"])
+        assert all(f'data-root-id="{root}"' in report for root in roots)
+    assert "Bokeh.safely" not in report
+
+    # the documents are parsed as they are, without decoding HTML entities
+    df = pd.DataFrame({"dept": ["R&D", "Sales <EU>", "</script>", "R&D"]})
+    report = create_report(
+        df, display=["Variables"], config={"variables.lazy": True}, progress=False
+    ).report
+    (doc,) = re.findall(r'<script type="application/json" class="var-doc">(.*?)</script>', report)
+    values = json.dumps(json.loads(doc), ensure_ascii=False)
+    assert all(f'"{val}"' in values for val in ["R&D", "Sales <EU>", "</script>"])
+
+
+def test_report_save(simpledf: pd.DataFrame, tmp_path: Path) -> None:
+    report = create_report(simpledf, display=["Variables"], progress=False)
+    report.save("report", str(tmp_path))
+    assert (tmp_path / "report.html").read_text(encoding="utf-8") == report.report
+
+    report.save("report", str(tmp_path), compress=True, resources="cdn")
+    with gzip.open(tmp_path / "report.html.gz", "rt", encoding="utf-8") as file:
+        saved = file.read()
+    assert "https://cdn.bokeh.org/bokeh/release/" in saved
+    assert report.resources not in saved
+    assert saved.replace(CDN.render(), report.resources) == report.report
+
+    with pytest.raises(ValueError):
+        report.save("report", str(tmp_path), resources="nowhere")
+
+
+def test_encode_sources() -> None:
+    fig = figure()
+    fig.line(x=list(range(100)), y=np.random.rand(100).tolist())
+    fig.circle(x=[0.5, 1.5], y=[0.5, 1.5])
+    encode_sources([fig])
+    sources = [source.data for source in fig.select({"type": ColumnDataSource})]
+    circle, line = sorted(sources, key=lambda data: len(data["x"]))
+    assert isinstance(line["x"], list) and line["y"].dtype == np.float64
+    assert isinstance(circle["x"], list) and isinstance(circle["y"], list)
+
+
+def test_report_profile(simpledf: pd.DataFrame) -> None:
+    with pytest.raises(TypeError, match="plot\\(profile\\)"):
+        create_report(compute_profile(simpledf[["a", "b", "d"]]))
@@ -0,0 +1,77 @@
+"""
+    module for testing the type detection.
+"""
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+
+from ...eda.dtypes import (
+    Continuous,
+    DateTime,
+    GeoGraphy,
+    Nominal,
+    clear_dtype_cache,
+    detect_dtype,
+    detect_dtypes,
+    geo_probe,
+    is_geography,
+)
+
+
+def test_dtype_cache() -> None:
+    df = dd.from_pandas(pd.DataFrame({"a": range(100), "b": [1, 2] * 50}), npartitions=2)
+
+    dtype = detect_dtype(df["a"])
+    assert isinstance(dtype, Continuous)
+    assert detect_dtype(df["a"]) is dtype
+    # the same data gives the same graph token thus hits the cache
+    df2 = dd.from_pandas(pd.DataFrame({"a": range(100), "b": [1, 2] * 50}), npartitions=2)
+    assert detect_dtype(df2["a"]) is dtype
+    # the user specified dtype is part of the key
+    assert isinstance(detect_dtype(df["a"], {"a": "nominal"}), Nominal)
+    assert isinstance(detect_dtype(df["a"], {"b": "nominal"}), Continuous)
+    assert isinstance(detect_dtype(df["b"]), Nominal)
+
+    clear_dtype_cache()
+    assert detect_dtype(df["a"]) is not dtype
+
+
+def test_detect_dtypes() -> None:
+    df = pd.DataFrame(
+        {
+            "num": np.random.rand(1000),
+            "lowcard": np.random.randint(0, 5, 1000),
+            "country": ["Canada", "China"] * 500,
+            "str": ["a", "b", "c", "d"] * 250,
+            "date": pd.date_range("2020-01-01", periods=1000),
+        }
+    )
+    ddf = dd.from_pandas(df, npartitions=20)
+
+    clear_dtype_cache()
+    dtypes = detect_dtypes(ddf)
+    assert list(dtypes) == list(ddf.columns)
+    clear_dtype_cache()
+    for col in ddf.columns:
+        assert type(dtypes[col]) is type(detect_dtype(ddf[col]))
+
+    dtypes = detect_dtypes(ddf, {"num": "nominal"})
+    assert isinstance(dtypes["num"], Nominal)
+    assert isinstance(dtypes["lowcard"], Nominal)
+    assert isinstance(dtypes["country"], GeoGraphy)
+    assert isinstance(dtypes["date"], DateTime)
+
+
+def test_geo_probe() -> None:
+    # the probe draws from partitions 0, 3, 6 and 9, only the last one holds countries
+    values = ["foo"] * 900 + ["Canada", "France", "Japan", "Chile", "Peru"] * 20
+    df = dd.from_pandas(pd.DataFrame({"a": values}), npartitions=10)
+
+    probe = geo_probe(df["a"])
+    assert probe.npartitions == 4
+    assert len(probe.compute()) == 100
+    assert not is_geography(df["a"])
+
+    df = dd.from_pandas(pd.DataFrame({"a": values[-100:] * 10}), npartitions=10)
+    assert is_geography(df["a"])
+    assert isinstance(detect_dtypes(df)["a"], GeoGraphy)
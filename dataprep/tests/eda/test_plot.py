@@ -2,14 +2,27 @@
     module for testing plot(df, x, y) function.
 """
 import logging
+from itertools import combinations
+from pathlib import Path
+from typing import cast
 
+import dask.array as da
 import dask.dataframe as dd
 import numpy as np
 import pandas as pd
 import pytest
+from scipy.stats import ks_2samp
 from ...datasets import load_dataset
 
-from ...eda import plot
+from ...eda import Profile, compute, compute_profile, plot
+from ...eda.distribution.compute.common import (
+    cont_histograms,
+    ks_pairs,
+    memory_usage,
+    nrows_distinct,
+)
+from ...eda.distribution.compute.profile import cont_profile, nom_profile, nom_value_counts
+from ...eda.distribution.compute.sketch import ContProfile, NomProfile
 from ...eda.dtypes import Nominal
 from ...eda.utils import to_dask
 from .random_data_generator import random_df
@@ -96,3 +109,209 @@ def test_geo(geodf: dd.DataFrame) -> None:
 
 def test_random_df(random_df: pd.DataFrame) -> None:
     plot(random_df)
+
+
+def test_cont_profile() -> None:
+    arr = np.concatenate([np.random.lognormal(size=10000), [np.nan] * 10, [np.inf]])
+    np.random.shuffle(arr)
+    for npartitions in (1, 7):
+        srs = dd.from_pandas(pd.Series(arr), npartitions=npartitions)
+        prof = cont_profile(srs, [0.25, 0.5, 0.75], [50]).compute()
+        fin = arr[np.isfinite(arr)]
+
+        assert (prof["nrows"], prof["npres"], prof["nreals"]) == (10011, 10001, 10000)
+        assert np.isclose(prof["mean"], fin.mean())
+        assert np.isclose(prof["std"], fin.std(ddof=1))
+        assert np.isclose(prof["skew"], pd.Series(fin).skew(), rtol=1e-3)
+        assert np.isclose(prof["kurt"], pd.Series(fin).kurt(), rtol=1e-2)
+        qntls = srs[np.isfinite(srs)].quantile([0.25, 0.5, 0.75]).compute()
+        assert np.allclose(prof["qntls"], qntls)
+
+        counts, edges = np.histogram(fin, 50)
+        assert (prof["hist"][50][1] == edges).all() and prof["hist"][50][0].sum() == 10000
+        if npartitions == 1:
+            assert (prof["hist"][50][0] == counts).all()
+        else:
+            # only the values in the grid cells crossed by the bin edges are estimated
+            assert np.abs(prof["hist"][50][0] - counts).max() <= 20
+
+
+def test_cont_profile_hist() -> None:
+    # the grid cells hold single integers, so the merged histograms are exact
+    arr = np.random.randint(0, 1000, 100000)
+    for srs in (
+        pd.Series(arr),
+        pd.Series(arr.astype(float)),
+        pd.Series([2.5] * 10),
+        pd.Series([np.nan] * 10),
+    ):
+        prof = cont_profile(dd.from_pandas(srs, npartitions=8), bins=[10, 50]).compute()
+        fin = srs[np.isfinite(srs)].to_numpy()
+        for nbins in (10, 50):
+            counts, edges = np.histogram(fin, nbins, (fin.min(), fin.max()) if fin.size else None)
+            assert (prof["hist"][nbins][0] == counts).all()
+            assert (prof["hist"][nbins][1] == edges).all()
+
+
+def test_cont_histograms() -> None:
+    arr = np.random.randn(10001, 4) * [1, 100, 1e-9, 1]
+    arr[::7, 0] = np.nan
+    arr[3, 1] = np.inf
+    arr[:, 3] = 2.5
+    counts, edges = cont_histograms(da.from_array(arr, chunks=(1000, 4)), 50)
+    counts, edges = counts.compute(), edges.compute()
+
+    assert counts.shape == (4, 50) and edges.shape == (4, 51)
+    for i in range(4):
+        col = arr[:, i][np.isfinite(arr[:, i])]
+        expected = np.histogram(col, 50, (col.min(), col.max()))
+        assert (counts[i] == expected[0]).all()
+        assert (edges[i] == expected[1]).all()
+
+
+def test_nom_profile() -> None:
+    df = pd.DataFrame(
+        {
+            "a": np.random.choice(["x", "yy", "zzz", None], 1000),
+            "b": np.random.choice(["one", "three"], 1000),
+        }
+    )
+    profs = nom_profile(dd.from_pandas(df, npartitions=5), 10)
+    for col in df.columns:
+        prof = profs[col].compute()
+        srs = df[col].dropna()
+        lens = srs.str.len()
+
+        assert (prof["nrows"], prof["npres"]) == (1000, srs.shape[0])
+        assert prof["value_counts"].sort_index().equals(srs.value_counts().sort_index())
+        vcs = nom_value_counts(profs[col], col).compute()
+        assert vcs.name == col and vcs.sum() == srs.shape[0]
+        assert prof["len_stats"]["Minimum"] == lens.min()
+        assert prof["len_stats"]["Maximum"] == lens.max()
+        assert np.isclose(prof["len_stats"]["Mean"], lens.mean())
+        assert prof["len_stats"]["Median"] == lens.median()
+        assert prof["len_hist"][0].sum() == srs.shape[0]
+
+
+def test_profile(tmp_path: Path) -> None:
+    df = pd.DataFrame(
+        {
+            "a": np.random.lognormal(size=10000),
+            "b": np.random.choice(["x", "yy", "zzz"], 10000),
+            "c": pd.date_range("2020-01-01", periods=10000, freq="H"),
+        }
+    )
+    df.loc[::10, "a"] = np.nan
+    df.loc[::7, "b"] = None
+    prof = compute_profile(dd.from_pandas(df, npartitions=4))
+    merged = compute_profile(df.iloc[6000:], profile=compute_profile(df.iloc[:6000]))
+
+    for res in (prof, merged):
+        assert res.nrows == 10000
+        assert res.dtypes == {"a": "Continuous", "b": "Nominal", "c": "DateTime"}
+        cont, nom = cast(ContProfile, res.columns["a"]), cast(NomProfile, res.columns["b"])
+        assert cont.npres == df["a"].count()
+        assert np.isclose(cont.mean, df["a"].mean())
+        assert np.isclose(cont.std, df["a"].std())
+        qntls = cont.digest.quantile(np.array([0.1, 0.5, 0.9]))
+        assert np.allclose(qntls, df["a"].quantile([0.1, 0.5, 0.9]), rtol=0.01)
+        counts = nom.topk.counts
+        assert counts.sort_index().equals(df["b"].value_counts().sort_index().rename(None))
+        assert nom.nuniq == 3
+        assert np.isclose(res.rows.count(), 10000, rtol=0.01)
+
+    prof.save(str(tmp_path / "profile.pkl"))
+    loaded = Profile.load(str(tmp_path / "profile.pkl"))
+    assert loaded.dtypes == prof.dtypes
+    digests = [cast(ContProfile, res.columns["a"]).digest for res in (loaded, prof)]
+    assert np.allclose(digests[0].means, digests[1].means)
+    plot(loaded)
+
+
+def test_tdigest_quantiles() -> None:
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame(
+        {
+            "a": rng.lognormal(size=20000),
+            "b": rng.randn(20000),
+            "c": rng.choice(["x", "y", "z"], 20000),
+        }
+    )
+    ddf = dd.from_pandas(df, npartitions=5)
+    cfg = {"quantile.method": "tdigest", "quantile.compression": 200}
+
+    data = compute(ddf, "a", cfg=cfg)["data"]
+    qrtls = [data["qrtl1"], data["qrtl2"], data["qrtl3"]]
+    assert np.allclose(qrtls, df["a"].quantile([0.25, 0.5, 0.75]), rtol=0.01)
+    # the error of a t-digest is bounded in the ranks of the values: the centroid
+    # around the quantile q holds at most 4 * pi * sqrt(q * (1 - q)) / compression
+    # of the values, and an estimate is off by at most half of the centroid
+    qntls = np.linspace(0.01, 0.99, 99)
+    ranks = np.searchsorted(np.sort(df["a"].values), data["qntls"].values) / df.shape[0]
+    assert (np.abs(ranks - qntls) <= 2 * np.pi * np.sqrt(qntls * (1 - qntls)) / 200).all()
+    assert data["lw"] == df["a"].min()
+
+    box = compute(ddf, "c", "b", cfg=cfg)["data"]["box"]
+    for grp, srs in df.groupby("c")["b"]:
+        qrtls = [box[(grp, "q1")], box[(grp, "q2")], box[(grp, "q3")]]
+        assert np.allclose(qrtls, srs.quantile([0.25, 0.5, 0.75]), atol=0.02)
+
+    for x, y in (("a", None), ("a", "b"), ("c", "b")):
+        plot(ddf, x, y, config=cfg)
+    for x, y in (("a", None), ("a", "b"), ("c", "b")):
+        with pytest.raises(ValueError):
+            compute(ddf, x, y, cfg={"quantile.method": "t-digest"})
+
+
+def test_nrows_distinct() -> None:
+    df = pd.DataFrame(
+        {
+            "a": np.random.randint(0, 50, 20000),
+            "b": np.random.choice(["x", "y", None], 20000),
+            "c": np.random.choice([0.5, np.nan], 20000),
+        }
+    )
+    ddf = dd.from_pandas(df, npartitions=7)
+    nrows = df.drop_duplicates().shape[0]
+    assert nrows_distinct(ddf).compute() == nrows
+    assert abs(nrows_distinct(ddf, "approx").compute() - nrows) <= 0.05 * nrows
+
+    stats = compute(ddf, cfg={"stats.duplicates": "approx"})["stats"]
+    assert abs(stats["nrows_wo_dups"] - nrows) <= 0.05 * nrows
+
+
+def test_memory_usage() -> None:
+    words = np.array(["a", "bb" * 10, "ccc" * 100, None], dtype=object)
+    df = pd.DataFrame(
+        {
+            "a": np.random.randn(20000),
+            "b": np.random.choice(words, 20000),
+            "c": pd.Categorical(np.random.choice(["x", "y"], 20000)),
+        },
+        index=np.random.choice(words[:3], 20000),
+    )
+    ddf = dd.from_pandas(df, npartitions=4)
+    exact = df.memory_usage(deep=True).sum()
+    usage, err = memory_usage(ddf, "exact").compute()
+    # the hash table of an index is counted by pandas once it is built
+    assert err == 0 and np.isclose(usage, exact, rtol=1e-3)
+    usage, err = memory_usage(ddf, sample=500).compute()
+    assert 0 < err < 0.1 * exact
+    assert abs(usage - exact) < 3 * err
+
+    prof = nom_profile(ddf[["b"]])["b"].compute()
+    assert prof["mem_use"] == df["b"].dropna().memory_usage(deep=True)
+
+
+def test_ks_pairs() -> None:
+    df = pd.DataFrame({i: np.random.normal(i % 3 / 10, 1, 500).round(i % 2 + 1) for i in range(8)})
+    df.iloc[::5, 2] = np.nan
+    tests = ks_pairs(df)
+    assert [test[:2] for test in tests] == list(combinations(df.columns, 2))
+    for col1, col2, pval in tests:
+        assert np.isclose(pval, ks_2samp(df[col1].dropna(), df[col2].dropna())[1], atol=0.02)
+
+    pvals = {test[:2]: test[2] for test in tests}
+    capped = ks_pairs(df, max_pairs=5, block=100)
+    assert len(capped) == 5
+    assert all(np.isclose(pvals[test[:2]], test[2]) for test in capped)
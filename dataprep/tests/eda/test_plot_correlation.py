@@ -4,21 +4,27 @@
 from dataprep.eda.data_array import DataArray
 import random
 from time import time
+from typing import Any, Callable, List, Tuple
 
 import dask.array as da
 import dask.dataframe as dd
 import numpy as np
 import pandas as pd
 import pytest
+from bokeh.models import HoverTool
 
 from ...eda.correlation import compute_correlation, plot_correlation
+from ...eda.correlation.render import render_correlation
 from ...eda.correlation.compute.univariate import (
     _kendall_tau_1xn,
     _pearson_1xn,
     _spearman_1xn,
     _corr_filter,
 )
+from ...eda.correlation.compute.common import CorrelationMethod, corr_topk
 from ...eda.correlation.compute.overview import (
+    _calc_overview,
+    _calc_overview_wide,
     _spearman_nxn,
     _pearson_nxn,
     _kendall_tau_nxn,
@@ -160,6 +166,23 @@ def test_compute_pearson(simpledf: dd.DataFrame) -> None:
         assert np.isclose(_corr_filter(corr_eda)[1], np.sort(corr_pd[:, i])).all()
 
 
+def test_compute_pearson_nan() -> None:
+    df = pd.DataFrame(np.random.rand(1000, 4) * [1, 1e3, 1, 1] + [0, 1e6, 0, 0])
+    df[4] = df[0] * 2 + np.random.rand(1000) / 10
+    df = df.mask(np.random.rand(*df.shape) < 0.2)
+    df[5] = 1.0
+    corr_eda = _pearson_nxn(DataArray(to_dask(df))).compute()
+    corr_pd = df.corr("pearson").values
+    assert np.allclose(corr_eda, corr_pd, equal_nan=True)
+
+    darray = da.from_array(df.values, chunks=(300, -1))
+    for i in range(df.shape[1]):
+        corr_eda = _pearson_1xn(darray[:, i : i + 1], darray).compute()
+        assert np.allclose(
+            corr_eda[np.arange(6) != i], corr_pd[i, np.arange(6) != i], equal_nan=True
+        )
+
+
 def test_compute_spearman(simpledf: dd.DataFrame) -> None:
     df = DataArray(simpledf)
     df = df.select_num_columns()
@@ -176,6 +199,29 @@ def test_compute_spearman(simpledf: dd.DataFrame) -> None:
         assert np.isclose(_corr_filter(corr_eda)[1], np.sort(corr_pd[:, i])).all()
 
 
+def test_compute_spearman_ties() -> None:
+    df = pd.DataFrame(np.random.randint(0, 5, (1000, 3)), columns=["a", "b", "c"])
+    df["d"] = np.exp(df["a"] + np.random.rand(1000))
+    df = DataArray(to_dask(df))
+    corr_pd = df.frame.compute().corr("spearman").values
+    assert np.allclose(_spearman_nxn(df).compute(), corr_pd)
+    assert np.allclose(_spearman_nxn(df, "approx").compute(), corr_pd, atol=0.01)
+
+
+def test_compute_spearman_nulls() -> None:
+    df = pd.DataFrame(np.random.randint(0, 20, (1000, 4)), columns=["a", "b", "c", "d"])
+    df["d"] = df["a"] + np.random.rand(1000)
+    df = df.mask(np.random.rand(*df.shape) < 0.3)
+    corr_pd = df.corr("spearman").values
+    darr = DataArray(to_dask(df))
+    darr.compute()
+    assert np.allclose(_spearman_nxn(darr).compute(), corr_pd)
+    darray = darr.values
+    for i in range(4):
+        corr_eda = _spearman_1xn(darray[:, i : i + 1], darray).compute()
+        assert np.allclose(np.sort(corr_eda), np.sort(corr_pd[:, i]))
+
+
 def test_compute_kendall(simpledf: dd.DataFrame) -> None:
     df = DataArray(simpledf)
     df = df.select_num_columns()
@@ -188,10 +234,67 @@ def test_compute_kendall(simpledf: dd.DataFrame) -> None:
     assert np.isclose(corr_eda, corr_pd).all()
 
     for i in range(array.shape[1]):
-        corr_eda = _kendall_tau_1xn(darray[:, i : i + 1], darray).compute()
+        corr_eda = _kendall_tau_1xn(darray[:, i : i + 1], darray).compute()["corr"]
         assert np.isclose(_corr_filter(corr_eda)[1], np.sort(corr_pd[:, i])).all()
 
 
+def test_compute_kendall_sample() -> None:
+    df = pd.DataFrame(np.random.rand(2000, 3), columns=["a", "b", "c"])
+    df["d"] = df["a"] + np.random.rand(2000)
+    df = df.mask(np.random.rand(*df.shape) < 0.1)
+    corr_pd = df.corr("kendall").values
+    assert np.allclose(_kendall_tau_nxn(DataArray(to_dask(df))).compute(), corr_pd)
+    # the sample is the same in every computation
+    sampled = _kendall_tau_nxn(DataArray(to_dask(df)), 1000)
+    assert np.array_equal(sampled.compute(), sampled.compute(), equal_nan=True)
+
+    cfg = Config.from_dict(config={"kendall.sample": 1000})
+    ndf = compute_correlation(to_dask(df), cfg=cfg)["data"]["KendallTau"]
+    assert (ndf["lower"] < ndf["correlation"]).all() and (ndf["correlation"] < ndf["upper"]).all()
+    row = ndf[(ndf["x"] == "a") & (ndf["y"] == "d")].iloc[0]
+    assert row["lower"] - 0.05 < corr_pd[0, 3] < row["upper"] + 0.05
+    fig = render_correlation(compute_correlation(to_dask(df), cfg=cfg), cfg)["layout"][-1]
+    assert ("lower", "@lower{1.11}") in fig.select_one(HoverTool).tooltips
+
+    itmdt = compute_correlation(to_dask(df), "d", cfg=cfg)
+    ndf = itmdt["data"]["KendallTau"].set_index("y")
+    assert (ndf["lower"] < ndf["correlation"]).all() and (ndf["correlation"] < ndf["upper"]).all()
+    assert ndf.loc["a", "lower"] - 0.05 < corr_pd[0, 3] < ndf.loc["a", "upper"] + 0.05
+    fig = render_correlation(itmdt, cfg)["layout"][-1]
+    assert ("upper", "@upper{1.11}") in fig.select_one(HoverTool).tooltips
+
+
+def test_corr_topk() -> None:
+    df = pd.DataFrame(np.random.rand(300, 11), columns=list("abcdefghijk"))
+    df["l"] = df["a"] - df["d"]
+    df = df.mask(np.random.rand(*df.shape) < 0.05)
+    ddf = to_dask(df)
+    methods: List[Tuple[CorrelationMethod, Callable[[DataArray], Any]]] = [
+        (CorrelationMethod.Pearson, _pearson_nxn),
+        (CorrelationMethod.Spearman, _spearman_nxn),
+        (CorrelationMethod.KendallTau, _kendall_tau_nxn),
+    ]
+    for method, nxn in methods:
+        state = corr_topk(ddf, method, 5, block=4).compute()
+        corr = nxn(DataArray(ddf)).compute()
+        lhs, rhs = np.triu_indices(12, 1)
+        vals = corr[lhs, rhs]
+        assert np.allclose([r for r, _, _ in state["pos"]], -np.sort(-vals)[:5])
+        assert np.allclose([r for r, _, _ in state["neg"]], np.sort(vals)[:5])
+        assert np.allclose([abs(r) for r, _, _ in state["least"]], np.sort(abs(vals))[:5])
+        assert state["pos"][0][1:] == (0, 11) and state["neg"][0][1:] == (3, 11)
+        assert np.isclose(state["sum"], vals.sum()) and state["count"] == vals.size
+
+    cfg = Config()
+    itmdt, wide = _calc_overview(ddf, cfg), _calc_overview_wide(DataArray(ddf), cfg, k=3)
+    assert wide["tabledata"] == itmdt["tabledata"]
+    assert wide["insights"] == itmdt["insights"]
+    for name, ndf in itmdt["data"].items():
+        expected = ndf.loc[ndf["correlation"].abs().nlargest(3).index]
+        assert wide["data"][name]["correlation"].tolist() == expected["correlation"].tolist()
+        assert wide["data"][name]["x"].tolist() == expected["x"].tolist()
+
+
 # def test_plot_corr_df() -> None:  # pylint: disable=too-many-locals
 #     """
 #     :return:
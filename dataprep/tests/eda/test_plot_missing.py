@@ -1,13 +1,24 @@
 """
     This module for testing plot_missing(df, x, y) function.
 """
+import dask
 import dask.dataframe as dd
 import numpy as np
 import pandas as pd
 import pytest
+from scipy.cluster import hierarchy
 
+from ...eda.data_array import DataArray
 from ...eda.dtypes import Numerical
+from ...eda.missing.compute.nullivariate import (
+    missing_col_counts,
+    missing_dendrogram,
+    missing_heatmap,
+    missing_row_counts,
+    missing_spectrum,
+)
 from ...eda.missing import compute_missing, render_missing, plot_missing
+from ...eda.missing.compute.common import LABELS
 from ...eda.utils import to_dask
 from ...eda.configs import Config
 from .random_data_generator import random_df
@@ -107,6 +118,65 @@ def test_sanity_compute_7() -> None:
     render_missing(itmdt, cfg)
 
 
+def test_packed_nulls() -> None:
+    df = pd.DataFrame(np.random.rand(1001, 5), columns=list("abcde"))
+    df = df.mask(np.random.rand(*df.shape) < 0.3)
+    for compute in ["lengths", "nulls"]:
+        darr = DataArray(dd.from_pandas(df, npartitions=3))
+        darr.compute(compute)
+        assert darr.packed_nulls.nbytes < df.shape[0] * df.shape[1] / 4
+        assert (darr.nulls.compute() == df.isnull().values).all()
+        assert (missing_col_counts(darr).compute() == df.isnull().sum().values).all()
+        assert (missing_row_counts(darr).compute() == df.isnull().sum(axis=1).values).all()
+        assert (darr[["b", "d"]].nulls.compute() == df[["b", "d"]].isnull().values).all()
+
+
+def test_nullity_gram() -> None:
+    df = pd.DataFrame(np.random.rand(3000, 6), columns=list("abcdef"))
+    df = df.mask(np.random.rand(*df.shape) < [0.1, 0.2, 0.3, 0.3, 0.5, 0.0])
+    df["b"] = df["b"].mask(df["a"].isnull())
+    darr = DataArray(dd.from_pandas(df, npartitions=4))
+    darr.compute()
+    nulls = df.isnull().values
+    heatmap, dendrogram = dask.compute(missing_heatmap(darr), missing_dendrogram(darr))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = np.corrcoef(nulls, rowvar=False)
+    assert np.allclose(heatmap, corr, equal_nan=True)
+    expected = hierarchy.dendrogram(
+        hierarchy.linkage(nulls.T, "average"), labels=darr.columns, no_plot=True
+    )
+    assert sorted(dendrogram["ivl"]) == sorted(expected["ivl"])
+    assert np.allclose(sorted(map(max, dendrogram["dcoord"])), sorted(map(max, expected["dcoord"])))
+
+
+def test_missing_spectrum() -> None:
+    df = pd.DataFrame(np.random.rand(1003, 3), columns=list("abc"))
+    df = df.mask(np.random.rand(*df.shape) < np.linspace(0, 1, 1003)[:, None])
+    darr = DataArray(dd.from_pandas(df, npartitions=7))
+    darr.compute()
+    for bins in [1, 7, 20, 5000]:
+        spectrum = pd.DataFrame(dask.compute(missing_spectrum(darr, bins))[0])
+        assert spectrum["loc_start"].min() == 0 and spectrum["loc_end"].max() == 1003
+        for row in spectrum.itertuples():
+            rate = df[row.column].iloc[row.loc_start : row.loc_end].isnull().mean()
+            assert np.isclose(row.missing_rate, rate)
+
+
+def test_impact_histograms(simpledf: dd.DataFrame) -> None:
+    itmdt = compute_missing(simpledf, "a")
+    df = simpledf.compute()
+    kept = df[df["a"].notna()]
+    hist = itmdt["data"]["b"]
+    before, after = (hist[hist["label"] == label] for label in LABELS)
+    assert before["count"].sum() == df["b"].notna().sum()
+    assert after["count"].sum() == kept["b"].notna().sum()
+    assert (before["lower_bound"].values == after["lower_bound"].values).all()
+    assert np.isclose(before["lower_bound"].min(), df["b"].min())
+    bars = itmdt["data"]["d"].set_index(["label", "x"])["count"]
+    assert (bars[LABELS[0]].sort_index() == df["d"].value_counts().sort_index()).all()
+    assert (bars[LABELS[1]].sort_index() == kept["d"].value_counts().sort_index()).all()
+
+
 def test_no_missing() -> None:
     from sys import platform
 